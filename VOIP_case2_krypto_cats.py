@@ -1,2388 +1,3108 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 from PIL import Image, ImageTk
+from content_store import ContentStore
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import argparse
+import bisect
+import functools
+import heapq
+import json
 import os
 import math
+import queue
+import threading
+import time
 
-class VoIPSecurityGuide:
-    def __init__(self, root):
+
+class StartupProfiler:
+    """Замер времени и количества созданных виджетов по фазам запуска"""
+    
+    def __init__(self, root=None):
         self.root = root
-        self.root.title("🔒 Справочник по безопасности VoIP - Кейс 'Искра Технологии'")
-        
-        # Автоматическое полноэкранное отображение
-        self.root.attributes('-fullscreen', True)
-        self.root.configure(bg='#2c3e50')
-        
-        # Добавляем кнопку выхода из полноэкранного режима (опционально)
-        self.root.bind("<F11>", self.toggle_fullscreen)
-        self.root.bind("<Escape>", self.exit_fullscreen)
-        
-        # Переменные для масштабирования
-        self.scale_factor = 1.0
-        self.min_scale = 0.5
-        self.max_scale = 3.0
-        self.last_scale = 1.0
-        self.canvas_width = 0
-        self.canvas_height = 0
-        
-        # Переменные для анимации угроз
-        self.current_threat = None
-        self.animation_items = []
-        self.protection_active = False
-        
-        # Создаем отдельные словари для каждой вкладки
-        self.expanded_measures_cards = {}
-        self.expanded_technical_cards = {}
-        self.expanded_requirements_cards = {}
-        self.expanded_threats_cards = {}
-        
-        # Стили
-        self.setup_styles()
+        self.origin = time.perf_counter()
+        self.phases = []
+        self.marks = {}
+        self.depth = 0
+        
+    def elapsed_ms(self):
+        """Время с момента создания профилировщика, мс"""
+        return (time.perf_counter() - self.origin) * 1000
+        
+    def count_widgets(self):
+        """Подсчет всех виджетов окна (по словарям children, без запросов к Tcl)"""
+        if self.root is None:
+            return 0
+        count = 0
+        stack = [self.root]
+        while stack:
+            widget = stack.pop()
+            count += 1
+            stack.extend(widget.children.values())
+        return count
+        
+    @contextmanager
+    def phase(self, name):
+        """Замер одной фазы; вложенные фазы учитываются с отступом"""
+        record = {"name": name, "depth": self.depth, "start_ms": round(self.elapsed_ms(), 3)}
+        self.phases.append(record)
+        widgets_before = self.count_widgets()
+        start = time.perf_counter()
+        self.depth += 1
+        try:
+            yield record
+        finally:
+            self.depth -= 1
+            record["duration_ms"] = round((time.perf_counter() - start) * 1000, 3)
+            record["widgets"] = self.count_widgets() - widgets_before
+            
+    def mark(self, name):
+        """Отметка момента запуска (учитывается только первая)"""
+        self.marks.setdefault(name, round(self.elapsed_ms(), 3))
+        
+    def report(self):
+        """Отчет в виде словаря для сериализации в JSON"""
+        return {
+            "phases": self.phases,
+            "marks": self.marks,
+            "widgets_total": self.count_widgets()
+        }
         
-        # Переменные для изображения
-        self.scheme_image = None
+    def format_table(self):
+        """Текстовая таблица фаз для отображения в приложении"""
+        lines = [f"{'Фаза':<36}{'мс':>10}{'виджеты':>10}"]
+        for record in self.phases:
+            name = "  " * record["depth"] + record["name"]
+            duration = record.get("duration_ms")
+            duration_text = f"{duration:.1f}" if duration is not None else "..."
+            lines.append(f"{name:<36}{duration_text:>10}{record.get('widgets', 0):>10}")
+        for name, value in self.marks.items():
+            lines.append(f"@ {name:<34}{value:>10.1f}")
+        lines.append(f"Всего виджетов: {self.count_widgets()}")
+        return "\n".join(lines)
+
+
+class ScaledImage:
+    """Масштабированная версия изображения и ее PhotoImage для канваса"""
+    
+    def __init__(self, image):
+        self.image = image
         self.photo = None
-        self.original_image = None
-        
-        # Создаем основной фрейм
-        self.main_frame = ttk.Frame(root, style='Dark.TFrame')
-        self.main_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
-        
-        self.create_widgets()
-        self.load_scheme_image()
-        
-    def toggle_fullscreen(self, event=None):
-        """Переключение полноэкранного режима по F11"""
-        self.root.attributes('-fullscreen', not self.root.attributes('-fullscreen'))
-        
-    def exit_fullscreen(self, event=None):
-        """Выход из полноэкранного режима по Escape"""
-        self.root.attributes('-fullscreen', False)
-        
-    def setup_styles(self):
-        """Настройка стилей для красивого интерфейса"""
-        style = ttk.Style()
-        style.theme_use('clam')
-        
-        # Цветовая схема
-        colors = {
-            'primary': '#3498db',
-            'secondary': '#2ecc71', 
-            'accent': '#e74c3c',
-            'dark_bg': '#2c3e50',
-            'darker_bg': '#34495e',
-            'light_bg': '#ecf0f1',
-            'text_light': '#ffffff',
-            'text_dark': '#2c3e50'
+        width, height = image.size
+        # Пиксели PIL-изображения плюс 4 байта на пиксель у Tk-изображения
+        self.nbytes = width * height * (len(image.getbands()) + 4)
+
+
+class ScaledImageCache:
+    """Кэш масштабированных версий изображения: mip-пирамида и LRU с бюджетом памяти"""
+    
+    def __init__(self, image, budget_bytes=64 * 1024 * 1024):
+        self.levels = [image]
+        self.entries = OrderedDict()
+        self.lock = threading.RLock()
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.last_resample = None
+        
+    def level_for(self, size):
+        """Наименьший уровень пирамиды, не меньший целевого размера"""
+        target_width, target_height = size
+        while True:
+            # Список уровней не изменяется, а заменяется - чтение ссылки атомарно
+            levels = self.levels
+            width, height = levels[-1].size
+            if width // 2 < max(target_width, 1) or height // 2 < max(target_height, 1):
+                break
+            # Уровни строятся по требованию, каждый вдвое меньше предыдущего;
+            # уменьшение идет вне блокировки, под ней только публикуется
+            reduced = levels[-1].reduce(2)
+            with self.lock:
+                if self.levels is levels:
+                    self.levels = levels + [reduced]
+        for level in reversed(levels):
+            if level.size[0] >= target_width and level.size[1] >= target_height:
+                return level
+        return levels[0]
+            
+    def peek(self, size, resample):
+        """Готовая версия из кэша или None (без ресемплинга)"""
+        size = tuple(size)
+        keys = [(size, resample)]
+        if resample != Image.Resampling.LANCZOS:
+            # Готовая качественная версия лучше быстрого предпросмотра
+            keys.insert(0, (size, Image.Resampling.LANCZOS))
+        with self.lock:
+            for key in keys:
+                entry = self.entries.get(key)
+                if entry is not None:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return entry
+        return None
+        
+    def get(self, size, resample):
+        """Версия изображения заданного размера (resample=None - без ресемплинга)"""
+        size = tuple(size)
+        entry = self.peek(size, resample)
+        if entry is not None:
+            return entry
+        
+        # Ресемплинг выполняется вне блокировки (может идти в фоновом потоке)
+        source = self.level_for(size)
+        if source.size == size or resample is None:
+            image = source
+        else:
+            started = time.perf_counter()
+            image = source.resize(size, resample)
+            finished = time.perf_counter()
+            self.last_resample = (finished, (finished - started) * 1000, size, resample)
+        entry = ScaledImage(image)
+        with self.lock:
+            self.misses += 1
+            existing = self.entries.get((size, resample))
+            if existing is not None:
+                # Тот же размер успел построить параллельный промах - остается его версия
+                self.entries.move_to_end((size, resample))
+                return existing
+            self.entries[(size, resample)] = entry
+            self.used_bytes += entry.nbytes
+            self.evict()
+        return entry
+        
+    def rebase(self, image):
+        """Новое исходное изображение (например, декодированное в большем размере)"""
+        with self.lock:
+            self.levels = [image]
+            
+    def level_bytes(self):
+        """Память уровней пирамиды (без исходного изображения)"""
+        with self.lock:
+            return sum(level.size[0] * level.size[1] * len(level.getbands())
+                       for level in self.levels[1:])
+        
+    def evict(self):
+        """Вытеснение давно использованных версий сверх бюджета (последняя остается)"""
+        while self.used_bytes > self.budget_bytes and len(self.entries) > 1:
+            _, entry = self.entries.popitem(last=False)
+            self.used_bytes -= entry.nbytes
+            
+    def stats(self):
+        return {
+            "entries": len(self.entries),
+            "levels": len(self.levels),
+            "used_bytes": self.used_bytes,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses
         }
-        
-        # Настройка стилей
-        style.configure('Dark.TFrame', background=colors['dark_bg'])
-        style.configure('Light.TFrame', background=colors['light_bg'])
-        
-        style.configure('Title.TLabel', 
-                       background=colors['dark_bg'],
-                       foreground=colors['text_light'],
-                       font=('Arial', 28, 'bold'))
-        
-        style.configure('Card.TLabelframe',
-                       background=colors['darker_bg'],
-                       foreground=colors['text_light'],
-                       font=('Arial', 16, 'bold'))
-        
-        style.configure('Threat.TButton',
-                       background='#e74c3c',
-                       foreground='white',
-                       font=('Arial', 14, 'bold'),
-                       padding=(14, 8))
-        
-        style.configure('Protection.TButton',
-                       background='#2ecc71', 
-                       foreground='white',
-                       font=('Arial', 14, 'bold'),
-                       padding=(14, 8))
-        
-        style.map('Threat.TButton',
-                 background=[('active', '#c0392b'),
-                           ('pressed', '#a93226')])
-        
-        style.map('Protection.TButton',
-                 background=[('active', '#27ae60'),
-                           ('pressed', '#229954')])
-        
-        style.configure('Custom.TNotebook', background='#34495e')
-        style.configure('Custom.TNotebook.Tab',
-                       background='#34495e',
-                       foreground='#bdc3c7',
-                       padding=(22, 14),
-                       font=('Arial', 16))
-        style.map('Custom.TNotebook.Tab',
-                 background=[('selected', '#3498db'),
-                           ('active', '#2980b9')],
-                 foreground=[('selected', 'white'),
-                           ('active', 'white')])
-        
-    def create_widgets(self):
-        # Заголовок
-        self.create_header()
-        
-        # Создаем Notebook
-        self.create_notebook()
-        
-        # Футер с подсказками управления
-        self.create_footer()
-        
-    def create_header(self):
-        """Создание заголовка"""
-        header_frame = ttk.Frame(self.main_frame, style='Dark.TFrame')
-        header_frame.pack(fill=tk.X, pady=(0, 25))
-        
-        title_label = tk.Label(header_frame,
-                             text="🔒 Справочник по безопасности VoIP",
-                             font=('Arial', 28, 'bold'),
-                             bg='#2c3e50',
-                             fg='#3498db',
-                             pady=30)
-        title_label.pack()
-        
-        subtitle_label = tk.Label(header_frame,
-                                text="Кейс: АО «Искра Технологии» • Значимый объект КИИ 3-й категории",
-                                font=('Arial', 18),
-                                bg='#2c3e50', 
-                                fg='#ecf0f1')
-        subtitle_label.pack()
-        
-    def create_notebook(self):
-        """Создание Notebook с вкладками"""
-        self.notebook = ttk.Notebook(self.main_frame, style='Custom.TNotebook')
-        self.notebook.pack(fill=tk.BOTH, expand=True)
-        
-        # Создаем вкладки
-        self.create_architecture_tab()
-        self.create_tasks_tab()
-        self.create_threats_tab()
-        self.create_measures_tab()
-        self.create_technical_tab()
-        self.create_requirements_tab()
-        self.create_regulations_tab()
-        
-    def create_scrollable_frame(self, parent):
-        """Создает прокручиваемый фрейм с канвасом и скроллбарами (вертикальными и горизонтальными)"""
-        # Основной фрейм для скроллинга
-        container = ttk.Frame(parent, style='Light.TFrame')
-        
-        # Создаем канвас для скроллинга
-        canvas = tk.Canvas(container, bg='#ecf0f1', highlightthickness=0)
-        
-        # Вертикальный и горизонтальный скроллбары
-        v_scrollbar = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
-        h_scrollbar = ttk.Scrollbar(container, orient="horizontal", command=canvas.xview)
-        
-        # Прокручиваемый фрейм
-        scrollable_frame = ttk.Frame(canvas, style='Light.TFrame')
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-        
-        # Упаковываем элементы
-        h_scrollbar.pack(side="bottom", fill="x")
-        v_scrollbar.pack(side="right", fill="y")
-        canvas.pack(side="left", fill="both", expand=True)
-        
-        # Привязываем колесо мыши к канвасу
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        def _on_shift_mousewheel(event):
-            canvas.xview_scroll(int(-1*(event.delta/120)), "units")
-        
-        canvas.bind("<MouseWheel>", _on_mousewheel)
-        scrollable_frame.bind("<MouseWheel>", _on_mousewheel)
-        
-        # Привязываем Shift+колесо мыши для горизонтальной прокрутки
-        canvas.bind("<Shift-MouseWheel>", _on_shift_mousewheel)
-        scrollable_frame.bind("<Shift-MouseWheel>", _on_shift_mousewheel)
-        
-        return container, scrollable_frame, canvas
 
-    def create_architecture_tab(self):
-        """Вкладка с архитектурой - ИСПРАВЛЕННАЯ ВЕРСИЯ"""
-        self.arch_frame = ttk.Frame(self.notebook, style='Light.TFrame')
-        self.notebook.add(self.arch_frame, text="🏗️ Архитектура сети")
-        
-        # Заголовок
-        arch_title = tk.Label(self.arch_frame,
-                            text="Архитектура VoIP Сети",
-                            font=('Arial', 28, 'bold'),
-                            bg='#ecf0f1',
-                            fg='#2c3e50',
-                            pady=20)
-        arch_title.pack()
-        
-        # Основной контейнер для схемы и панели управления
-        main_content = ttk.Frame(self.arch_frame, style='Light.TFrame')
-        main_content.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
-        
-        # ЛЕВАЯ ПАНЕЛЬ - управление атаками и защитой
-        left_panel = ttk.Frame(main_content, style='Light.TFrame', width=400)
-        left_panel.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 20))
-        left_panel.pack_propagate(False)
-        
-        # ПРАВАЯ ПАНЕЛЬ - схема (занимает всё оставшееся пространство)
-        right_panel = ttk.Frame(main_content, style='Light.TFrame')
-        right_panel.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
-        
-        # === ЛЕВАЯ ПАНЕЛЬ: Управление атаками и защитой ===
-        
-        # Заголовок панели управления
-        control_title = tk.Label(left_panel,
-                               text="🎯 Управление безопасностью",
-                               font=('Arial', 18, 'bold'),
-                               bg='#ecf0f1',
-                               fg='#2c3e50',
-                               pady=15)
-        control_title.pack()
-        
-        # Описание
-        desc_label = tk.Label(left_panel,
-                             text="Выберите угрозу для визуализации, затем активируйте защиту",
-                             font=('Arial', 12),
-                             bg='#ecf0f1',
-                             fg='#7f8c8d',
-                             wraplength=350,
-                             justify=tk.CENTER)
-        desc_label.pack(pady=(0, 20))
-        
-        # Фрейм для кнопок угроз и защиты
-        threats_frame = ttk.Frame(left_panel, style='Light.TFrame')
-        threats_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Кнопки угроз - вертикальное расположение с меньшими отступами
-        self.threats_data = [
-            ("🔄 DDoS атаки", "ddos", "#e74c3c", "Атака на доступность сервисов"),
-            ("🔓 Взлом портала", "hack", "#e67e22", "Взлом веб-интерфейсов управления"),
-            ("📞 Подмена номера", "spoofing", "#f1c40f", "Caller ID спуфинг для vishing-атак"),
-            ("👂 Перехват трафика", "eavesdrop", "#3498db", "Прослушивание голосовых разговоров"),
-            ("🖥️ Атака на виртуализацию", "virtualization", "#9b59b6", "Компрометация гипервизора KVM")
-        ]
-        
-        for threat_text, threat_id, color, tooltip in self.threats_data:
-            btn_frame = ttk.Frame(threats_frame, style='Light.TFrame')
-            btn_frame.pack(fill=tk.X, pady=5, padx=10)  # Уменьшил отступы между кнопками
+
+class ImageWorker:
+    """Пул потоков для декодирования и ресемплинга вне главного потока Tk.
+    
+    Готовые результаты передаются в главный поток через потокобезопасную
+    очередь, которая опрашивается таймером Tk только пока есть задачи.
+    """
+    
+    def __init__(self, root, max_workers=2, poll_interval=16):
+        self.root = root
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix="image-worker")
+        self.results = queue.Queue()
+        self.poll_interval = poll_interval
+        self.poll_job = None
+        self.pending = 0
+        
+    def submit(self, func, callback, *args):
+        """Выполнить func(*args) в фоне, затем callback(result, error) в потоке Tk"""
+        future = self.executor.submit(func, *args)
+        future.add_done_callback(lambda f: self.results.put((callback, f)))
+        self.pending += 1
+        if self.poll_job is None:
+            self.poll_job = self.root.after(self.poll_interval, self.poll)
+        return future
+        
+    def poll(self):
+        """Обработка готовых результатов в главном потоке"""
+        self.poll_job = None
+        while True:
+            try:
+                callback, future = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.pending -= 1
+            if future.cancelled():
+                continue
+            error = future.exception()
+            try:
+                callback(None if error else future.result(), error)
+            except Exception as e:
+                # Ошибка одного обработчика не задерживает остальные готовые результаты
+                self.root.report_callback_exception(type(e), e, e.__traceback__)
+        if self.pending:
+            self.poll_job = self.root.after(self.poll_interval, self.poll)
             
-            btn = tk.Button(btn_frame,
-                          text=threat_text,
-                          font=('Arial', 14, 'bold'),  # Немного уменьшил шрифт
-                          bg=color,
-                          fg='white',
-                          relief='raised',
-                          bd=2,
-                          padx=15,
-                          pady=10,  # Уменьшил вертикальные отступы
-                          command=lambda tid=threat_id: self.show_threat(tid))
-            btn.pack(fill=tk.X)
-            self.create_tooltip(btn, tooltip)
-            self.add_hover_effect(btn, color, self.darken_color(color, 20))
-        
-        # Отступ перед кнопкой защиты
-        ttk.Frame(threats_frame, style='Light.TFrame', height=20).pack()
-        
-        # Кнопка активации защиты
-        protection_btn_frame = ttk.Frame(threats_frame, style='Light.TFrame')
-        protection_btn_frame.pack(fill=tk.X, pady=15, padx=10)
-        
-        self.protection_btn = tk.Button(protection_btn_frame,
-                                      text="🛡️ АКТИВИРОВАТЬ ЗАЩИТУ",
-                                      font=('Arial', 16, 'bold'),  # Немного уменьшил шрифт
-                                      bg='#2ecc71',
-                                      fg='white',
-                                      relief='raised',
-                                      bd=3,
-                                      padx=20,
-                                      pady=12,  # Уменьшил вертикальные отступы
-                                      command=self.activate_protection,
-                                      state='disabled')
-        self.protection_btn.pack(fill=tk.X)
-        self.add_hover_effect(self.protection_btn, '#2ecc71', '#27ae60')
-        
-        # === ПРАВАЯ ПАНЕЛЬ: Схема архитектуры ===
-        
-        scheme_frame = ttk.Frame(right_panel, style='Light.TFrame')
-        scheme_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Canvas для изображения схемы (без масштабирования)
-        self.canvas = tk.Canvas(scheme_frame,
-                              bg='white',
-                              highlightthickness=2,
-                              highlightbackground='#3498db',
-                              relief='sunken')
-        
-        self.canvas.pack(fill=tk.BOTH, expand=True)
-        self.canvas.bind('<Configure>', self.resize_image_fixed)
-        
-        # Загружаем схему
-        self.load_scheme_image()
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
 
-    def resize_image_fixed(self, event=None):
-        """Отображение изображения в фиксированном размере (без масштабирования)"""
-        if not self.original_image:
+
+class TileRenderer:
+    """Тайловая отрисовка увеличенной схемы на канвасе.
+    
+    Ресемплируются и кэшируются только тайлы, попадающие в видимую область
+    при текущем масштабе. Быстрые тайлы предпросмотра строятся сразу,
+    качественные (LANCZOS) - в фоновом пуле и подменяются по готовности.
+    Пока изображение не декодировано в фоне, на месте схемы - заглушка.
+    """
+    
+    def __init__(self, canvas, worker, tile_size=256, budget_bytes=48 * 1024 * 1024):
+        self.canvas = canvas
+        self.worker = worker
+        self.tile_size = tile_size
+        self.tiles = OrderedDict()
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.items = {}
+        self.scale_key = None
+        self.origin = (0, 0)
+        self.last_resample = None
+        # Ключи тайлов, качественная версия которых уже строится в фоне
+        self.in_flight = set()
+        self.decoding = False
+        self.last_request = None
+        
+    def visible_tiles(self, display_size, x, y, canvas_width, canvas_height):
+        """Номера тайлов, пересекающих видимую область канваса"""
+        display_width, display_height = display_size
+        size = self.tile_size
+        left = max(0, -x)
+        top = max(0, -y)
+        right = min(display_width, canvas_width - x)
+        bottom = min(display_height, canvas_height - y)
+        if right <= left or bottom <= top:
+            return []
+        return [(tx, ty)
+                for ty in range(top // size, (bottom - 1) // size + 1)
+                for tx in range(left // size, (right - 1) // size + 1)]
+        
+    def render_tile(self, asset, display_size, tx, ty, resample):
+        """Ресемплинг одного тайла из подходящего уровня пирамиды"""
+        display_width, display_height = display_size
+        size = self.tile_size
+        x0, y0 = tx * size, ty * size
+        x1, y1 = min(x0 + size, display_width), min(y0 + size, display_height)
+        
+        level = asset.scaled.level_for(display_size)
+        fx = level.size[0] / display_width
+        fy = level.size[1] / display_height
+        started = time.perf_counter()
+        tile = level.resize((x1 - x0, y1 - y0), resample,
+                            box=(x0 * fx, y0 * fy, x1 * fx, y1 * fy))
+        finished = time.perf_counter()
+        self.last_resample = (finished, (finished - started) * 1000, tile.size, resample)
+        return tile
+        
+    def cached_tile(self, key, resample):
+        """Тайл из кэша: качественный предпочтительнее предпросмотра"""
+        for quality in (Image.Resampling.LANCZOS, resample):
+            entry = self.tiles.get(key + (quality,))
+            if entry is not None:
+                self.tiles.move_to_end(key + (quality,))
+                return entry
+        return None
+        
+    def store_tile(self, key, resample, image):
+        entry = ScaledImage(image)
+        replaced = self.tiles.pop(key + (resample,), None)
+        if replaced is not None:
+            self.used_bytes -= replaced.nbytes
+        self.tiles[key + (resample,)] = entry
+        self.used_bytes += entry.nbytes
+        while self.used_bytes > self.budget_bytes and len(self.tiles) > 1:
+            _, old = self.tiles.popitem(last=False)
+            self.used_bytes -= old.nbytes
+        return entry
+        
+    def render(self, asset, display_size, x, y, canvas_width, canvas_height,
+               resample, preview_resample):
+        """Отрисовка видимых тайлов; недостающие качественные - в фоне"""
+        self.last_request = (asset, display_size, x, y, canvas_width, canvas_height,
+                             resample, preview_resample)
+        if not asset.covers(None):
+            # Декодирование (и уровни пирамиды) - в фоне, до готовности показывается заглушка
+            self.show_placeholder(display_size, x, y)
+            if not self.decoding:
+                self.decoding = True
+                self.worker.submit(self.prepare, self.on_decoded, asset, display_size)
             return
+        self.canvas.delete("tile_placeholder")
+        
+        scale_key = tuple(display_size)
+        if scale_key != self.scale_key:
+            # Другой масштаб - прежние тайлы больше не подходят
+            self.clear()
+            self.scale_key = scale_key
+        self.origin = (x, y)
             
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
-        
-        if canvas_width <= 1 or canvas_height <= 1:
+        visible = self.visible_tiles(display_size, x, y, canvas_width, canvas_height)
+        missing_quality = []
+        for tx, ty in visible:
+            key = (scale_key, tx, ty)
+            entry = self.cached_tile(key, preview_resample)
+            if entry is None:
+                entry = self.store_tile(key, preview_resample,
+                                        self.render_tile(asset, display_size, tx, ty, preview_resample))
+            if (resample != preview_resample and key + (resample,) not in self.tiles
+                    and key + (resample,) not in self.in_flight):
+                missing_quality.append((tx, ty))
+            self.place_tile(tx, ty, entry, x, y)
+            
+        # Тайлы, ушедшие из видимой области, удаляются с канваса
+        visible_set = set(visible)
+        for tile in [tile for tile in self.items if tile not in visible_set]:
+            self.canvas.delete(self.items.pop(tile))
+        self.canvas.tag_lower("scheme")
+        
+        if missing_quality:
+            # Повторные события сдвига и масштаба не ставят те же тайлы в очередь еще раз
+            jobs = [(scale_key,) + tile + (resample,) for tile in missing_quality]
+            self.in_flight.update(jobs)
+            self.worker.submit(
+                lambda: [(tile, self.render_tile(asset, display_size, *tile, resample))
+                         for tile in missing_quality],
+                lambda result, error: self.on_quality_tiles(jobs, scale_key, resample, result, error))
+            
+    @staticmethod
+    def prepare(asset, display_size):
+        """Декодирование и уровень пирамиды для масштаба (в фоновом потоке)"""
+        asset.decode()
+        return asset.scaled.level_for(display_size)
+        
+    def on_decoded(self, result, error):
+        """Изображение декодировано - отрисовка последнего запрошенного вида"""
+        self.decoding = False
+        if error is None and self.last_request is not None:
+            self.render(*self.last_request)
+            
+    def on_quality_tiles(self, jobs, scale_key, resample, tiles, error):
+        """Подмена тайлов предпросмотра качественными (в текущей позиции вида)"""
+        self.in_flight.difference_update(jobs)
+        if error is not None or scale_key != self.scale_key:
             return
+        for tile, image in tiles:
+            entry = self.store_tile((scale_key,) + tile, resample, image)
+            if tile in self.items:
+                self.place_tile(tile[0], tile[1], entry, *self.origin)
+                
+    def show_placeholder(self, display_size, x, y):
+        """Серый прямоугольник на месте схемы до окончания декодирования"""
+        self.canvas.delete("tile_placeholder")
+        self.canvas.create_rectangle(x, y, x + display_size[0], y + display_size[1],
+                                     fill='#dfe6e9', outline='',
+                                     tags=("scheme", "scheme_tile", "tile_placeholder"))
+        self.canvas.tag_lower("scheme")
+                
+    def place_tile(self, tx, ty, entry, x, y):
+        """Создание или перемещение элемента канваса для тайла"""
+        if entry.photo is None:
+            entry.photo = ImageTk.PhotoImage(entry.image)
+        left = x + tx * self.tile_size
+        top = y + ty * self.tile_size
+        item = self.items.get((tx, ty))
+        if item is None:
+            self.items[(tx, ty)] = self.canvas.create_image(left, top, image=entry.photo, anchor=tk.NW,
+                                                            tags=("scheme", "scheme_tile"))
+        else:
+            self.canvas.coords(item, left, top)
+            self.canvas.itemconfig(item, image=entry.photo)
             
-        # Отображаем изображение в максимальном размере с сохранением пропорций
-        img_width, img_height = self.original_image.size
-        
-        # Вычисляем коэффициенты масштабирования
-        width_ratio = canvas_width / img_width
-        height_ratio = canvas_height / img_height
-        scale_ratio = min(width_ratio, height_ratio, 1.0)  # Не увеличиваем больше оригинала
-        
-        display_width = int(img_width * scale_ratio)
-        display_height = int(img_height * scale_ratio)
-        
-        resized_image = self.original_image.resize((display_width, display_height), Image.Resampling.LANCZOS)
-        self.photo = ImageTk.PhotoImage(resized_image)
-        
-        self.canvas.delete("all")
-        # Центрируем изображение
-        x = (canvas_width - display_width) // 2
-        y = (canvas_height - display_height) // 2
-        self.canvas.create_image(x, y, image=self.photo, anchor=tk.NW)
+    def clear(self):
+        """Удаление всех тайлов с канваса (кэш сохраняется)"""
+        self.canvas.delete("scheme_tile")
+        self.items.clear()
+        self.scale_key = None
 
-    def darken_color(self, color, percent):
-        """Затемнение цвета для эффекта hover"""
-        import colorsys
-        # Конвертируем hex в RGB
-        color = color.lstrip('#')
-        rgb = tuple(int(color[i:i+2], 16) for i in (0, 2, 4))
-        
-        # Конвертируем RGB в HSL
-        h, l, s = colorsys.rgb_to_hls(rgb[0]/255.0, rgb[1]/255.0, rgb[2]/255.0)
-        
-        # Уменьшаем lightness
-        l = max(0, l * (100 - percent) / 100)
-        
-        # Конвертируем обратно в RGB
-        r, g, b = colorsys.hls_to_rgb(h, l, s)
-        
-        # Конвертируем в hex
-        return '#{:02x}{:02x}{:02x}'.format(int(r*255), int(g*255), int(b*255))
 
-    def show_threat(self, threat_id):
-        """Визуализация выбранной угрозы"""
-        self.clear_animations()
-        self.current_threat = threat_id
-        self.protection_btn.config(state='normal')
-        
-        # Обновляем координаты для новой компоновки
-        threat_positions = {
-            'ddos': {'x': 600, 'y': 100, 'targets': [(800, 200), (1000, 200)]},
-            'hack': {'x': 800, 'y': 150, 'targets': [(900, 250)]},
-            'spoofing': {'x': 1000, 'y': 100, 'targets': [(1100, 150)]},
-            'eavesdrop': {'x': 500, 'y': 100, 'targets': [(600, 200), (700, 200)]},
-            'virtualization': {'x': 1100, 'y': 150, 'targets': [(900, 250)]}
-        }
-        
-        if threat_id in threat_positions:
-            pos = threat_positions[threat_id]
-            self.animate_threat(threat_id, pos['x'], pos['y'], pos['targets'])
+class VectorScene:
+    """Векторная схема архитектуры из описания топологии.
+    
+    Компоненты сети рисуются элементами канваса в координатах схемы
+    (доли ее ширины и высоты), поэтому смена масштаба - это canvas.scale
+    без ресемплинга; меняются только размеры шрифтов подписей.
+    """
+    
+    def __init__(self, canvas, topology):
+        self.canvas = canvas
+        self.items = [item for item in topology if item["kind"] != "frame"]
+        frame = next((item for item in topology if item["kind"] == "frame"), {})
+        self.size = (frame.get("width", 746), frame.get("height", 506))
+        self.labels = {}
+        self.font_scale = None
+        self.drawn = False
+        
+    def node_box(self, item, x, y, scale):
+        """Прямоугольник компонента в координатах канваса"""
+        width, height = self.size
+        cx = x + item["x"] * width * scale
+        cy = y + item["y"] * height * scale
+        half_w = item["w"] * width * scale / 2
+        half_h = item["h"] * height * scale / 2
+        return cx - half_w, cy - half_h, cx + half_w, cy + half_h
+        
+    def draw(self, x, y, scale):
+        """Построение элементов схемы для текущего вида"""
+        self.clear()
+        nodes = {item["id"]: item for item in self.items if item["kind"] != "link"}
+        tags = ("scheme", "vector")
+        
+        for item in self.items:
+            if item["kind"] == "region":
+                self.canvas.create_rectangle(*self.node_box(item, x, y, scale),
+                                             outline=item["color"], width=2, fill='#fdfefe', tags=tags)
+        for item in self.items:
+            if item["kind"] == "link":
+                x0, y0, x1, y1 = self.node_box(nodes[item["from"]], x, y, scale)
+                x2, y2, x3, y3 = self.node_box(nodes[item["to"]], x, y, scale)
+                self.canvas.create_line((x0 + x1) / 2, (y0 + y1) / 2, (x2 + x3) / 2, (y2 + y3) / 2,
+                                        fill=item["color"], width=2, dash=tuple(item.get("dash", ())),
+                                        tags=tags)
+        for item in self.items:
+            if item["kind"] not in ("cloud", "node"):
+                continue
+            box = self.node_box(item, x, y, scale)
+            if item["kind"] == "cloud":
+                self.canvas.create_oval(*box, fill='#f4f6f7', outline=item["color"], width=2, tags=tags)
+            else:
+                self.canvas.create_rectangle(*box, fill=item["color"], outline='#2c3e50', width=2, tags=tags)
+            self.add_label(item, (box[0] + box[2]) / 2, (box[1] + box[3]) / 2, 9, item["kind"] == "node")
+        for item in self.items:
+            if item["kind"] == "region":
+                box = self.node_box(item, x, y, scale)
+                self.add_label(item, (box[0] + box[2]) / 2, box[1] + 22 * scale, 11, False)
+                
+        self.drawn = True
+        self.update_fonts(scale)
+        
+    def add_label(self, item, x, y, font_size, on_fill):
+        label = self.canvas.create_text(x, y, text=item["label"], justify=tk.CENTER,
+                                        fill='white' if on_fill else '#2c3e50',
+                                        tags=("scheme", "vector", "vector_label"))
+        self.labels[label] = font_size
+        
+    def update_fonts(self, scale):
+        """Подгонка шрифтов подписей под масштаб (canvas.scale их не меняет)"""
+        if scale == self.font_scale:
+            return
+        self.font_scale = scale
+        for label, font_size in self.labels.items():
+            self.canvas.itemconfig(label, font=('Arial', max(6, round(font_size * scale)), 'bold'))
+            
+    def clear(self):
+        self.canvas.delete("vector")
+        self.labels.clear()
+        self.font_scale = None
+        self.drawn = False
 
-    def animate_threat(self, threat_id, start_x, start_y, targets):
-        """Анимация угрозы"""
-        source_size = 40
-        target_size = 30
-        
-        # Отображаем источник угрозы
-        source = self.canvas.create_oval(start_x-source_size, start_y-source_size, 
-                                       start_x+source_size, start_y+source_size,
-                                       fill='#e74c3c', outline='#c0392b', width=3)
-        self.animation_items.append(source)
-        
-        threat_texts = {
-            'ddos': "DDoS\nАтака",
-            'hack': "Взлом\nПортала", 
-            'spoofing': "Подмена\nНомера",
-            'eavesdrop': "Перехват\nТрафика",
-            'virtualization': "Атака на\nВиртуализацию"
-        }
-        
-        text = self.canvas.create_text(start_x, start_y, 
-                                     text=threat_texts.get(threat_id, "Угроза"),
-                                     fill='white', font=('Arial', 12, 'bold'),
-                                     justify=tk.CENTER)
-        self.animation_items.append(text)
-        
-        # Анимация атаки на цели
-        for i, (target_x, target_y) in enumerate(targets):
-            self.root.after(i * 500, lambda tx=target_x, ty=target_y: 
-                          self.animate_attack(start_x, start_y, tx, ty, threat_id, target_size))
-
-    def animate_attack(self, start_x, start_y, target_x, target_y, threat_id, target_size):
-        """Анимация атаки от источника к цели"""
-        line = self.canvas.create_line(start_x, start_y, target_x, target_y,
-                                     arrow=tk.LAST, arrowshape=(12, 15, 8),
-                                     fill='#e74c3c', width=4, dash=(4, 2))
-        self.animation_items.append(line)
-        
-        target = self.canvas.create_oval(target_x-target_size, target_y-target_size, 
-                                       target_x+target_size, target_y+target_size,
-                                       fill='#e74c3c', outline='#c0392b', width=3)
-        self.animation_items.append(target)
-        
-        target_texts = {
-            'ddos': "Сервер",
-            'hack': "Веб-портал",
-            'spoofing': "SIP\nСервер",
-            'eavesdrop': "RTP\nПоток",
-            'virtualization': "Гипервизор"
+
+class AnimationRegistry:
+    """Индекс элементов анимаций на канвасе по роли и по угрозе.
+    
+    Каждому элементу при создании назначаются теги слоя, роли и угрозы,
+    поэтому массовые операции - одно удаление по тегу без запросов к Tcl
+    о каждом элементе.
+    """
+    
+    # Слой наложений для каждой роли
+    LAYERS = {
+        'source': 'threats',
+        'attack_line': 'threats',
+        'target': 'threats',
+        'shield': 'protections',
+        'barrier': 'protections',
+        'message': 'messages',
+    }
+    
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.by_role = {}
+        self.by_threat = {}
+        self.owners = {}
+        self.created = 0
+        
+    @staticmethod
+    def tag(role=None, threat=None):
+        """Тег элементов роли и/или угрозы"""
+        if role and threat:
+            return f"{role}@{threat}"
+        return f"role:{role}" if role else f"threat:{threat}"
+        
+    def create(self, kind, coords, role, threat=None, **options):
+        """Создание элемента канваса с регистрацией в индексах"""
+        tags = ["overlay", self.LAYERS[role], self.tag(role)]
+        if threat:
+            tags += [self.tag(threat=threat), self.tag(role, threat)]
+        item = getattr(self.canvas, "create_" + kind)(*coords, tags=tuple(tags), **options)
+        self.by_role.setdefault(role, set()).add(item)
+        self.by_threat.setdefault(threat, set()).add(item)
+        self.owners[item] = (role, threat)
+        self.created += 1
+        return item
+        
+    def items(self, role=None, threat=None):
+        """Элементы роли и/или угрозы"""
+        if role and threat:
+            return self.by_role.get(role, set()) & self.by_threat.get(threat, set())
+        if role:
+            return set(self.by_role.get(role, ()))
+        return set(self.by_threat.get(threat, ()))
+        
+    def remove(self, role=None, threat=None):
+        """Удаление всех элементов роли и/или угрозы одним вызовом Tcl"""
+        if role is None and threat is None:
+            self.clear()
+            return
+        items = self.items(role, threat)
+        self.canvas.delete(self.tag(role, threat))
+        for item in items:
+            item_role, item_threat = self.owners.pop(item)
+            self.by_role[item_role].discard(item)
+            self.by_threat[item_threat].discard(item)
+            
+    def clear(self):
+        self.canvas.delete("overlay")
+        self.by_role.clear()
+        self.by_threat.clear()
+        self.owners.clear()
+        
+    def __len__(self):
+        return len(self.owners)
+
+
+def ease_linear(t):
+    return t
+
+
+def ease_in_out_cubic(t):
+    return 4 * t * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 3 / 2
+
+
+def blend_color(start, end, t):
+    """Промежуточный цвет между двумя hex-цветами"""
+    a = [int(start[i:i + 2], 16) for i in (1, 3, 5)]
+    b = [int(end[i:i + 2], 16) for i in (1, 3, 5)]
+    return '#{:02x}{:02x}{:02x}'.format(*(round(x + (y - x) * t) for x, y in zip(a, b)))
+
+
+class Tween:
+    """Анимация по времени: update(прогресс 0..1 после easing), затем on_done()"""
+    
+    def __init__(self, duration, update=None, easing=ease_in_out_cubic, delay=0.0, on_done=None):
+        self.duration = duration
+        self.update = update
+        self.easing = easing
+        self.delay = delay
+        self.on_done = on_done
+        self.start = None
+        self.done = False
+        self.cancelled = False
+        
+    def cancel(self):
+        """Досрочное завершение (без вызова on_done)"""
+        self.cancelled = True
+        
+    def advance(self, now):
+        """Шаг анимации; False - анимация завершена"""
+        if self.cancelled:
+            return False
+        elapsed = now - self.start - self.delay
+        if elapsed < 0:
+            return True
+        progress = 1.0 if self.duration <= 0 else min(1.0, elapsed / self.duration)
+        if self.update is not None:
+            self.update(self.easing(progress))
+        if self.cancelled:
+            return False
+        if progress < 1.0:
+            return True
+        if self.on_done is not None:
+            self.on_done()
+        return False
+
+
+class Timeline:
+    """Шаги анимации со своим временем: отмена, пауза, скорость, перемотка.
+    
+    Таймлайн - одна анимация часов FrameClock. Отмена лишь помечает его,
+    и часы отбрасывают таймлайн со всеми шагами на следующем кадре.
+    Без часов (clock=None) таймлайн продвигается только перемоткой.
+    
+    Шаги применяются в порядке их начала, а шаги, запланированные внутри
+    другого шага, отсчитываются от его расчетного времени, а не от текущей
+    позиции - поэтому перемотка сразу на любой момент дает тот же кадр,
+    что и покадровое воспроизведение.
+    
+    Перемотка назад вызывает on_rewind (владелец убирает следы шагов,
+    например наложения на канвасе), отбрасывает шаги, порожденные другими
+    шагами, и заново применяет корневые шаги с нуля до новой позиции.
+    """
+    
+    def __init__(self, clock=None, speed=1.0, on_rewind=None):
+        self.clock = clock
+        self.on_rewind = on_rewind
+        # Корневые шаги (добавлены вне других шагов; нужны только перемотке назад)
+        # и куча еще не завершенных шагов
+        self.roots = []
+        self.added = 0
+        self.pending = []
+        self.end = 0.0
+        self.position = 0.0
+        self.speed = speed
+        self.paused = False
+        self.cancelled = False
+        self.running = False
+        self.last = None
+        self.start = None
+        self.anchor = None
+        
+    def add(self, animation):
+        animation.start = self.position if self.anchor is None else self.anchor
+        begin = animation.start + animation.delay
+        # Номер шага - порядок применения шагов с одинаковым началом
+        heapq.heappush(self.pending, (begin, self.added, animation))
+        if self.anchor is None:
+            self.roots.append((self.added, animation))
+        self.added += 1
+        self.end = max(self.end, begin + animation.duration)
+        self.ensure_running()
+        return animation
+        
+    def tween(self, duration, update=None, easing=ease_in_out_cubic, delay=0.0, on_done=None):
+        """Шаг длительностью duration секунд времени таймлайна"""
+        return self.add(Tween(duration, update, easing, delay, on_done))
+        
+    def call_later(self, delay, func):
+        """Однократный вызов через delay секунд времени таймлайна"""
+        return self.tween(0, delay=delay, on_done=func)
+        
+    @property
+    def now(self):
+        """Текущее время таймлайна (внутри шага - его расчетное время)"""
+        return self.position if self.anchor is None else self.anchor
+        
+    @property
+    def duration(self):
+        """Время окончания последнего запланированного шага"""
+        return self.end
+        
+    def ensure_running(self):
+        if self.clock is not None and not self.running and not self.paused and not self.cancelled:
+            self.running = True
+            self.last = None
+            self.clock.add(self)
+            
+    def advance(self, now):
+        """Кадр часов: сдвиг времени таймлайна и применение шагов"""
+        if self.cancelled or self.paused:
+            self.running = False
+            return False
+        if self.last is not None:
+            self.position += (now - self.last) * self.speed
+        self.last = now
+        self.apply()
+        self.running = not self.cancelled and bool(self.pending)
+        return self.running
+        
+    def apply(self):
+        """Применение начавшихся шагов к текущей позиции в порядке их начала.
+        
+        Стоимость кадра зависит от числа активных шагов: завершенные шаги
+        покидают кучу, будущие остаются в ней непросмотренными.
+        """
+        active = []
+        try:
+            while self.pending and not self.cancelled:
+                if self.pending[0][0] > self.position:
+                    break
+                entry = heapq.heappop(self.pending)
+                begin, _, step = entry
+                self.anchor = min(self.position, begin + step.duration)
+                step.done = not step.advance(self.position)
+                if not step.done:
+                    active.append(entry)
+        finally:
+            self.anchor = None
+            # Незавершенные шаги возвращаются в кучу до следующего кадра
+            for entry in active:
+                heapq.heappush(self.pending, entry)
+                
+    def cancel(self):
+        """Отмена всех оставшихся шагов за O(1)"""
+        self.cancelled = True
+        
+    def pause(self):
+        self.paused = True
+        
+    def resume(self):
+        self.paused = False
+        self.ensure_running()
+        
+    def set_speed(self, speed):
+        self.speed = speed
+        
+    def rewind(self):
+        """Возврат к нулю: только корневые шаги, следы прежних шагов убираются"""
+        if self.on_rewind is not None:
+            self.on_rewind()
+        self.position = 0.0
+        self.end = 0.0
+        self.pending = []
+        for index, step in self.roots:
+            step.done = False
+            begin = step.start + step.delay
+            self.pending.append((begin, index, step))
+            self.end = max(self.end, begin + step.duration)
+        heapq.heapify(self.pending)
+        
+    def seek(self, position):
+        """Перемотка вперед доигрывает шаги, назад - переигрывает с нуля"""
+        position = max(0.0, position)
+        if position < self.position:
+            self.rewind()
+        self.position = position
+        if not self.cancelled:
+            self.apply()
+            self.last = None
+            self.ensure_running()
+
+
+class FrameClock:
+    """Единые часы анимаций: один таймер Tk на все активные эффекты.
+    
+    Часы тикают с частотой кадров, пока есть активные анимации, и
+    продвигают их по реальному времени, поэтому длительность эффектов
+    не зависит от загрузки цикла событий.
+    """
+    
+    def __init__(self, root, frame_interval=16):
+        self.root = root
+        self.frame_interval = frame_interval
+        self.animations = []
+        self.job = None
+        self.ticks = deque(maxlen=240)
+        
+    def add(self, animation):
+        animation.start = time.perf_counter()
+        self.animations.append(animation)
+        if self.job is None:
+            self.job = self.root.after(self.frame_interval, self.tick)
+        return animation
+        
+    def tween(self, duration, update=None, easing=ease_in_out_cubic, delay=0.0, on_done=None):
+        """Запуск анимации длительностью duration секунд"""
+        return self.add(Tween(duration, update, easing, delay, on_done))
+        
+    def call_later(self, delay, func):
+        """Однократный вызов через delay секунд по часам анимаций"""
+        return self.tween(0, delay=delay, on_done=func)
+        
+    def tick(self):
+        """Кадр: продвижение всех активных анимаций"""
+        started = time.perf_counter()
+        active, self.animations = self.animations, []
+        # Анимации, добавленные во время кадра, оказываются в self.animations
+        self.animations = [animation for animation in active if animation.advance(started)] + self.animations
+        
+        spent = (time.perf_counter() - started) * 1000
+        self.ticks.append((started, spent))
+        if self.animations:
+            self.job = self.root.after(max(1, self.frame_interval - int(spent)), self.tick)
+        else:
+            self.job = None
+            
+    def stats(self, window=1.0):
+        """Частота кадров и время кадра за последние window секунд"""
+        now = time.perf_counter()
+        recent = [spent for started, spent in self.ticks if now - started <= window]
+        return {
+            "fps": len(recent) / window,
+            "tick_ms": recent[-1] if recent else 0.0,
+            "max_tick_ms": max(recent, default=0.0),
+            "animations": len(self.animations)
         }
-        
-        target_label = self.canvas.create_text(target_x, target_y, 
-                                             text=target_texts.get(threat_id, "Цель"),
-                                             fill='white', font=('Arial', 10, 'bold'),
-                                             justify=tk.CENTER)
-        self.animation_items.append(target_label)
-        
-        self.blink_target(target, 3)
 
-    def blink_target(self, target, count):
-        """Мигание цели атаки"""
-        if count > 0:
-            current_color = self.canvas.itemcget(target, 'fill')
-            new_color = '#f39c12' if current_color == '#e74c3c' else '#e74c3c'
-            self.canvas.itemconfig(target, fill=new_color)
-            self.root.after(300, lambda: self.blink_target(target, count - 1))
 
-    def activate_protection(self):
-        """Активация защиты против текущей угрозы"""
-        if not self.current_threat:
-            return
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class ImageAsset:
+    """Изображение, открываемое один раз и декодируемое по требованию.
+    
+    При создании читается только заголовок файла. Декодирование выполняется
+    при первом запросе версии нужного размера; для JPEG используется
+    draft-режим PIL, который декодирует сразу в уменьшенном масштабе.
+    Декодированное изображение и кэш его версий общие для всех потребителей.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.RLock()
+        self.header = Image.open(path)
+        self.size = self.header.size
+        self.format = self.header.format
+        self.image = None
+        self.scaled = None
+        
+    def covers(self, target_size):
+        """Декодированное изображение достаточно для целевого размера"""
+        if self.image is None:
+            return False
+        if target_size is None:
+            return self.image.size == self.size
+        return self.image.size[0] >= target_size[0] and self.image.size[1] >= target_size[1]
+        
+    def decode(self, target_size=None):
+        """Декодирование не меньше target_size (None - полный размер)"""
+        with self.lock:
+            if self.covers(target_size):
+                return self.image
             
-        self.protection_active = True
-        self.protection_btn.config(state='disabled')
-        
-        protection_data = {
-            'ddos': {'type': 'firewall', 'position': (600, 100)},
-            'hack': {'type': 'waf', 'position': (800, 150)},
-            'spoofing': {'type': 'sbc', 'position': (1000, 100)},
-            'eavesdrop': {'type': 'encryption', 'position': (500, 100)},
-            'virtualization': {'type': 'hypervisor', 'position': (1100, 150)}
+            # Заголовок используется для первого декодирования, далее файл открывается заново
+            source = self.header if self.header is not None else Image.open(self.path)
+            self.header = None
+            if target_size is not None and source.format == "JPEG":
+                source.draft("RGB", tuple(target_size))
+            source.load()
+            
+            self.image = source
+            if self.scaled is None:
+                self.scaled = ScaledImageCache(source)
+            else:
+                self.scaled.rebase(source)
+            return source
+            
+    def peek(self, size, resample):
+        """Готовая версия нужного размера или None"""
+        # Без блокировки ассета: decode() держит ее все время декодирования
+        scaled = self.scaled
+        return scaled.peek(size, resample) if scaled is not None else None
+        
+    def get(self, size, resample):
+        """Версия нужного размера (декодирует при необходимости; для фонового потока)"""
+        self.decode(size)
+        return self.scaled.get(size, resample)
+        
+    def memory_usage(self):
+        """Память декодированного изображения, пирамиды и кэша версий, байт"""
+        image, scaled = self.image, self.scaled
+        decoded = 0
+        if image is not None:
+            decoded = image.size[0] * image.size[1] * len(image.getbands())
+        pyramid = scaled.level_bytes() if scaled is not None else 0
+        cached = scaled.used_bytes if scaled is not None else 0
+        return {"decoded": decoded, "pyramid": pyramid, "scaled": cached,
+                "total": decoded + pyramid + cached}
+
+
+class AssetManager:
+    """Единая точка загрузки ресурсов: путь относительно модуля, один объект на файл"""
+    
+    def __init__(self, base_dir=ASSET_DIR):
+        self.base_dir = base_dir
+        self.assets = {}
+        self.lock = threading.Lock()
+        
+    def resolve(self, name):
+        return os.path.join(self.base_dir, name)
+        
+    def image(self, name):
+        """Общий объект изображения (повторные запросы не открывают файл снова)"""
+        path = self.resolve(name)
+        with self.lock:
+            asset = self.assets.get(path)
+            if asset is None:
+                asset = self.assets[path] = ImageAsset(path)
+        return asset
+        
+    def memory_usage(self):
+        """Учет памяти по всем загруженным ресурсам"""
+        with self.lock:
+            assets = dict(self.assets)
+        usage = {os.path.relpath(path, self.base_dir): asset.memory_usage()
+                 for path, asset in assets.items()}
+        usage_total = sum(item["total"] for item in usage.values())
+        return {"assets": usage, "total": usage_total}
+
+
+class ThreatTopology:
+    """Единый реестр геометрии угроз и защит в координатах схемы.
+    
+    Точки задаются долями ширины и высоты схемы (узлы - из content/topology.json,
+    угрозы - из content/threat_map.json) и пересчитываются в координаты канваса
+    один раз при изменении вида, а не при каждом кадре анимации.
+    """
+    
+    # Положение сообщения об отражении атаки
+    MESSAGE_AT = (0.5, 0.04)
+    
+    def __init__(self, topology, threat_map):
+        frame = next((item for item in topology if item["kind"] == "frame"), {})
+        self.size = (frame.get("width", 746), frame.get("height", 506))
+        self.nodes = {item["id"]: (item["x"], item["y"]) for item in topology if "x" in item}
+        self.threats = {item["id"]: item for item in threat_map}
+        self.view = None
+        self.scale = 1.0
+        self.points = {}
+        self.layout(0, 0, 1.0)
+        
+    def resolve(self, ref):
+        """Точка схемы: идентификатор узла топологии или пара долей [x, y]"""
+        return self.nodes[ref] if isinstance(ref, str) else tuple(ref)
+        
+    def layout(self, x, y, scale):
+        """Пересчет всех точек для вида: схема в (x, y) с масштабом scale"""
+        if self.view == (x, y, scale):
+            return False
+        self.view = (x, y, scale)
+        self.scale = scale
+        width, height = self.size
+        
+        def to_canvas(ref):
+            px, py = self.resolve(ref)
+            return (x + px * width * scale, y + py * height * scale)
+        
+        self.points = {"message": to_canvas(self.MESSAGE_AT)}
+        for threat_id, threat in self.threats.items():
+            self.points[threat_id] = {
+                "source": to_canvas(threat["source"]),
+                "targets": [to_canvas(target["at"]) for target in threat["targets"]],
+                "protection": to_canvas(threat["protection"]["at"])
+            }
+        return True
+        
+    def place(self, threat_id, offset=(0, 0)):
+        """Точки угрозы на канвасе со сдвигом offset (в пикселях схемы)"""
+        points = self.points[threat_id]
+        dx, dy = offset[0] * self.scale, offset[1] * self.scale
+        shift = lambda point: (point[0] + dx, point[1] + dy)
+        return {
+            "source": shift(points["source"]),
+            "targets": [shift(point) for point in points["targets"]],
+            "protection": shift(points["protection"])
         }
-        
-        if self.current_threat in protection_data:
-            data = protection_data[self.current_threat]
-            self.animate_protection(data['type'], data['position'])
 
-    def animate_protection(self, protection_type, position):
-        """Анимация работы защиты - ИСПРАВЛЕННАЯ ВЕРСИЯ"""
-        x, y = position
+
+SCENARIO_DIR = os.path.join(ASSET_DIR, "scenarios")
+SCENARIO_VERSION = 1
+SCENARIO_ACTIONS = ("threat", "protect", "clear")
+
+
+def load_scenario(path, threat_ids):
+    """Чтение и проверка сценария учений"""
+    with open(path, encoding="utf-8") as f:
+        scenario = json.load(f)
+    if scenario.get("version") != SCENARIO_VERSION:
+        raise ValueError(f"{os.path.basename(path)}: неподдерживаемая версия сценария "
+                         f"{scenario.get('version')!r}, ожидается {SCENARIO_VERSION}")
+    events = sorted(scenario.get("events", []), key=lambda event: event["at"])
+    for event in events:
+        if event.get("action") not in SCENARIO_ACTIONS:
+            raise ValueError(f"{os.path.basename(path)}: неизвестное действие {event.get('action')!r}")
+        if event["action"] != "clear" and event.get("threat") not in threat_ids:
+            raise ValueError(f"{os.path.basename(path)}: неизвестная угроза {event.get('threat')!r}")
+    scenario["events"] = events
+    return scenario
+
+
+class PacketPool:
+    """Пул элементов канваса для частиц.
+    
+    Элементы создаются один раз и переиспользуются: каждый кадр меняются
+    только координаты (и цвет, если он изменился), лишние прячутся.
+    """
+    
+    def __init__(self, canvas, capacity=4000, size=2):
+        self.canvas = canvas
+        self.capacity = capacity
+        self.size = size
+        self.items = []
+        self.colors = []
+        self.visible = 0
+        
+    def draw(self, packets):
+        """Кадр: packets - список (x, y, цвет)"""
+        count = min(len(packets), self.capacity)
+        size = self.size
+        while len(self.items) < count:
+            self.items.append(self.canvas.create_rectangle(0, 0, 0, 0, width=0, state='hidden',
+                                                           tags=("packets",)))
+            self.colors.append(None)
+            
+        for index in range(count):
+            x, y, color = packets[index]
+            item = self.items[index]
+            self.canvas.coords(item, x - size, y - size, x + size, y + size)
+            if self.colors[index] != color:
+                self.canvas.itemconfig(item, fill=color)
+                self.colors[index] = color
+        for item in self.items[self.visible:count]:
+            self.canvas.itemconfig(item, state='normal')
+        for item in self.items[count:self.visible]:
+            self.canvas.itemconfig(item, state='hidden')
+        self.visible = count
+        
+    def hide(self):
+        if self.visible:
+            self.canvas.itemconfig("packets", state='hidden')
+            self.visible = 0
+
+
+class PacketFlood:
+    """Поток пакетов DDoS от множества источников через NGFW к цели.
+    
+    Положение каждого пакета вычисляется из времени (без состояния на кадр),
+    поэтому поток одинаково выглядит в окне и при перемотке в экспорте.
+    После блокировки пакеты, дошедшие до щита NGFW, отбрасываются на нем.
+    """
+    
+    PACKET_COLOR = '#e74c3c'
+    DROPPED_COLOR = '#f39c12'
+    
+    def __init__(self, start, rate=1200, travel=(1.2, 2.0), drop_time=0.35):
+        self.start = start
+        self.rate = rate
+        self.travel = travel
+        self.drop_time = drop_time
+        self.blocked_at = None
+        self.sources = []
+        self.splits = []
+        self.shield = self.target = (0, 0)
+        
+    def relayout(self, sources, shield, target):
+        """Новая геометрия потока (после изменения вида)"""
+        self.sources = sources
+        self.shield = shield
+        self.target = target
+        # Доля пути до щита для каждого источника
+        to_target = math.hypot(target[0] - shield[0], target[1] - shield[1])
+        self.splits = []
+        for sx, sy in sources:
+            to_shield = math.hypot(shield[0] - sx, shield[1] - sy)
+            self.splits.append(to_shield / ((to_shield + to_target) or 1))
+            
+    @staticmethod
+    def around(center, radius, count=24):
+        """Источники ботнета полукругом слева от центра"""
+        cx, cy = center
+        return [(cx - radius[0] * math.sin(math.pi * (0.15 + 0.7 * k / (count - 1))),
+                 cy - radius[1] * math.cos(math.pi * (0.15 + 0.7 * k / (count - 1))))
+                for k in range(count)]
+        
+    def packets(self, now):
+        """Пакеты на момент now: список (x, y, цвет)"""
+        t = now - self.start
+        slowest = self.travel[1] + self.drop_time
+        first = max(0, int((t - slowest) * self.rate))
+        last = int(t * self.rate)
+        low, spread = self.travel[0], self.travel[1] - self.travel[0]
+        shield_x, shield_y = self.shield
+        target_x, target_y = self.target
+        blocked_at = None if self.blocked_at is None else self.blocked_at - self.start
+        result = []
+        
+        for i in range(first, last + 1):
+            emitted = i / self.rate
+            age = t - emitted
+            # Псевдослучайная, но воспроизводимая скорость пакета
+            travel = low + spread * ((i * 0.618034) % 1.0)
+            source = i % len(self.sources)
+            split = self.splits[source]
+            progress = age / travel
+            if progress < split:
+                sx, sy = self.sources[source]
+                f = progress / split
+                result.append((sx + (shield_x - sx) * f, sy + (shield_y - sy) * f, self.PACKET_COLOR))
+            elif blocked_at is not None and emitted + travel * split >= blocked_at:
+                # Отброшен на щите: короткое "рассеивание" вокруг NGFW
+                dropped_for = age - travel * split
+                if dropped_for < self.drop_time:
+                    angle = i * 2.399963
+                    r = 10 + 40 * dropped_for / self.drop_time
+                    result.append((shield_x + r * math.cos(angle), shield_y + r * math.sin(angle),
+                                   self.DROPPED_COLOR))
+            elif progress < 1.0:
+                f = (progress - split) / (1 - split)
+                result.append((shield_x + (target_x - shield_x) * f, shield_y + (target_y - shield_y) * f,
+                               self.PACKET_COLOR))
+        return result
+
+
+class ThreatAnimator:
+    """Визуальные эффекты угроз и защит поверх схемы.
+    
+    Работает с любым канвасом с интерфейсом tk.Canvas (в том числе
+    с OffscreenCanvas при экспорте) и планирует шаги на таймлайне,
+    поэтому одна и та же анимация воспроизводится в окне и без дисплея.
+    Геометрия берется из ThreatTopology для текущего вида схемы.
+    """
+    
+    # Размеры элементов в пикселях схемы при масштабе 1
+    SOURCE_SIZE = 40
+    TARGET_SIZE = 30
+    SHIELD_SIZE = (60, 35)
+    BOTNET_RADIUS = (120, 170)
+    
+    def __init__(self, canvas, topology, clock=None, on_finished=None):
+        self.canvas = canvas
+        self.topology = topology
+        self.clock = clock
+        self.registry = AnimationRegistry(canvas)
+        self.timeline = Timeline(clock, on_rewind=self.rewind)
+        self.on_finished = on_finished or self.remove_threat
+        self.flood_mode = False
+        self.packet_pool = PacketPool(canvas)
+        self.floods = {}
+        self.flood_step = None
+        
+    def set_view(self, x, y, scale):
+        """Пересчет геометрии для нового положения и масштаба схемы"""
+        if self.topology.layout(x, y, scale):
+            for key, (flood, threat_id, offset) in self.floods.items():
+                self.layout_flood(flood, threat_id, offset)
+        
+    def reset(self):
+        """Отмена запланированных шагов и очистка наложений"""
+        self.timeline.cancel()
+        self.registry.clear()
+        self.stop_floods()
+        self.timeline = Timeline(self.clock, on_rewind=self.rewind)
+        
+    def rewind(self):
+        """Перемотка таймлайна назад: наложения строятся заново его шагами"""
+        self.registry.clear()
+        self.stop_floods()
+        
+    def remove_threat(self, key):
+        """Удаление наложений и потока пакетов одного экземпляра угрозы"""
+        self.registry.remove(threat=key)
+        if self.floods.pop(key, None) is not None and not self.floods:
+            self.stop_floods()
+            
+    def layout_flood(self, flood, threat_id, offset):
+        place = self.topology.place(threat_id, offset)
+        scale = self.topology.scale
+        radius = (self.BOTNET_RADIUS[0] * scale, self.BOTNET_RADIUS[1] * scale)
+        shield = place["protection"]
+        flood.relayout(PacketFlood.around(shield, radius), shield, place["targets"][0])
+            
+    def start_flood(self, key, threat_id, offset, timeline, duration=120.0):
+        """Запуск потока пакетов; все потоки рисуются одним шагом таймлайна"""
+        flood = PacketFlood(timeline.now)
+        self.layout_flood(flood, threat_id, offset)
+        self.floods[key] = (flood, threat_id, offset)
+        if self.flood_step is None:
+            def update(_):
+                packets = []
+                for flood, _, _ in self.floods.values():
+                    packets.extend(flood.packets(timeline.now))
+                self.packet_pool.draw(packets)
+            self.flood_step = timeline.tween(duration, update, easing=ease_linear, on_done=self.stop_floods)
+            
+    def stop_floods(self):
+        self.floods.clear()
+        if self.flood_step is not None:
+            self.flood_step.cancel()
+            self.flood_step = None
+        self.packet_pool.hide()
+        
+    def animate_threat(self, threat_id, timeline=None, key=None, offset=(0, 0)):
+        """Анимация угрозы (key - ключ экземпляра угрозы в реестре анимаций)"""
+        timeline = timeline or self.timeline
+        key = key or threat_id
+        threat = self.topology.threats[threat_id]
+        start_x, start_y = self.topology.place(threat_id, offset)["source"]
+        source_size = self.SOURCE_SIZE * self.topology.scale
         
-        protection_configs = {
-            'firewall': {'text': 'NGFW\nЗащита', 'color': '#2ecc71'},
-            'waf': {'text': 'WAF\nБлокировка', 'color': '#3498db'},
-            'sbc': {'text': 'SBC\nВалидация', 'color': '#9b59b6'},
-            'encryption': {'text': 'Шифрование\nSRTP/TLS', 'color': '#f1c40f'},
-            'hypervisor': {'text': 'Гипервизор\nЗащита', 'color': '#1abc9c'}
-        }
+        # Отображаем источник угрозы
+        self.registry.create('oval', (start_x-source_size, start_y-source_size,
+                                      start_x+source_size, start_y+source_size),
+                             'source', key,
+                             fill='#e74c3c', outline='#c0392b', width=3)
+        
+        self.registry.create('text', (start_x, start_y), 'source', key,
+                             text=threat.get("label", "Угроза"),
+                             fill='white', font=('Arial', 12, 'bold'),
+                             justify=tk.CENTER)
         
-        config = protection_configs.get(protection_type, {'text': 'Защита', 'color': '#2ecc71'})
+        if self.flood_mode and threat_id == 'ddos':
+            # Режим потока пакетов: ботнет атакует первую цель через NGFW
+            self.start_flood(key, threat_id, offset, timeline)
         
-        shield = self.canvas.create_rectangle(x-60, y-35, x+60, y+35,
-                                            fill=config['color'], outline='#27ae60', width=4)
-        self.animation_items.append(shield)
+        # Анимация атаки на цели (с шагом 0.5 с по часам анимаций)
+        for i in range(len(threat["targets"])):
+            timeline.call_later(i * 0.5, lambda index=i:
+                                self.animate_attack(threat_id, index, timeline, key, offset))
+
+    def animate_attack(self, threat_id, index, timeline=None, key=None, offset=(0, 0)):
+        """Анимация атаки от источника к цели (index - номер цели угрозы)"""
+        timeline = timeline or self.timeline
+        key = key or threat_id
+        place = self.topology.place(threat_id, offset)
+        start_x, start_y = place["source"]
+        target_x, target_y = place["targets"][index]
+        target_size = self.TARGET_SIZE * self.topology.scale
+        
+        flood = key in self.floods
+        if not flood:
+            line = self.registry.create('line', (start_x, start_y, target_x, target_y),
+                                        'attack_line', key,
+                                        arrow=tk.LAST, arrowshape=(12, 15, 8),
+                                        fill='#e74c3c', width=4, dash=(4, 2))
+        
+        target = self.registry.create('oval', (target_x-target_size, target_y-target_size,
+                                               target_x+target_size, target_y+target_size),
+                                      'target', key,
+                                      fill='#e74c3c', outline='#c0392b', width=3)
+        
+        self.registry.create('text', (target_x, target_y), 'target', key,
+                             text=self.topology.threats[threat_id]["targets"][index].get("label", "Цель"),
+                             fill='white', font=('Arial', 10, 'bold'),
+                             justify=tk.CENTER)
         
-        text = self.canvas.create_text(x, y, text=config['text'],
-                                     fill='white', font=('Arial', 12, 'bold'),
-                                     justify=tk.CENTER)
-        self.animation_items.append(text)
+        # Бегущий пунктир вдоль линии атаки
+        if not flood:
+            timeline.tween(1.5, lambda t: self.canvas.itemconfig(line, dashoffset=-round(t * 60)),
+                           easing=ease_linear)
+        self.blink_target(target, 3, timeline=timeline)
+
+    def blink_target(self, target, count, period=0.6, timeline=None):
+        """Плавное мигание цели атаки (count полупериодов)"""
+        def update(t):
+            phase = (1 - math.cos(t * count * math.pi)) / 2
+            self.canvas.itemconfig(target, fill=blend_color('#e74c3c', '#f39c12', phase))
+        (timeline or self.timeline).tween(count * period / 2, update, easing=ease_linear)
+
+    def animate_protection(self, threat_id, timeline=None, key=None, offset=(0, 0)):
+        """Анимация работы защиты против угрозы"""
+        key = key or threat_id
+        x, y = self.topology.place(threat_id, offset)["protection"]
+        if key in self.floods:
+            # Пакеты, дошедшие до NGFW после этого момента, отбрасываются
+            self.floods[key][0].blocked_at = (timeline or self.timeline).now
+        
+        config = self.topology.threats[threat_id]["protection"]
+        half_w, half_h = (size * self.topology.scale for size in self.SHIELD_SIZE)
+        
+        self.registry.create('rectangle', (x-half_w, y-half_h, x+half_w, y+half_h), 'shield', key,
+                             fill=config.get('color', '#2ecc71'), outline='#27ae60', width=4)
+        
+        self.registry.create('text', (x, y), 'shield', key,
+                             text=config.get('label', 'Защита'),
+                             fill='white', font=('Arial', 12, 'bold'),
+                             justify=tk.CENTER)
         
-        self.animate_blocking(x, y)
+        self.animate_blocking(x, y, key, timeline)
 
-    def animate_blocking(self, x, y):
-        """Анимация блокировки атаки - ИСПРАВЛЕННАЯ ВЕРСИЯ"""
+    def animate_blocking(self, x, y, key=None, timeline=None):
+        """Анимация блокировки атаки - барьеры вокруг щита"""
+        scale = self.topology.scale
         for i in range(3):
-            barrier = self.canvas.create_rectangle(x-80-i*8, y-60-i*8, x+80+i*8, y+60+i*8,
-                                                 outline='#2ecc71', width=3, dash=(2, 2))
-            self.animation_items.append(barrier)
+            half_w = (80 + i * 8) * scale
+            half_h = (60 + i * 8) * scale
+            self.registry.create('rectangle', (x-half_w, y-half_h, x+half_w, y+half_h),
+                                 'barrier', key,
+                                 outline='#2ecc71', width=3, dash=(2, 2))
             
-        self.animate_reflection()
-
-    def animate_reflection(self):
-        """Анимация отражения атаки - ИСПРАВЛЕННАЯ ВЕРСИЯ"""
-        # Удаляем только линии атаки, оставляем защиту
-        for item in self.animation_items[:]:
-            if self.canvas.type(item) == 'line':
-                self.canvas.delete(item)
-                self.animation_items.remove(item)
+        self.animate_reflection(key, timeline)
+
+    def animate_reflection(self, key=None, timeline=None):
+        """Анимация отражения атаки - линии атаки убираются, защита остается"""
+        # Удаляем только линии атаки этой угрозы, оставляем защиту
+        self.registry.remove('attack_line', key)
     
         # Сообщение об успешной защите
-        msg = self.canvas.create_text(400, 50, text="✅ Атака отражена! Защита сработала успешно",
-                                    fill='#27ae60', font=('Arial', 16, 'bold'))
-        self.animation_items.append(msg)
+        self.registry.create('text', self.topology.points["message"], 'message', key,
+                             text="✅ Атака отражена! Защита сработала успешно",
+                             fill='#27ae60', font=('Arial', 16, 'bold'))
         
         # Автоматическая очистка через 3 секунды
-        self.root.after(3000, self.clear_animations)
+        (timeline or self.timeline).call_later(3.0, lambda: self.on_finished(key))
 
-    def clear_animations(self):
-        """Очистка всех анимационных элементов - ИСПРАВЛЕННАЯ ВЕРСИЯ"""
-        for item in self.animation_items:
-            self.canvas.delete(item)
-        self.animation_items.clear()
-        self.current_threat = None
-        self.protection_active = False
-        self.protection_btn.config(state='disabled')
-        
-        # Перерисовываем схему после очистки анимаций
-        self.resize_image_fixed()
+    def run_event(self, event, timeline=None):
+        """Одно событие сценария"""
+        threat = event.get("threat")
+        key = event.get("id", threat)
+        offset = tuple(event.get("offset", (0, 0)))
+        
+        if event["action"] == "threat":
+            self.animate_threat(threat, timeline, key, offset)
+        elif event["action"] == "protect":
+            self.animate_protection(threat, timeline, key, offset)
+        elif key:
+            self.remove_threat(key)
+        else:
+            self.registry.clear()
+            self.stop_floods()
 
-    def create_tooltip(self, widget, text):
-        """Создание всплывающей подсказки"""
-        def on_enter(e):
-            tooltip = tk.Toplevel(widget)
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{e.x_root+10}+{e.y_root+10}")
-            label = tk.Label(tooltip, text=text, background="#ffffe0", relief='solid', borderwidth=1,
-                           font=('Arial', 12))
-            label.pack()
-            widget.tooltip = tooltip
-            
-        def on_leave(e):
-            if hasattr(widget, 'tooltip'):
-                widget.tooltip.destroy()
-                
-        widget.bind("<Enter>", on_enter)
-        widget.bind("<Leave>", on_leave)
 
-    def add_hover_effect(self, widget, normal_color, hover_color):
-        """Добавить эффект при наведении"""
-        def on_enter(e):
-            widget.configure(bg=hover_color)
+class TooltipManager:
+    """Всплывающие подсказки: одно общее окно, задержка показа и отложенное скрытие.
+
+    Окно создается один раз и дальше только перемещается и меняет текст.
+    При переходе между элементами с подсказками окно не прячется (скрытие
+    отложено на hide_delay) и сразу показывает подсказку нового элемента.
+    """
+    
+    def __init__(self, root, show_delay=400, hide_delay=100):
+        self.root = root
+        self.show_delay = show_delay
+        self.hide_delay = hide_delay
+        self.window = None
+        self.label = None
+        self.owner = None
+        self.shown = False
+        self.show_job = None
+        self.hide_job = None
+        
+    def attach(self, widget, text):
+        """Подсказка для виджета; обработчики добавляются к уже привязанным"""
+        widget.bind("<Enter>", lambda e: self.enter(widget, text, e.x_root, e.y_root), add='+')
+        widget.bind("<Leave>", lambda e: self.leave(widget), add='+')
+        widget.bind("<ButtonPress>", lambda e: self.hide(), add='+')
+        
+    def enter(self, widget, text, x, y):
+        self.cancel("hide_job")
+        self.cancel("show_job")
+        self.owner = widget
+        if self.shown:
+            self.show(text, x, y)
+        else:
+            self.show_job = self.root.after(self.show_delay, lambda: self.show(text, x, y))
             
-        def on_leave(e):
-            widget.configure(bg=normal_color)
+    def leave(self, widget):
+        if widget is not self.owner:
+            return
+        self.cancel("show_job")
+        if self.shown:
+            self.hide_job = self.root.after(self.hide_delay, self.hide)
+        else:
+            self.owner = None
             
-        widget.bind("<Enter>", on_enter)
-        widget.bind("<Leave>", on_leave)
+    def show(self, text, x, y):
+        self.show_job = None
+        if self.window is None:
+            self.window = tk.Toplevel(self.root)
+            self.window.wm_overrideredirect(True)
+            self.window.withdraw()
+            self.label = tk.Label(self.window, background="#ffffe0", relief='solid', borderwidth=1,
+                                  font=('Arial', 12))
+            self.label.pack()
+        self.label.config(text=text)
+        self.window.wm_geometry(f"+{x+10}+{y+10}")
+        if not self.shown:
+            self.window.deiconify()
+            self.shown = True
+        self.window.lift()
+        
+    def hide(self):
+        self.cancel("show_job")
+        self.cancel("hide_job")
+        if self.shown:
+            self.window.withdraw()
+            self.shown = False
+        self.owner = None
+        
+    def cancel(self, name):
+        job = getattr(self, name)
+        if job is not None:
+            self.root.after_cancel(job)
+            setattr(self, name, None)
 
-    def load_scheme_image(self):
-        """Загрузка изображения схемы"""
-        image_path = "voip_scheme.png"
-        
-        if os.path.exists(image_path):
-            try:
-                self.original_image = Image.open(image_path)
-                self.root.after(100, self.initial_resize)
-            except Exception as e:
-                self.show_error_message(f"Ошибка загрузки изображения: {str(e)}")
-        else:
-            self.show_error_message("Файл 'voip_scheme.png' не найден в папке с программой")
+
+class LayoutBatcher:
+    """Отложенная раскладка: один проход на кадр вместо пересчета на каждое событие.
+
+    pack/pack_forget и вызовы после раскладки накапливаются и применяются
+    в одном обработчике after_idle; повторные запросы для того же виджета
+    до прохода схлопываются (действует последний). scrollregion здесь не
+    пересчитывается: сразу после pack геометрия еще не распространена, и
+    bbox канваса устарел бы - его обновляет <Configure> прокручиваемого фрейма.
+    """
+    
+    def __init__(self, root):
+        self.root = root
+        self.packs = {}
+        self.callbacks = {}
+        self.job = None
+        self.flushes = 0
+        
+    def schedule(self):
+        if self.job is None:
+            self.job = self.root.after_idle(self.flush)
             
-    def show_error_message(self, message):
-        """Показать сообщение об ошибке"""
-        self.canvas.create_text(300, 150, text="⚠️ " + message, 
-                               font=("Arial", 16, "bold"), fill="#e74c3c")
-        self.canvas.create_text(300, 180, text="Поместите файл 'voip_scheme.png' в папку с программой", 
-                               font=("Arial", 13), fill="#3498db")
-        
-    def initial_resize(self):
-        """Первоначальное масштабирование изображения"""
-        if self.original_image:
-            self.resize_image_fixed()
+    def pack(self, widget, **options):
+        self.packs[widget] = options
+        self.schedule()
+        
+    def forget(self, widget):
+        self.packs[widget] = None
+        self.schedule()
+        
+    def after_layout(self, callback):
+        """Вызов после применения отложенной упаковки (одинаковые вызовы схлопываются)"""
+        self.callbacks[callback] = True
+        self.schedule()
+        
+    def flush(self):
+        self.job = None
+        self.flushes += 1
+        packs, self.packs = self.packs, {}
+        callbacks, self.callbacks = self.callbacks, {}
+        for widget, options in packs.items():
+            if options is None:
+                widget.pack_forget()
+            else:
+                widget.pack(**options)
+        for callback in callbacks:
+            callback()
 
-    def create_tasks_tab(self):
-        """Вкладка с заданиями - улучшенная версия с адаптивными блоками"""
-        container, tasks_frame, canvas = self.create_scrollable_frame(self.notebook)
-        self.notebook.add(container, text="📋 Задания кейса")
-        
-        title = tk.Label(tasks_frame, text="Задания кейса", 
-                        font=('Arial', 28, 'bold'),
-                        bg='#ecf0f1', fg='#2c3e50')
-        title.pack(pady=20)
-        
-        cards_container = ttk.Frame(tasks_frame, style='Light.TFrame')
-        cards_container.pack(fill=tk.BOTH, expand=True, padx=25, pady=15)
-        
-        tasks_data = [
-            ("1", "🎯 ОПРЕДЕЛЕНИЕ ОБЪЕКТОВ ЗАЩИТЫ", "Классификация критических компонентов VoIP сети\nИдентификация точек уязвимости\nАнализ архитектуры безопасности"),
-            ("2", "🔍 АНАЛИЗ АКТУАЛЬНЫХ УГРОЗ", "Определение наиболее вероятных угроз безопасности\nПриоритизация по степени воздействия на КИИ\nОценка рисков для каждого компонента"),
-            ("3", "🛡️ РАЗРАБОТКА МЕР ЗАЩИТЫ", "Технические меры безопасности\nОрганизационные меры безопасности\nПроцедурные меры и политики"),
-            ("4", "⚙️ ВЫБОР ТЕХНИЧЕСКИХ СРЕДСТВ", "Подбор средств защиты для каждой группы мер\nРекомендации по конкретным решениям\nИнтеграция с существующей инфраструктурой"),
-            ("5", "📊 ТРЕБОВАНИЯ К ПО И ОБОРУДОВАНИЮ", "Расширенная конфигурация для КИИ 3-й категории\nТребования к отказоустойчивости\nСоответствие нормативным документам")
-        ]
-        
-        for i, (num, title_text, desc) in enumerate(tasks_data):
-            row = i // 2
-            col = i % 2
+
+class DetailPanelCache:
+    """Построенные панели подробностей карточек: LRU с необязательным лимитом.
+
+    Свернутая карточка скрывает панель через pack_forget, при повторном
+    раскрытии панель показывается без перестроения. При превышении лимита
+    уничтожаются давно открывавшиеся панели (раскрытые не вытесняются).
+    """
+    
+    def __init__(self, limit=None):
+        self.panels = OrderedDict()
+        self.limit = limit
+        # Проверка "панель раскрыта"; по умолчанию - упакован ли ее контейнер
+        self.is_open = lambda key: bool(self.panels[key].master.winfo_manager())
+        self.builds = 0
+        self.hits = 0
+        self.evictions = 0
+        
+    def get(self, key):
+        """Готовая панель или None; панель становится самой свежей"""
+        panel = self.panels.get(key)
+        if panel is not None:
+            self.panels.move_to_end(key)
+            self.hits += 1
+        return panel
+        
+    def put(self, key, panel):
+        self.panels[key] = panel
+        self.panels.move_to_end(key)
+        self.builds += 1
+        self.evict(keep=key)
+        
+    def evict(self, keep=None):
+        """Уничтожение самых старых свернутых панелей сверх лимита"""
+        if self.limit is None:
+            return
+        for key in list(self.panels):
+            if len(self.panels) <= self.limit:
+                break
+            if key == keep or self.is_open(key):
+                continue
+            self.panels.pop(key).destroy()
+            self.evictions += 1
             
-            task_card = self.create_task_card(cards_container, num, title_text, desc)
-            task_card.grid(row=row, column=col, padx=20, pady=20, sticky='nsew')
+    def discard(self, key):
+        """Уничтожение панели, которая больше не понадобится"""
+        panel = self.panels.pop(key, None)
+        if panel is not None:
+            panel.destroy()
             
-            cards_container.grid_rowconfigure(row, weight=1)
-            cards_container.grid_columnconfigure(col, weight=1)
+    def stats(self):
+        return {
+            "panels": len(self.panels),
+            "limit": self.limit,
+            "builds": self.builds,
+            "hits": self.hits,
+            "evictions": self.evictions
+        }
             
-    def create_task_card(self, parent, number, title, description):
-        """Создание адаптивной карточки задания"""
-        card = tk.Frame(parent, bg='#34495e', relief='raised', bd=3, width=880, height=200)
+    def __len__(self):
+        return len(self.panels)
+
+
+# Уровни строк подробностей: шрифт, цвет и отступы (сверху, снизу) как у прежних Label
+DETAIL_TEXT_STYLES = {
+    "section": {"font": ('Arial', 14, 'bold'), "foreground": '#2ecc71', "spacing1": 10, "spacing3": 5},
+    "subpoint": {"font": ('Arial', 13), "foreground": '#bdc3c7', "spacing1": 2, "spacing3": 2},
+    "subsubpoint": {"font": ('Arial', 12), "foreground": '#95a5a6', "spacing1": 1, "spacing3": 1},
+    "text": {"font": ('Arial', 14), "foreground": '#ecf0f1', "spacing1": 2, "spacing3": 2},
+    # Пустая строка - отступ высотой 10 пикселей
+    "spacer": {"font": ('Arial', 1), "spacing3": 8},
+}
+
+# Подпункты карточек: (префикс строки, тег, отступ слева в пикселях)
+THREAT_DETAIL_LEVELS = (("  •", "subpoint", 50), ("    -", "subsubpoint", 70))
+DETAIL_LEVELS = (("  -", "subpoint", 30),)
+
+
+def detail_tag(line, levels):
+    """Тег уровня строки подробностей"""
+    if line.strip() == "":
+        return "spacer"
+    for prefix, tag, _ in levels:
+        if line.startswith(prefix):
+            return tag
+    if ":" in line:
+        # Заголовок раздела с эмодзи
+        return "section"
+    return "text"
+
+
+def create_details_text(parent, details, levels=DETAIL_LEVELS, bg='#2c3e50'):
+    """Подробности карточки в одном Text только для чтения вместо Label на каждую строку"""
+    font = DETAIL_TEXT_STYLES["text"]["font"]
+    text = tk.Text(parent, bg=bg, bd=0, highlightthickness=0, relief='flat',
+                   wrap=tk.WORD, width=60, height=1, font=font,
+                   cursor='arrow', takefocus=0, padx=0, pady=0)
+    for tag, style in DETAIL_TEXT_STYLES.items():
+        text.tag_configure(tag, **style)
+    for _, tag, indent in levels:
+        text.tag_configure(tag, lmargin1=indent, lmargin2=indent)
+    
+    # Вся вставка одним вызовом: пары (строка, тег) подряд
+    chunks = []
+    for detail in details:
+        chunks.extend((detail + "\n", detail_tag(detail, levels)))
+    if chunks:
+        chunks[-2] = chunks[-2][:-1]
+        text.insert("1.0", *chunks)
+    text.configure(state='disabled')
+    
+    linespace = tkfont.Font(root=text, font=font).metrics('linespace')
+    
+    def fit_height(event=None):
+        # Высота по содержимому с учетом переноса строк при текущей ширине
+        pixels = text.count("1.0", "end", "update", "ypixels")
+        if isinstance(pixels, tuple):
+            pixels = pixels[0]
+        lines = max(1, math.ceil((pixels or 0) / linespace))
+        if int(text.cget('height')) != lines:
+            text.configure(height=lines)
+    
+    text.bind("<Configure>", fit_height)
+    fit_height()
+    return text
+
+
+CARD_BG = '#34495e'
+CARD_HOVER_BG = '#2c3e50'
+DETAILS_BG = '#2c3e50'
+
+
+def card_value(value, data):
+    """Значение шаблона: строка '$поле' берется из данных карточки, остальное - как есть"""
+    if isinstance(value, str) and value.startswith("$"):
+        return data[value[1:]]
+    return value
+
+
+# Элементы карточек: функция создает виджеты и возвращает функцию их заполнения
+# данными карточки, поэтому построенную карточку можно переиспользовать для других данных
+
+def card_icon(parent, bg, field, font):
+    label = tk.Label(parent, font=font, fg='white')
+    label.pack(side=tk.LEFT)
+    return lambda data: label.config(text=card_value(field, data), bg=card_value(bg, data))
+
+
+def card_title(parent, bg, field, font, padx=0):
+    label = tk.Label(parent, font=font, fg='white')
+    label.pack(side=tk.LEFT, padx=padx)
+    return lambda data: label.config(text=card_value(field, data), bg=card_value(bg, data))
+
+
+def card_badge(parent, field, color):
+    label = tk.Label(parent, font=('Arial', 12, 'bold'), fg='white', padx=12, pady=6)
+    label.pack(side=tk.RIGHT)
+    return lambda data: label.config(text=card_value(field, data), bg=card_value(color, data))
+
+
+def card_field(parent, bg, title, color, field):
+    """Строка 'заголовок: значение'"""
+    row = tk.Frame(parent, bg=bg)
+    row.pack(fill=tk.X, pady=8)
+    tk.Label(row, text=title, font=('Arial', 14, 'bold'), bg=bg, fg=color,
+             anchor='w').pack(side=tk.LEFT)
+    value = tk.Label(row, font=('Arial', 14), bg=bg, fg='#ecf0f1', anchor='w')
+    value.pack(side=tk.LEFT, padx=(10, 0), fill=tk.X, expand=True)
+    return lambda data: value.config(text=card_value(field, data))
+
+
+def card_rows(parent, bg, create):
+    """Список строк переменной длины: лишние строки удаляются, недостающие создаются"""
+    holder = tk.Frame(parent, bg=bg)
+    holder.pack(fill=tk.X)
+    rows = []
+    
+    def resize(count):
+        while len(rows) < count:
+            rows.append(create(holder, len(rows)))
+        while len(rows) > count:
+            rows.pop()[0].destroy()
+        return rows
+    return resize
+
+
+def card_lines(parent, bg, field, font, pady):
+    """По строке на элемент списка"""
+    def create(holder, index):
+        label = tk.Label(holder, font=font, bg=bg, fg='#ecf0f1', anchor='w')
+        label.pack(fill=tk.X, pady=pady)
+        return (label,)
+    resize = card_rows(parent, bg, create)
+    
+    def update(data):
+        lines = card_value(field, data)
+        for (label,), line in zip(resize(len(lines)), lines):
+            label.config(text=line)
+    return update
+
+
+def card_label(parent, bg, text, font, fg, pack):
+    """Текст по шаблону str.format с полями карточки"""
+    label = tk.Label(parent, font=font, bg=bg, fg=fg, anchor='w', justify=tk.LEFT)
+    label.pack(**pack)
+    return lambda data: label.config(text=text.format_map(data))
+
+
+def card_numbered(parent, bg, field, color):
+    """Нумерованный список"""
+    def create(holder, index):
+        row = tk.Frame(holder, bg=bg)
+        row.pack(fill=tk.X, pady=6)
+        number = tk.Label(row, text=f"{index+1}.", font=('Arial', 14, 'bold'), bg=bg)
+        number.pack(side=tk.LEFT)
+        text = tk.Label(row, font=('Arial', 14), bg=bg, fg='#ecf0f1', anchor='w', justify=tk.LEFT)
+        text.pack(side=tk.LEFT, padx=10, fill=tk.X, expand=True)
+        return row, number, text
+    resize = card_rows(parent, bg, create)
+    
+    def update(data):
+        items = card_value(field, data)
+        for (row, number, text), item in zip(resize(len(items)), items):
+            number.config(fg=card_value(color, data))
+            text.config(text=item)
+    return update
+
+
+# Вид элемента -> (функция построения, нужен ли ей фон родителя)
+CARD_ITEMS = {
+    "icon": (card_icon, True),
+    "title": (card_title, True),
+    "badge": (card_badge, False),
+    "field": (card_field, True),
+    "lines": (card_lines, True),
+    "label": (card_label, True),
+    "numbered": (card_numbered, True),
+}
+
+HEADER_INNER = {"fill": tk.BOTH, "expand": True, "padx": 15, "pady": 10}
+
+# Шаблоны расширяемых карточек вкладок: элементы - (вид из CARD_ITEMS, аргументы...)
+CARD_TEMPLATES = {
+    "threats": {
+        "card": {"height": 285, "bd": 2},
+        "header": {"bg": '#2c3e50', "height": 70, "pad": 3,
+                   "inner": {"fill": tk.X, "padx": 15, "pady": 5},
+                   "items": [("icon", "$icon", ('Arial', 16)),
+                             ("title", "$title", ('Arial', 16, 'bold'), 10),
+                             ("badge", "$priority", "$priority_color")]},
+        "body": {"padx": 20, "pady": 15,
+                 "items": [("field", "🎯 Объект:", '#3498db', "$target"),
+                           ("field", "💥 Сценарий:", '#e74c3c', "$scenario"),
+                           ("field", "🛡️ Защита:", '#2ecc71', "$protection")]},
+        "button": '#3498db',
+        "details": {"title": "🔍 Детальный анализ угрозы и противодействия:",
+                    "accent": "$priority_color", "levels": THREAT_DETAIL_LEVELS},
+    },
+    "measures": {
+        "card": {"height": 315, "bd": 2},
+        "header": {"bg": "$color", "height": 60, "pad": 3, "inner": HEADER_INNER,
+                   "items": [("title", "$title", ('Arial', 16, 'bold'))]},
+        "body": {"padx": 20, "pady": 18,
+                 "items": [("lines", "$measures", ('Arial', 15), 6)]},
+        "button": "$color",
+        "details": {"title": "📋 Подробная информация о мерах защиты:",
+                    "accent": "$color", "levels": DETAIL_LEVELS},
+    },
+    "technical": {
+        "card": {"height": 250, "bd": 3},
+        "header": {"bg": '#3498db', "height": 60, "pad": 4, "inner": HEADER_INNER,
+                   "items": [("title", "$group", ('Arial', 18, 'bold'))]},
+        "body": {"padx": 25, "pady": 20,
+                 "items": [("label", "🎯 Основное: {main}", ('Arial', 15, 'bold'), '#2ecc71',
+                            {"fill": tk.X, "pady": (0, 12)}),
+                           ("label", "📋 Альтернативы:\n{alt}", ('Arial', 14), '#bdc3c7',
+                            {"fill": tk.BOTH, "expand": True})]},
+        "button": '#3498db',
+        "details": {"title": "📋 Подробная информация и спецификации:",
+                    "accent": '#3498db', "levels": DETAIL_LEVELS},
+    },
+    "requirements": {
+        "card": {"height": 320, "bd": 2},
+        "header": {"bg": "$color", "height": 70, "pad": 3, "inner": HEADER_INNER,
+                   "items": [("icon", "$icon", ('Arial', 22)),
+                             ("title", "$category", ('Arial', 18, 'bold'), 12)]},
+        "body": {"padx": 20, "pady": 18,
+                 "items": [("numbered", "$requirements", "$color")]},
+        "button": "$color",
+        "details": {"title": "📋 Подробная информация и спецификации:",
+                    "accent": "$color", "levels": DETAIL_LEVELS},
+    },
+}
+
+
+def compile_card_template(template):
+    """Шаблон карточки -> план: элементы заменены готовыми функциями построения"""
+    def step(build, uses_bg, args):
+        if uses_bg:
+            return lambda parent, bg: build(parent, bg, *args)
+        return lambda parent, bg: build(parent, *args)
+    
+    def steps(items):
+        return [step(*CARD_ITEMS[kind], args) for kind, *args in items]
+    
+    plan = dict(template)
+    plan["header_steps"] = steps(template["header"]["items"])
+    plan["body_steps"] = steps(template["body"]["items"])
+    return plan
+
+
+class CardEngine:
+    """Расширяемые карточки всех вкладок по декларативным шаблонам.
+
+    Шаблон компилируется в план один раз; состояние карточек, кэш панелей
+    подробностей и раскладка общие для всех вкладок. Построенная карточка
+    (слот) заполняется данными через bind и может быть заполнена заново.
+    """
+    
+    def __init__(self, panels, layout, hover=None, templates=CARD_TEMPLATES):
+        self.templates = templates
+        self.panels = panels
+        # Упаковка откладывается до прохода раскладки, поэтому раскрытость - по состоянию карточек
+        panels.is_open = self.is_expanded
+        self.layout = layout
+        self.hover = hover
+        self.plans = {}
+        # (вид, id) -> слот карточки с ее состоянием
+        self.cards = {}
+        self.created = 0
+        
+    def is_expanded(self, key):
+        return key in self.cards and self.cards[key]["expanded"]
+        
+    def plan(self, kind):
+        if kind not in self.plans:
+            self.plans[kind] = compile_card_template(self.templates[kind])
+        return self.plans[kind]
+        
+    def create(self, kind, parent):
+        """Пустая карточка с кнопкой раскрытия в правом нижнем углу"""
+        plan = self.plan(kind)
+        slot = {"kind": kind, "key": None, "data": None, "expanded": False}
+        updaters = []
+        card_container = tk.Frame(parent, bg='#ecf0f1')
+        
+        # Основная карточка
+        card = tk.Frame(card_container, bg=CARD_BG, relief='raised', width=900, cursor="arrow",
+                        **plan["card"])
         card.pack_propagate(False)
+        card.pack(fill=tk.X)
         
-        num_frame = tk.Frame(card, bg='#3498db', width=80, height=80)
-        num_frame.pack_propagate(False)
-        num_frame.pack(side=tk.LEFT, padx=25, pady=25)
+        # Заголовок карточки
+        header = plan["header"]
+        header_frame = tk.Frame(card, height=header["height"])
+        header_frame.pack_propagate(False)
+        header_frame.pack(fill=tk.X, padx=header["pad"], pady=header["pad"])
+        header_content = tk.Frame(header_frame)
+        header_content.pack(**header["inner"])
         
-        num_label = tk.Label(num_frame, text=number, font=('Arial', 28, 'bold'),
-                            bg='#3498db', fg='white')
-        num_label.pack(expand=True)
+        def paint_header(data):
+            color = card_value(header["bg"], data)
+            for frame in (header_frame, header_content):
+                frame.config(bg=color)
         
-        text_frame = tk.Frame(card, bg='#34495e')
-        text_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=20, pady=25)
+        updaters.append(paint_header)
+        updaters.extend(step(header_content, header["bg"]) for step in plan["header_steps"])
         
-        title_label = tk.Label(text_frame, text=title, font=('Arial', 18, 'bold'),
-                              bg='#34495e', fg='#3498db', anchor='w')
-        title_label.pack(fill=tk.X, pady=(0, 15))
+        # Содержимое карточки
+        content_frame = tk.Frame(card, bg=CARD_BG)
+        content_frame.pack(fill=tk.BOTH, expand=True, padx=plan["body"]["padx"], pady=plan["body"]["pady"])
+        updaters.extend(step(content_frame, CARD_BG) for step in plan["body_steps"])
         
-        desc_label = tk.Label(text_frame, text=description, font=('Arial', 15),
-                             bg='#34495e', fg='#ecf0f1', anchor='w', justify=tk.LEFT)
-        desc_label.pack(fill=tk.BOTH, expand=True)
+        # Кнопка раскрытия в правом нижнем углу
+        expand_btn_frame = tk.Frame(card, bg=CARD_BG)
+        expand_btn_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=10)
+        expand_btn = tk.Button(expand_btn_frame, text="▼", font=('Arial', 11, 'bold'), fg='white',
+                               relief='raised', bd=2, padx=15, pady=6,
+                               command=lambda: self.toggle(slot["key"]))
+        expand_btn.pack(side=tk.RIGHT)
+        updaters.append(lambda data: expand_btn.config(bg=card_value(plan["button"], data)))
         
-        self.add_hover_effect(card, '#34495e', '#2c3e50')
+        # Контейнер для подробной информации
+        details_container = tk.Frame(card_container, bg=DETAILS_BG, relief='sunken', bd=1)
+        
+        slot.update(card_container=card_container, details_container=details_container,
+                    button=expand_btn, updaters=updaters)
+        if self.hover is not None:
+            self.hover(card, CARD_BG, CARD_HOVER_BG)
+        self.created += 1
+        return slot
+        
+    def bind(self, slot, data):
+        """Заполнение карточки данными (в том числе повторное - при переиспользовании)"""
+        if slot["key"] is not None:
+            self.release(slot)
+        key = (slot["kind"], data["id"])
+        slot.update(key=key, data=data, expanded=False)
+        for update in slot["updaters"]:
+            update(data)
+        self.cards[key] = slot
+        return slot
+        
+    def release(self, slot):
+        """Отвязка карточки от данных: панель подробностей старых данных уничтожается"""
+        if slot["expanded"]:
+            slot["details_container"].pack_forget()
+            slot["button"].config(text="▼")
+        self.panels.discard(slot["key"])
+        self.cards.pop(slot["key"], None)
+        slot.update(key=None, data=None, expanded=False)
+        
+    def build(self, kind, parent, data):
+        """Карточка с данными (без упаковки в parent)"""
+        return self.bind(self.create(kind, parent), data)["card_container"]
+        
+    def build_all(self, kind, columns, items, pady=10):
+        """Карточки по столбцам поочередно; сначала строятся все, затем одна упаковка"""
+        containers = [self.build(kind, columns[i % len(columns)], data) for i, data in enumerate(items)]
+        for container in containers:
+            container.pack(fill=tk.X, pady=pady)
+        return containers
+        
+    def toggle(self, key):
+        """Переключение состояния расширения карточки"""
+        card_data = self.cards[key]
+        if card_data["expanded"]:
+            self.layout.forget(card_data["details_container"])
+            card_data["button"].config(text="▼")
+            card_data["expanded"] = False
+        else:
+            self.show_details(key)
+            card_data["button"].config(text="▲")
+            card_data["expanded"] = True
+        if card_data.get("on_resize"):
+            # Один и тот же вызов на карточку - частые переключения схлопываются в проходе раскладки
+            self.layout.after_layout(card_data["on_resize"])
+            
+    def show_details(self, key):
+        """Показ панели подробностей: построение при первом раскрытии, далее из кэша"""
+        if self.panels.get(key) is None:
+            self.panels.put(key, self.build_details(key))
+        # Отображаем контейнер с подробностями ПОД основной карточкой (в общем проходе раскладки)
+        self.layout.pack(self.cards[key]["details_container"], fill=tk.X, pady=(5, 0))
+        
+    def build_details(self, key):
+        """Построение панели подробной информации"""
+        card_data = self.cards[key]
+        details = self.plan(key[0])["details"]
+        accent = card_value(details["accent"], card_data["data"])
+        
+        details_content = tk.Frame(card_data["details_container"], bg=DETAILS_BG)
+        details_content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
-        return card
-
-    def create_threats_tab(self):
-        """Вкладка с угрозами - с расширяемыми блоками"""
-        container, threats_frame, canvas = self.create_scrollable_frame(self.notebook)
-        self.notebook.add(container, text="⚠️ Анализ угроз")
+        # Разделитель и заголовок
+        tk.Frame(details_content, bg=accent, height=2).pack(fill=tk.X, pady=(0, 20))
+        tk.Label(details_content, text=details["title"], font=('Arial', 16, 'bold'),
+                 bg=DETAILS_BG, fg=accent, anchor='w').pack(fill=tk.X, pady=(0, 15))
         
-        title = tk.Label(threats_frame, text="Анализ угроз безопасности", 
-                        font=('Arial', 28, 'bold'),
-                        bg='#ecf0f1', fg='#2c3e50')
-        title.pack(pady=20)
+        # Подробности одним текстовым виджетом
+        details_text = create_details_text(details_content, card_data["data"].get("details", []),
+                                           details["levels"], bg=DETAILS_BG)
+        details_text.pack(fill=tk.X)
         
-        self.create_expandable_threats_cards(threats_frame)
+        # Кнопка закрытия
+        close_frame = tk.Frame(details_content, bg=DETAILS_BG)
+        close_frame.pack(fill=tk.X, pady=(20, 0))
+        close_btn = tk.Button(close_frame, text="✕ Свернуть", font=('Arial', 12, 'bold'),
+                              bg='#e74c3c', fg='white', relief='raised', bd=2,
+                              padx=15, pady=8, command=lambda: self.toggle(key))
+        close_btn.pack(side=tk.RIGHT)
         
-    def create_expandable_threats_cards(self, parent):
-        """Создание расширяемых карточек угроз с использованием pack"""
-        main_container = ttk.Frame(parent, style='Light.TFrame')
-        main_container.pack(fill=tk.BOTH, expand=True, padx=25, pady=15)
+        return details_content
+
+
+# Списки с таким числом карточек и больше строятся виртуализированными
+VIRTUAL_LIST_THRESHOLD = 40
+
+
+class VirtualCardList:
+    """Виртуализированный список карточек внутри прокручиваемого фрейма.
+
+    Фрейм списка имеет полную высоту содержимого, но карточки строятся только
+    для строк, пересекающих видимую область канваса (плюс overscan строк сверху
+    и снизу). Ушедшие из вида свернутые карточки переиспользуются для новых строк.
+    """
+    
+    def __init__(self, parent, canvas, scroll_listeners, engine, kind, items, columns=2, overscan=1, pady=10):
+        self.canvas = canvas
+        self.engine = engine
+        self.kind = kind
+        self.items = items
+        self.columns = columns
+        self.overscan = overscan
+        self.pady = pady
+        # Высота свернутой карточки известна из шаблона; раскрытые измеряются
+        self.card_height = engine.plan(kind)["card"]["height"]
+        self.heights = {}
+        self.offsets = []
+        self.visible = {}
+        self.free = []
+        self.frame = tk.Frame(parent, bg='#ecf0f1', width=columns * 916)
+        self.frame.pack_propagate(False)
+        self.relayout()
+        # Прокрутка и изменение размеров - одно обновление за проход раскладки
+        scroll_listeners.append(lambda: engine.layout.after_layout(self.refresh))
+        engine.layout.after_layout(self.refresh)
+        
+    def relayout(self):
+        """Смещения строк и полная высота списка"""
+        self.offsets = [0]
+        for row in range(math.ceil(len(self.items) / self.columns)):
+            indices = range(row * self.columns, min((row + 1) * self.columns, len(self.items)))
+            height = max(self.heights.get(index, self.card_height) for index in indices)
+            self.offsets.append(self.offsets[-1] + height + 2 * self.pady)
+        self.frame.configure(height=max(self.offsets[-1], 1))
+        for index, slot in self.visible.items():
+            self.place(index, slot)
+            
+    def place(self, index, slot):
+        row, column = divmod(index, self.columns)
+        slot["card_container"].place(relx=column / self.columns, relwidth=1 / self.columns,
+                                     x=8, width=-16, y=self.offsets[row] + self.pady)
+        
+    def visible_rows(self):
+        """Диапазон строк, пересекающих видимую область канваса, с запасом"""
+        top = self.canvas.canvasy(0) - self.frame.winfo_y()
+        bottom = top + self.canvas.winfo_height()
+        first = max(bisect.bisect_right(self.offsets, top) - 1 - self.overscan, 0)
+        last = min(bisect.bisect_left(self.offsets, bottom) + self.overscan, len(self.offsets) - 1)
+        return range(first, last)
+        
+    def refresh(self):
+        """Построение видимых карточек и переиспользование ушедших из вида"""
+        wanted = {index for row in self.visible_rows()
+                  for index in range(row * self.columns, min((row + 1) * self.columns, len(self.items)))}
+        for index in list(self.visible):
+            slot = self.visible[index]
+            # Раскрытая карточка остается на месте до сворачивания
+            if index not in wanted and not slot["expanded"]:
+                del self.visible[index]
+                slot["card_container"].place_forget()
+                self.free.append(slot)
+        for index in sorted(wanted - set(self.visible)):
+            slot = self.free.pop() if self.free else self.engine.create(self.kind, self.frame)
+            slot["on_resize"] = functools.partial(self.on_resize, index, slot)
+            self.engine.bind(slot, self.items[index])
+            self.heights.pop(index, None)
+            self.visible[index] = slot
+            self.place(index, slot)
+            
+    def on_resize(self, index, slot):
+        """Карточка раскрыта или свернута - пересчет смещений строк"""
+        if slot["expanded"]:
+            slot["card_container"].update_idletasks()
+            self.heights[index] = slot["card_container"].winfo_reqheight()
+        else:
+            self.heights.pop(index, None)
+        self.relayout()
+
+
+def profiled_phase(method):
+    """Декоратор: замер метода как фазы запуска через self.profiler"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.profiler.phase(method.__name__):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class VoIPSecurityGuide:
+    def __init__(self, root, prefetch_tabs=True, profiler=None, detail_cache_limit=None,
+                 virtual_threshold=VIRTUAL_LIST_THRESHOLD):
+        self.root = root
+        self.profiler = profiler or StartupProfiler(root)
+        self.startup_callbacks = []
+        self.prefetch_tabs = prefetch_tabs
+        self.detail_panels = DetailPanelCache(detail_cache_limit)
+        self.virtual_threshold = virtual_threshold
+        with self.profiler.phase("__init__"):
+            self.init_interface()
+        self.root.after_idle(self.on_first_idle)
+        
+    def init_interface(self):
+        """Создание интерфейса приложения"""
+        root = self.root
+        self.root.title("🔒 Справочник по безопасности VoIP - Кейс 'Искра Технологии'")
         
-        # Создаем два столбца
-        left_frame = ttk.Frame(main_container, style='Light.TFrame')
-        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=8)
+        # Автоматическое полноэкранное отображение
+        self.root.attributes('-fullscreen', True)
+        self.root.configure(bg='#2c3e50')
         
-        right_frame = ttk.Frame(main_container, style='Light.TFrame')
-        right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=8)
+        # Добавляем кнопку выхода из полноэкранного режима (опционально)
+        self.root.bind("<F11>", self.toggle_fullscreen)
+        self.root.bind("<Escape>", self.exit_fullscreen)
         
-        # ПОЛНЫЙ СПИСОК УГРОЗ согласно разделу 2 пояснительной записки
-        threats_data = [
-            {
-                "id": "threat_confidentiality",
-                "icon": "🔒",
-                "title": "Нарушения конфиденциальности",
-                "priority": "Высокий",
-                "priority_color": "#e74c3c",
-                "target": "Голосовой трафик (RTP), сигнальная информация (SIP, WebRTC), базы данных",
-                "scenario": "Перехват трафика, несанкционированный доступ к системам управления",
-                "protection": "Шифрование SRTP/TLS, MFA аутентификация, контроль доступа",
-                "details": [
-                    "🎯 Согласно Федеральному закону №187-ФЗ и п. 18 Приказа ФСТЭК №239:",
-                    "  • Перехват голосового трафика (медиапотоков RTP) в сегментах сети",
-                    "  • Несанкционированный доступ к базам данных системы управления, программного коммутатора и Web-портала",
-                    "  • Копирование конфигурационных файлов критических компонентов через уязвимые сервисы",
-                    "  • Утечка персональных данных абонентов, правил маршрутизации и биллинговой информации",
-                    "",
-                    "🛡️ Меры противодействия в соответствии с требованиями:",
-                    "  • Внедрение сквозного шифрования SRTP для медиатрафика",
-                    "  • Использование TLS для SIP-сигнализации (SIP over TLS)",
-                    "  • Многофакторная аутентификация для доступа к системам управления",
-                    "  • Сегментация сети и изоляция критичных компонентов",
-                    "  • Регулярный аудит доступа и мониторинг подозрительной активности"
-                ]
-            },
-            {
-                "id": "threat_integrity", 
-                "icon": "⚖️",
-                "title": "Нарушения целостности",
-                "priority": "Критический",
-                "priority_color": "#e74c3c",
-                "target": "Сигнальные сообщения, конфигурации оборудования, программное обеспечение",
-                "scenario": "Модификация SIP-сообщений, изменение конфигураций, внедрение вредоносного ПО",
-                "protection": "SBC валидация, контроль целостности, антивирусная защита",
-                "details": [
-                    "🎯 Согласно п. 18 Приказа ФСТЭК России №239:",
-                    "  • Модификация сигнальных сообщений (SIP) для перенаправления вызовов",
-                    "  • Изменение конфигурации сетевого оборудования через уязвимые протоколы",
-                    "  • Внедрение вредоносного ПО в операционные системы виртуальных машин",
-                    "  • Спуфинг абонентов и маскировка под легитимных пользователей",
-                    "",
-                    "🛡️ Меры противодействия согласно требованиям регуляторов:",
-                    "  • Валидация SIP-сообщений с использованием SBC",
-                    "  • Контроль целостности файлов и конфигураций (HIDS)",
-                    "  • Регулярное обновление ПО и устранение уязвимостей",
-                    "  • Использование защищенных протоколов управления (SSH, SNMPv3)",
-                    "  • Мониторинг изменений конфигураций в реальном времени"
-                ]
-            },
-            {
-                "id": "threat_availability",
-                "icon": "🚨", 
-                "title": "Нарушения доступности",
-                "priority": "Критический",
-                "priority_color": "#e74c3c",
-                "target": "Программный коммутатор, SBC, медиашлюзы, каналы связи",
-                "scenario": "DDoS атаки, исчерпание ресурсов, блокирование систем управления",
-                "protection": "Anti-DDoS системы, резервирование, мониторинг доступности",
-                "details": [
-                    "🎯 Согласно п. 19 Приказа ФСТЭК России №239:",
-                    "  • Распределенные атаки типа 'отказ в обслуживании' на ключевые элементы",
-                    "  • Исчерпание ресурсов системы целевыми атаками на VoIP-протоколы",
-                    "  • Блокирование работы через компрометацию системы управления",
-                    "  • Флуд SIP-INVITE и REGISTER-сообщениями",
-                    "",
-                    "🛡️ Меры противодействия для обеспечения устойчивости КИИ:",
-                    "  • Внедрение специализированных Anti-DDoS систем",
-                    "  • Резервирование критичных компонентов (SBC, коммутаторы)",
-                    "  • Настройка лимитов и rate limiting для SIP-сообщений",
-                    "  • Мониторинг доступности ключевых сервисов в реальном времени",
-                    "  • Планирование восстановления после инцидентов"
-                ]
-            },
-            {
-                "id": "threat_vulnerabilities",
-                "icon": "🕷️",
-                "title": "Уязвимости ПО и инфраструктуры", 
-                "priority": "Высокий",
-                "priority_color": "#e67e22",
-                "target": "ОС Linux, системы виртуализации KVM, прикладное ПО",
-                "scenario": "Эксплуатация уязвимостей, использование закладок в ПО",
-                "protection": "Регулярное обновление, контроль целостности, безопасная настройка",
-                "details": [
-                    "🎯 На основе 'Банка данных угроз безопасности информации' ФСТЭК:",
-                    "  • Эксплуатация уязвимостей в ОС и системах виртуализации KVM",
-                    "  • Использование 'закладок' в стороннем прикладном ПО",
-                    "  • Несанкционированный доступ к системе управления виртуализацией",
-                    "  • Компрометация всей программно-аппаратной платформы",
-                    "",
-                    "🛡️ Меры противодействия для защиты инфраструктуры:",
-                    "  • Регулярное обновление ПО и применение патчей безопасности",
-                    "  • Контроль целостности системного и прикладного ПО",
-                    "  • Безопасная настройка (hardening) ОС и гипервизоров",
-                    "  • Сегментация и изоляция виртуальной инфраструктуры",
-                    "  • Мониторинг уязвимостей и управление исправлениями"
-                ]
-            },
-            {
-                "id": "threat_authentication",
-                "icon": "🔑",
-                "title": "Компрометация аутентификации",
-                "priority": "Высокий", 
-                "priority_color": "#e67e22",
-                "target": "Учетные записи, системы аутентификации, Web-порталы",
-                "scenario": "Подбор учетных данных, перехват паролей, эксплуатация уязвимостей",
-                "protection": "MFA, RBAC, безопасные протоколы, WAF",
-                "details": [
-                    "🎯 Угрозы аутентификации и несанкционированного доступа:",
-                    "  • Взлом веб-портала управления через уязвимости веб-приложений",
-                    "  • Подбор учетных данных (Brute-force) к интерфейсам управления",
-                    "  • Перехчет паролей при использовании незашифрованных протоколов",
-                    "  • Компрометация учетных записей администраторов",
-                    "",
-                    "🛡️ Меры защиты систем аутентификации:",
-                    "  • Внедрение многофакторной аутентификации (MFA)",
-                    "  • Использование ролевой модели доступа (RBAC)",
-                    "  • Замена небезопасных протоколов на SSH, HTTPS, SNMPv3",
-                    "  • Внедрение WAF для защиты веб-интерфейсов",
-                    "  • Мониторинг и блокировка подозрительных попыток входа"
-                ]
-            },
-            {
-                "id": "threat_social",
-                "icon": "🎭",
-                "title": "Социальная инженерия",
-                "priority": "Средний",
-                "priority_color": "#f1c40f",
-                "target": "Персонал, пользователи, доверие к системе",
-                "scenario": "Vishing-атаки через подмену номера, фишинг",
-                "protection": "Обучение пользователей, валидация Caller ID, мониторинг",
-                "details": [
-                    "🎯 Угрозы целостности и доверия к данным:",
-                    "  • Подмена идентификатора вызывающего номера (Caller ID Spoofing)",
-                    "  • Vishing-атаки через социальную инженерию",
-                    "  • Фишинг атаки на сотрудников и администраторов",
-                    "  • Злоупотребление доверием к системе связи",
-                    "",
-                    "🛡️ Противодействие социальной инженерии:",
-                    "  • Обучение и информирование пользователей о угрозах",
-                    "  • Валидация Caller ID на уровне SBC и сигнализации",
-                    "  • Мониторинг подозрительных вызовов и паттернов",
-                    "  • Внедрение систем обнаружения мошеннических вызовов",
-                    "  • Создание культуры безопасности в организации"
-                ]
-            }
-        ]
+        # Переменные для масштабирования
+        self.scale_factor = 1.0
+        self.min_scale = 0.5
+        self.max_scale = 3.0
+        self.last_scale = 1.0
+        # Масштаб вписывания схемы в канвас (без пользовательского scale_factor)
+        self.fit_scale = 1.0
+        self.canvas_width = 0
+        self.canvas_height = 0
+        self.pan_x = 0
+        self.pan_y = 0
+        self.view_origin = None
+        self.drag_origin = None
         
-        # Распределяем карточки по двум столбцам
-        for i, threat in enumerate(threats_data):
-            if i % 2 == 0:
-                # Четные индексы - левый столбец
-                card = self.create_expandable_threat_card(left_frame, threat)
-                card.pack(fill=tk.X, pady=10)
-            else:
-                # Нечетные индексы - правый столбец
-                card = self.create_expandable_threat_card(right_frame, threat)
-                card.pack(fill=tk.X, pady=10)
-    
-    def create_expandable_threat_card(self, parent, threat_data):
-        """Создание расширяемой карточки угрозы с кнопкой раскрытия в правом нижнем углу"""
-        card_container = tk.Frame(parent, bg='#ecf0f1')
+        # Переменные для анимации угроз
+        self.current_threat = None
+        self.protection_active = False
+        self.frame_clock = FrameClock(self.root)
+        self.scenario = None
         
-        # Основная карточка
-        card = tk.Frame(card_container, bg='#34495e', relief='raised', bd=2, 
-                       height=285, width=900, cursor="arrow")
-        card.pack_propagate(False)
-        card.pack(fill=tk.X)
+        # Расширяемые карточки вкладок (общее состояние и кэш подробностей)
+        self.layout = LayoutBatcher(self.root)
+        self.tooltips = TooltipManager(self.root)
+        self.cards = CardEngine(self.detail_panels, self.layout, hover=self.add_hover_effect)
         
-        # Заголовок карточки
-        header_frame = tk.Frame(card, bg='#2c3e50', height=70)
-        header_frame.pack_propagate(False)
-        header_frame.pack(fill=tk.X, padx=3, pady=3)
+        # Содержимое вкладок (разделы загружаются по требованию)
+        self.content = ContentStore()
         
-        # Верхняя часть заголовка
-        top_header = tk.Frame(header_frame, bg='#2c3e50')
-        top_header.pack(fill=tk.X, padx=15, pady=5)
+        # Ленивое построение вкладок: заглушка -> функция построения
+        self.pending_tabs = {}
+        self.prefetch_delay = 50
         
-        icon_frame = tk.Frame(top_header, bg='#2c3e50')
-        icon_frame.pack(side=tk.LEFT)
+        # Стили
+        self.setup_styles()
         
-        icon_label = tk.Label(icon_frame, text=threat_data["icon"], 
-                             font=('Arial', 16), bg='#2c3e50', fg='white')
-        icon_label.pack(side=tk.LEFT)
+        # Переменные для изображения
+        self.scheme_image = None
+        self.photo = None
+        self.assets = AssetManager()
+        self.scheme_asset = None
+        self.image_worker = ImageWorker(self.root)
+        self.requested_key = None
+        # Строящаяся в фоне версия схемы: (размер, ресемплинг, future)
+        self.resample_job = None
+        
+        # Двухэтапный ресемплинг при изменении размера канваса
+        self.preview_job = None
+        self.resize_job = None
+        self.resize_settle_delay = 150
+        self.preview_resample = Image.Resampling.BILINEAR
+        self.displayed_key = None
+        self.background_item = None
+        self.render_mode = "raster"
         
-        title_label = tk.Label(icon_frame, text=threat_data["title"], 
-                              font=('Arial', 16, 'bold'), bg='#2c3e50', fg='white')
-        title_label.pack(side=tk.LEFT, padx=10)
+        # Создаем основной фрейм
+        self.main_frame = ttk.Frame(root, style='Dark.TFrame')
+        self.main_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
         
-        priority_frame = tk.Frame(top_header, bg=threat_data["priority_color"])
-        priority_frame.pack(side=tk.RIGHT)
+        self.create_widgets()
+        self.load_scheme_image()
         
-        priority_label = tk.Label(priority_frame, text=threat_data["priority"], 
-                                font=('Arial', 12, 'bold'), bg=threat_data["priority_color"],
-                                fg='white', padx=12, pady=6)
-        priority_label.pack()
+        # Оверлей с отчетом о запуске
+        self.profiler_overlay = None
+        self.root.bind("<F12>", self.toggle_profiler_overlay)
+        self.hud_job = None
+        self.hud_interval = 500
+        self.hud_created = 0
+        self.root.bind("<F9>", self.toggle_performance_hud)
+        
+    def on_first_idle(self):
+        """Первый простой главного цикла: окно отрисовано"""
+        self.profiler.mark("first_idle")
+        if self.prefetch_tabs and self.pending_tabs:
+            self.root.after(self.prefetch_delay,
+                            lambda: self.root.after_idle(self.prefetch_next_tab))
+        else:
+            self.finish_startup()
+            
+    def finish_startup(self):
+        """Все вкладки построены - уведомляем подписчиков"""
+        self.profiler.mark("startup_complete")
+        for callback in self.startup_callbacks:
+            callback(self)
+            
+    def toggle_profiler_overlay(self, event=None):
+        """Показ/скрытие отчета о фазах запуска по F12"""
+        if self.profiler_overlay is not None:
+            self.profiler_overlay.destroy()
+            self.profiler_overlay = None
+            return
         
-        # Содержимое карточки
-        content_frame = tk.Frame(card, bg='#34495e')
-        content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
+        memory = self.assets.memory_usage()
+        lines = [self.profiler.format_table(), "", "Память ресурсов:"]
+        for name, usage in memory["assets"].items():
+            lines.append(f"  {name:<34}{usage['total'] / 1024:>10.0f} КБ")
+        lines.append(f"  {'Всего':<34}{memory['total'] / 1024:>10.0f} КБ")
+        
+        self.profiler_overlay = tk.Label(self.root, text="\n".join(lines),
+                                         font=('Courier', 11), bg='#1b2631', fg='#2ecc71',
+                                         justify=tk.LEFT, anchor='nw',
+                                         relief='solid', bd=1, padx=12, pady=10)
+        self.profiler_overlay.place(relx=1.0, rely=0.0, x=-20, y=20, anchor='ne')
+        
+    def toggle_performance_hud(self, event=None):
+        """Показ/скрытие HUD производительности над схемой по F9"""
+        if self.hud_job is not None:
+            self.root.after_cancel(self.hud_job)
+            self.hud_job = None
+            self.canvas.delete("hud")
+            return
+        self.hud_created = self.threat_animator.registry.created
+        self.update_performance_hud()
+        
+    def cache_stats(self):
+        """Счетчики кэшей для HUD и отчета о запуске"""
+        stats = {"detail_panels": self.detail_panels.stats()}
+        if self.scheme_asset is not None and self.scheme_asset.scaled is not None:
+            stats["scaled_images"] = self.scheme_asset.scaled.stats()
+        return stats
+        
+    def interface_stats(self):
+        """Счетчики построения интерфейса для HUD и отчета о запуске"""
+        return {"cards_created": self.cards.created, "layout_flushes": self.layout.flushes}
+        
+    def update_performance_hud(self):
+        """Обновление показателей HUD (два раза в секунду)"""
+        clock = self.frame_clock.stats()
+        registry = self.threat_animator.registry
+        items = len(self.canvas.find_all())
+        pending = len(self.root.tk.splitlist(self.root.tk.call('after', 'info')))
+        churn = (registry.created - self.hud_created) * 1000 / self.hud_interval
+        self.hud_created = registry.created
+        
+        # Последний ресемплинг - целой схемы или тайла, что было позже
+        samples = [self.tile_renderer.last_resample]
+        if self.scheme_asset is not None and self.scheme_asset.scaled is not None:
+            samples.append(self.scheme_asset.scaled.last_resample)
+        samples = [sample for sample in samples if sample is not None]
+        if samples:
+            _, resample_ms, size, resample = max(samples)
+            resample_text = f"{resample_ms:.1f} мс ({resample.name} {size[0]}x{size[1]})"
+        else:
+            resample_text = "-"
+            
+        lines = [
+            f"FPS: {clock['fps']:.0f}   кадр: {clock['tick_ms']:.1f} мс (макс. {clock['max_tick_ms']:.1f})",
+            f"Анимации: {clock['animations']}   элементы канваса: {items}",
+            f"  наложения: {len(registry)}   тайлы: {len(self.tile_renderer.items)}   создано/с: {churn:.0f}",
+            f"Отложенные after: {pending}   задачи ресемплинга: {self.image_worker.pending}",
+            f"Последний ресемплинг: {resample_text}"
+        ]
+        interface = self.interface_stats()
+        lines.append(f"Карточки: создано {interface['cards_created']}   "
+                     f"проходов раскладки {interface['layout_flushes']}")
+        caches = self.cache_stats()
+        panels = caches["detail_panels"]
+        lines.append(f"Панели подробностей: {panels['panels']}   построено {panels['builds']}   "
+                     f"повторно {panels['hits']}   вытеснено {panels['evictions']}")
+        scaled = caches.get("scaled_images")
+        if scaled is not None:
+            lines.append(f"Кэш схемы: попаданий {scaled['hits']}   промахов {scaled['misses']}   "
+                         f"версий {scaled['entries']} ({scaled['used_bytes'] / 2**20:.1f} МБ)")
+        text = "\n".join(lines)
+        
+        if not self.canvas.find_withtag("hud_text"):
+            self.canvas.create_rectangle(0, 0, 0, 0, fill='#1b2631', outline='#2ecc71', tags=("hud", "hud_box"))
+            self.canvas.create_text(14, 12, anchor=tk.NW, font=('Courier', 10), fill='#2ecc71',
+                                    tags=("hud", "hud_text"))
+        self.canvas.itemconfig("hud_text", text=text)
+        x0, y0, x1, y1 = self.canvas.bbox("hud_text")
+        self.canvas.coords("hud_box", x0 - 6, y0 - 4, x1 + 6, y1 + 4)
+        self.canvas.tag_raise("hud")
+        self.hud_job = self.root.after(self.hud_interval, self.update_performance_hud)
         
-        # Объект атаки
-        target_frame = tk.Frame(content_frame, bg='#34495e')
-        target_frame.pack(fill=tk.X, pady=8)
+    def toggle_fullscreen(self, event=None):
+        """Переключение полноэкранного режима по F11"""
+        self.root.attributes('-fullscreen', not self.root.attributes('-fullscreen'))
         
-        target_title = tk.Label(target_frame, text="🎯 Объект:", 
-                               font=('Arial', 14, 'bold'), bg='#34495e', fg='#3498db',
-                               anchor='w')
-        target_title.pack(side=tk.LEFT)
+    def exit_fullscreen(self, event=None):
+        """Выход из полноэкранного режима по Escape"""
+        self.root.attributes('-fullscreen', False)
         
-        target_text = tk.Label(target_frame, text=threat_data["target"], 
-                              font=('Arial', 14), bg='#34495e', fg='#ecf0f1',
-                              anchor='w')
-        target_text.pack(side=tk.LEFT, padx=(10, 0), fill=tk.X, expand=True)
+    @profiled_phase
+    def setup_styles(self):
+        """Настройка стилей для красивого интерфейса"""
+        style = ttk.Style()
+        style.theme_use('clam')
         
-        # Сценарий атаки
-        scenario_frame = tk.Frame(content_frame, bg='#34495e')
-        scenario_frame.pack(fill=tk.X, pady=8)
+        # Цветовая схема
+        colors = {
+            'primary': '#3498db',
+            'secondary': '#2ecc71', 
+            'accent': '#e74c3c',
+            'dark_bg': '#2c3e50',
+            'darker_bg': '#34495e',
+            'light_bg': '#ecf0f1',
+            'text_light': '#ffffff',
+            'text_dark': '#2c3e50'
+        }
         
-        scenario_title = tk.Label(scenario_frame, text="💥 Сценарий:", 
-                                font=('Arial', 14, 'bold'), bg='#34495e', fg='#e74c3c',
-                                anchor='w')
-        scenario_title.pack(side=tk.LEFT)
+        # Настройка стилей
+        style.configure('Dark.TFrame', background=colors['dark_bg'])
+        style.configure('Light.TFrame', background=colors['light_bg'])
         
-        scenario_text = tk.Label(scenario_frame, text=threat_data["scenario"], 
-                               font=('Arial', 14), bg='#34495e', fg='#ecf0f1',
-                               anchor='w')
-        scenario_text.pack(side=tk.LEFT, padx=(10, 0), fill=tk.X, expand=True)
+        style.configure('Title.TLabel', 
+                       background=colors['dark_bg'],
+                       foreground=colors['text_light'],
+                       font=('Arial', 28, 'bold'))
         
-        # Защита
-        protection_frame = tk.Frame(content_frame, bg='#34495e')
-        protection_frame.pack(fill=tk.X, pady=8)
+        style.configure('Card.TLabelframe',
+                       background=colors['darker_bg'],
+                       foreground=colors['text_light'],
+                       font=('Arial', 16, 'bold'))
         
-        protection_title = tk.Label(protection_frame, text="🛡️ Защита:", 
-                                  font=('Arial', 14, 'bold'), bg='#34495e', fg='#2ecc71',
-                                  anchor='w')
-        protection_title.pack(side=tk.LEFT)
+        style.configure('Threat.TButton',
+                       background='#e74c3c',
+                       foreground='white',
+                       font=('Arial', 14, 'bold'),
+                       padding=(14, 8))
         
-        protection_text = tk.Label(protection_frame, text=threat_data["protection"], 
-                                 font=('Arial', 14), bg='#34495e', fg='#ecf0f1',
-                                 anchor='w')
-        protection_text.pack(side=tk.LEFT, padx=(10, 0), fill=tk.X, expand=True)
+        style.configure('Protection.TButton',
+                       background='#2ecc71', 
+                       foreground='white',
+                       font=('Arial', 14, 'bold'),
+                       padding=(14, 8))
         
-        # Кнопка раскрытия в правом нижнем углу
-        expand_btn_frame = tk.Frame(card, bg='#34495e')
-        expand_btn_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=10)
+        style.map('Threat.TButton',
+                 background=[('active', '#c0392b'),
+                           ('pressed', '#a93226')])
         
-        expand_btn = tk.Button(expand_btn_frame,
-                             text="▼",
-                             font=('Arial', 11, 'bold'),
-                             bg='#3498db',
-                             fg='white',
-                             relief='raised',
-                             bd=2,
-                             padx=15,
-                             pady=6,
-                             command=lambda tid=threat_data["id"]: self.toggle_threat_card_expansion(tid))
-        expand_btn.pack(side=tk.RIGHT)
+        style.map('Protection.TButton',
+                 background=[('active', '#27ae60'),
+                           ('pressed', '#229954')])
         
-        # Контейнер для подробной информации
-        details_container = tk.Frame(card_container, bg='#2c3e50', relief='sunken', bd=1)
-        
-        # Сохраняем состояние карточки
-        self.expanded_threats_cards[threat_data["id"]] = {
-            "expanded": False,
-            "card_container": card_container,
-            "details_container": details_container,
-            "data": threat_data,
-            "button": expand_btn  # Сохраняем ссылку на кнопку
-        }
+        style.configure('Custom.TNotebook', background='#34495e')
+        style.configure('Custom.TNotebook.Tab',
+                       background='#34495e',
+                       foreground='#bdc3c7',
+                       padding=(22, 14),
+                       font=('Arial', 16))
+        style.map('Custom.TNotebook.Tab',
+                 background=[('selected', '#3498db'),
+                           ('active', '#2980b9')],
+                 foreground=[('selected', 'white'),
+                           ('active', 'white')])
         
-        self.add_hover_effect(card, '#34495e', '#2c3e50')
+    def create_widgets(self):
+        # Заголовок
+        self.create_header()
         
-        return card_container
-
-    def toggle_threat_card_expansion(self, card_id):
-        """Переключение состояния расширения карточки угрозы - ОБНОВЛЕННАЯ ВЕРСИЯ"""
-        card_data = self.expanded_threats_cards[card_id]
+        # Создаем Notebook
+        self.create_notebook()
         
-        if card_data["expanded"]:
-            # Скрываем подробности
-            card_data["details_container"].pack_forget()
-            card_data["button"].config(text="▼")
-            card_data["expanded"] = False
-        else:
-            # Показываем подробности
-            self.show_threat_details(card_id)
-            card_data["button"].config(text="▲")
-            card_data["expanded"] = True
-    
-    def show_threat_details(self, card_id):
-        """Показ подробной информации об угрозе"""
-        card_data = self.expanded_threats_cards[card_id]
-        details_container = card_data["details_container"]
+        # Футер с подсказками управления
+        self.create_footer()
         
-        # Очищаем предыдущее содержимое
-        for widget in details_container.winfo_children():
-            widget.destroy()
+    @profiled_phase
+    def create_header(self):
+        """Создание заголовка"""
+        header_frame = ttk.Frame(self.main_frame, style='Dark.TFrame')
+        header_frame.pack(fill=tk.X, pady=(0, 25))
         
-        # Создаем содержимое подробной информации
-        details_content = tk.Frame(details_container, bg='#2c3e50')
-        details_content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        title_label = tk.Label(header_frame,
+                             text="🔒 Справочник по безопасности VoIP",
+                             font=('Arial', 28, 'bold'),
+                             bg='#2c3e50',
+                             fg='#3498db',
+                             pady=30)
+        title_label.pack()
         
-        # Добавляем разделитель
-        separator = tk.Frame(details_content, bg=card_data["data"].get("priority_color", "#3498db"), height=2)
-        separator.pack(fill=tk.X, pady=(0, 20))
+        subtitle_label = tk.Label(header_frame,
+                                text="Кейс: АО «Искра Технологии» • Значимый объект КИИ 3-й категории",
+                                font=('Arial', 18),
+                                bg='#2c3e50', 
+                                fg='#ecf0f1')
+        subtitle_label.pack()
         
-        # Заголовок подробной информации
-        details_title = tk.Label(details_content, 
-                               text="🔍 Детальный анализ угрозы и противодействия:",
-                               font=('Arial', 16, 'bold'),
-                               bg='#2c3e50', fg=card_data["data"].get("priority_color", "#3498db"),
-                               anchor='w')
-        details_title.pack(fill=tk.X, pady=(0, 15))
-        
-        # Добавляем подробности
-        details = card_data["data"].get("details", [])
-        for detail in details:
-            if detail.strip() == "":
-                # Пустая строка - добавляем отступ
-                tk.Frame(details_content, bg='#2c3e50', height=10).pack(fill=tk.X)
-            elif detail.startswith("  •"):
-                # Подпункт второго уровня
-                subpoint_label = tk.Label(details_content, text=detail,
-                                        font=('Arial', 13),
-                                        bg='#2c3e50', fg='#bdc3c7',
-                                        anchor='w', justify=tk.LEFT)
-                subpoint_label.pack(fill=tk.X, padx=(50, 0), pady=2)
-            elif detail.startswith("    -"):
-                # Подпункт третьего уровня
-                subsubpoint_label = tk.Label(details_content, text=detail,
-                                           font=('Arial', 12),
-                                           bg='#2c3e50', fg='#95a5a6',
-                                           anchor='w', justify=tk.LEFT)
-                subsubpoint_label.pack(fill=tk.X, padx=(70, 0), pady=1)
-            elif ":" in detail:
-                # Заголовок раздела с эмодзи
-                section_label = tk.Label(details_content, text=detail,
-                                       font=('Arial', 14, 'bold'),
-                                       bg='#2c3e50', fg='#2ecc71',
-                                       anchor='w', justify=tk.LEFT)
-                section_label.pack(fill=tk.X, pady=(10, 5))
-            else:
-                # Обычный текст
-                text_label = tk.Label(details_content, text=detail,
-                                    font=('Arial', 14),
-                                    bg='#2c3e50', fg='#ecf0f1',
-                                    anchor='w', justify=tk.LEFT)
-                text_label.pack(fill=tk.X, pady=2)
+    def create_notebook(self):
+        """Создание Notebook с вкладками (содержимое строится при первом открытии)"""
+        self.notebook = ttk.Notebook(self.main_frame, style='Custom.TNotebook')
+        self.notebook.pack(fill=tk.BOTH, expand=True)
         
-        # Кнопка закрытия
-        close_frame = tk.Frame(details_content, bg='#2c3e50')
-        close_frame.pack(fill=tk.X, pady=(20, 0))
+        # Заголовки вкладок и функции построения их содержимого
+        self.tab_specs = [
+            ("🏗️ Архитектура сети", self.create_architecture_tab),
+            ("📋 Задания кейса", self.create_tasks_tab),
+            ("⚠️ Анализ угроз", self.create_threats_tab),
+            ("🛡️ Меры защиты", self.create_measures_tab),
+            ("⚙️ Технические средства", self.create_technical_tab),
+            ("📊 Требования для КИИ", self.create_requirements_tab),
+            ("📚 НПА КИИ", self.create_regulations_tab)
+        ]
         
-        close_btn = tk.Button(close_frame, text="✕ Свернуть",
-                            font=('Arial', 12, 'bold'),
-                            bg='#e74c3c', fg='white',
-                            relief='raised', bd=2,
-                            padx=15, pady=8,
-                            command=lambda: self.toggle_threat_card_expansion(card_id))
-        close_btn.pack(side=tk.RIGHT)
+        # Каждая вкладка начинается с пустой заглушки
+        for tab_text, builder in self.tab_specs:
+            placeholder = ttk.Frame(self.notebook, style='Light.TFrame')
+            self.notebook.add(placeholder, text=tab_text)
+            self.pending_tabs[str(placeholder)] = (placeholder, builder)
         
-        # Отображаем контейнер с подробностями ПОД основной карточкой
-        details_container.pack(fill=tk.X, pady=(5, 0))
-
-    def create_measures_tab(self):
-        """Вкладка с мерами защиты с расширяемыми блоками"""
-        container, measures_frame, canvas = self.create_scrollable_frame(self.notebook)
-        self.notebook.add(container, text="🛡️ Меры защиты")
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
         
-        title = tk.Label(measures_frame, text="Система мер защиты", 
-                        font=('Arial', 28, 'bold'),
-                        bg='#ecf0f1', fg='#2c3e50')
-        title.pack(pady=20)
+        # Архитектура строится сразу, остальные - при выборе или в фоне
+        self.build_tab(self.notebook.tabs()[0])
         
-        self.create_expandable_measures_cards(measures_frame)
+    def on_tab_changed(self, event=None):
+        """Построение вкладки при первом выборе"""
+        self.build_tab(self.notebook.select())
         
-    def create_expandable_measures_cards(self, parent):
-        """Создание расширяемых карточек мер защиты - ПРАВИЛЬНАЯ СТРУКТУРА"""
-        main_container = ttk.Frame(parent, style='Light.TFrame')
-        main_container.pack(fill=tk.BOTH, expand=True, padx=25, pady=15)
+    def build_tab(self, tab_id):
+        """Построение содержимого вкладки (однократно)"""
+        entry = self.pending_tabs.pop(str(tab_id), None)
+        if entry is None:
+            return
+        placeholder, builder = entry
+        builder(placeholder)
+        
+    def prefetch_next_tab(self):
+        """Фоновое построение следующей непостроенной вкладки в простое"""
+        if self.pending_tabs:
+            self.build_tab(next(iter(self.pending_tabs)))
+        if self.pending_tabs:
+            # Пауза между вкладками, чтобы не блокировать события пользователя
+            self.root.after(self.prefetch_delay,
+                            lambda: self.root.after_idle(self.prefetch_next_tab))
+        else:
+            self.finish_startup()
         
-        left_frame = ttk.Frame(main_container, style='Light.TFrame')
-        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=8)
+    def create_scrollable_frame(self, parent):
+        """Создает прокручиваемый фрейм с канвасом, скроллбарами и списком слушателей прокрутки"""
+        # Основной фрейм для скроллинга
+        container = ttk.Frame(parent, style='Light.TFrame')
         
-        right_frame = ttk.Frame(main_container, style='Light.TFrame')
-        right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=8)
+        # Создаем канвас для скроллинга
+        canvas = tk.Canvas(container, bg='#ecf0f1', highlightthickness=0)
         
-        # ОРГАНИЗАЦИОННЫЕ МЕРЫ (Раздел 3.1 пояснительной записки)
-        org_title = tk.Label(left_frame, text="📝 ОРГАНИЗАЦИОННЫЕ МЕРЫ", 
-                            font=('Arial', 20, 'bold'),
-                            bg='#ecf0f1', fg='#2c3e50')
-        org_title.pack(pady=(0, 20))
-        
-        # 1. Разработка организационно-распорядительной документации
-        org_docs_data = {
-            "id": "org_docs",
-            "title": "📋 ОРГАНИЗАЦИОННО-РАСПОРЯДИТЕЛЬНАЯ ДОКУМЕНТАЦИЯ",
-            "color": "#2ecc71",
-            "measures": [
-                "• Политика информационной безопасности объекта КИИ",
-                "• Регламенты по безопасной настройке компонентов", 
-                "• Правила разграничения доступа",
-                "• План мероприятий по обеспечению безопасности"
-            ],
-            "details": [
-                "📄 Политика информационной безопасности (п. 6 Приказа №239):",
-                "  - Основополагающий документ, определяющий подходы и принципы защиты",
-                "  - Утверждается руководством организации",
-                "  - Определяет цели, задачи и ответственность за безопасность",
-                "  - Регулярно пересматривается и актуализируется",
-                "",
-                "⚙️ Регламенты и инструкции:",
-                "  - Регламенты по безопасной настройке всех компонентов сети",
-                "  - Инструкции по администрированию ПО коммутатора, SBC, ОС Linux",
-                "  - Процедуры настройки гипервизора KVM и сетевого оборудования",
-                "  - Документация по безопасной эксплуатации систем",
-                "",
-                "🔐 Правила разграничения доступа:",
-                "  - Основаны на принципе минимальных привилегий",
-                "  - Определяют права доступа к информационным ресурсам",
-                "  - Регламентируют доступ к системам управления",
-                "  - Устанавливают процедуры предоставления и отзыва прав",
-                "",
-                "📅 План мероприятий по безопасности (п. 10 Приказа №239):",
-                "  - Комплексный план обеспечения безопасности информации",
-                "  - Включает сроки, ответственных и ресурсы",
-                "  - Регулярно актуализируется на основе оценки рисков",
-                "  - Содержит мероприятия по всем направлениям защиты"
-            ]
-        }
+        # Вертикальный и горизонтальный скроллбары
+        v_scrollbar = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
+        h_scrollbar = ttk.Scrollbar(container, orient="horizontal", command=canvas.xview)
         
-        org_docs_card = self.create_expandable_measures_card(left_frame, org_docs_data, height=300)
-        org_docs_card.pack(fill=tk.X, pady=10)
-        
-        # 2. Управление персоналом и доступом
-        org_personnel_data = {
-            "id": "org_personnel",
-            "title": "👥 УПРАВЛЕНИЕ ПЕРСОНАЛОМ И ДОСТУПОМ",
-            "color": "#3498db", 
-            "measures": [
-                "• Регулярные проверки сотрудников",
-                "• Обучение и информирование персонала",
-                "• Оформление обязательств о неразглашении",
-                "• Контроль доступа к объекту КИИ"
-            ],
-            "details": [
-                "🔍 Проверки сотрудников (п. 11 Приказа №239):",
-                "  - Регулярное проведение проверок сотрудников, допущенных к управлению КИИ",
-                "  - Проверка в соответствии с законодательством РФ",
-                "  - Установление требований к гражданам, допускаемым к работам",
-                "  - Контроль соответствия персонала установленным требованиям",
-                "",
-                "🎓 Обучение и информирование:",
-                "  - Регулярное обучение персонала политике безопасности",
-                "  - Информирование о актуальных киберугрозах",
-                "  - Тренинги по реагированию на инциденты",
-                "  - Повышение осведомленности в области ИБ",
-                "",
-                "📝 Обязательства о неразглашении:",
-                "  - Оформление юридически значимых документов",
-                "  - Определение ответственности за разглашение информации",
-                "  - Регулярное подтверждение обязательств",
-                "  - Контроль соблюдения конфиденциальности",
-                "",
-                "🚪 Управление доступом:",
-                "  - Контроль физического доступа к объекту КИИ",
-                "  - Учет посещений критичных зон",
-                "  - Система пропусков и идентификации",
-                "  - Мониторинг действий персонала"
-            ]
-        }
+        # Прокручиваемый фрейм
+        scrollable_frame = ttk.Frame(canvas, style='Light.TFrame')
         
-        org_personnel_card = self.create_expandable_measures_card(left_frame, org_personnel_data, height=300)
-        org_personnel_card.pack(fill=tk.X, pady=10)
-        
-        # 3. Реагирование на инциденты
-        org_incidents_data = {
-            "id": "org_incidents",
-            "title": "🚨 РЕАГИРОВАНИЕ НА ИНЦИДЕНТЫ",
-            "color": "#e74c3c",
-            "measures": [
-                "• Создание группы CERT/SOC",
-                "• Разработка регламента по реагированию",
-                "• Ведение журналов инцидентов", 
-                "• Пост-инцидентный анализ"
-            ],
-            "details": [
-                "👥 Группа реагирования (п. 26 Приказа №239):",
-                "  - Создание группы реагирования на компьютерные инциденты (CERT/SOC)",
-                "  - Определение состава и полномочий группы",
-                "  - Обеспечение необходимыми ресурсами и инструментами",
-                "  - Круглосуточная готовность к реагированию",
-                "",
-                "📋 Регламент по реагированию:",
-                "  - Разработка и регулярное обновление регламента",
-                "  - Определение порядка действий при обнаружении атак",
-                "  - Процедуры эскалации инцидентов",
-                "  - Взаимодействие с внешними организациями",
-                "",
-                "📊 Ведение журналов инцидентов:",
-                "  - Систематический учет всех инцидентов безопасности",
-                "  - Фиксация времени, характера и последствий инцидентов",
-                "  - Документирование предпринятых мер",
-                "  - Формирование статистики и отчетности",
-                "",
-                "🔍 Пост-инцидентный анализ:",
-                "  - Анализ причин и последствий инцидентов",
-                "  - Выработка рекомендаций по предотвращению",
-                "  - Обновление мер защиты на основе анализа",
-                "  - Информирование руководства о результатах"
-            ]
-        }
+        # <Configure> приходит после распространения геометрии (один раз на ее пересчет),
+        # поэтому bbox уже актуален и второй проход раскладки не нужен
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
         
-        org_incidents_card = self.create_expandable_measures_card(left_frame, org_incidents_data, height=300)
-        org_incidents_card.pack(fill=tk.X, pady=10)
-        
-        # 4. Обеспечение надежности и восстановления
-        org_recovery_data = {
-            "id": "org_recovery", 
-            "title": "🔄 НАДЕЖНОСТЬ И ВОССТАНОВЛЕНИЕ",
-            "color": "#f39c12",
-            "measures": [
-                "• Резервное копирование критичных данных",
-                "• Проверка целостности бэкапов",
-                "• План восстановления функционирования",
-                "• Тестирование процедур восстановления"
-            ],
-            "details": [
-                "💾 Резервное копирование:",
-                "  - Регулярное резервное копирование критичных данных",
-                "  - Копирование конфигураций, баз данных абонентов, биллинга",
-                "  - Хранение бэкапов в защищенном месте",
-                "  - Автоматизация процессов резервного копирования",
-                "",
-                "🔍 Проверка целостности:",
-                "  - Регулярная проверка целостности резервных копий",
-                "  - Тестирование возможности восстановления данных",
-                "  - Верификация корректности процедур бэкапа",
-                "  - Контроль актуальности резервных копий",
-                "",
-                "📈 План восстановления:",
-                "  - Разработка плана восстановления функционирования объекта КИИ",
-                "  - Определение процедур восстановления после сбоев",
-                "  - Установление сроков восстановления (RTO, RPO)",
-                "  - Распределение ролей и ответственности",
-                "",
-                "🧪 Тестирование восстановления:",
-                "  - Регулярное тестирование плана восстановления",
-                "  - Проведение учебных тренировок по восстановлению",
-                "  - Анализ результатов тестирования",
-                "  - Корректировка плана на основе тестов"
-            ]
-        }
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        # Слушатели прокрутки (виртуализированные списки карточек)
+        scroll_listeners = []
         
-        org_recovery_card = self.create_expandable_measures_card(left_frame, org_recovery_data, height=300)
-        org_recovery_card.pack(fill=tk.X, pady=10)
-        
-        # ТЕХНИЧЕСКИЕ МЕРЫ (Раздел 3.2 пояснительной записки)
-        tech_title = tk.Label(right_frame, text="🔧 ТЕХНИЧЕСКИЕ МЕРЫ", 
-                             font=('Arial', 20, 'bold'),
-                             bg='#ecf0f1', fg='#2c3e50')
-        tech_title.pack(pady=(0, 20))
-        
-        # 1. Меры по управлению доступом и аутентификации
-        tech_access_data = {
-            "id": "tech_access",
-            "title": "🔐 УПРАВЛЕНИЕ ДОСТУПОМ И АУТЕНТИФИКАЦИЯ",
-            "color": "#9b59b6",
-            "measures": [
-                "• Многофакторная аутентификация (МФА)",
-                "• Ролевая модель доступа (RBAC)",
-                "• Блокировка учетных записей",
-                "• Контроль сессий администраторов"
-            ],
-            "details": [
-                "🔑 Многофакторная аутентификация (п. 14 Приказа №239):",
-                "  - Строгая аутентификация для доступа к системам управления",
-                "  - Использование МФА для SSH, Web-порталов, сетевых устройств",
-                "  - Комбинация паролей, токенов, биометрических данных",
-                "  - Интеграция с корпоративными системами аутентификации",
-                "",
-                "👤 Ролевая модель доступа RBAC:",
-                "  - Разграничение прав доступа на основе ролей администраторов",
-                "  - Принцип минимальных привилегий для всех пользователей",
-                "  - Разделение обязанностей для критичных операций",
-                "  - Регулярный пересмотр и аудит прав доступа",
-                "",
-                "🚫 Блокировка учетных записей:",
-                "  - Автоматическая блокировка при превышении числа неудачных попыток входа",
-                "  - Временная блокировка при подозрительной активности",
-                "  - Уведомления администраторов о блокировках",
-                "  - Процедуры разблокировки учетных записей",
-                "",
-                "⏰ Контроль сессий:",
-                "  - Ограничение времени сессий администраторов",
-                "  - Принудительное завершение неактивных сессий",
-                "  - Контроль одновременных сессий пользователей",
-                "  - Мониторинг активности сессий в реальном времени"
-            ]
-        }
+        def on_yscroll(first, last):
+            v_scrollbar.set(first, last)
+            for listener in scroll_listeners:
+                listener()
         
-        tech_access_card = self.create_expandable_measures_card(right_frame, tech_access_data, height=300)
-        tech_access_card.pack(fill=tk.X, pady=10)
-        
-        # 2. Меры по защите от НСД и вторжений
-        tech_nsd_data = {
-            "id": "tech_nsd",
-            "title": "🛡️ ЗАЩИТА ОТ НСД И ВТОРЖЕНИЙ", 
-            "color": "#e67e22",
-            "measures": [
-                "• Сегментация сети (VLAN/VXLAN)",
-                "• Межсетевые экраны следующего поколения (NGFW)",
-                "• Системы обнаружения/предотвращения вторжений (IDS/IPS)",
-                "• Защита систем виртуализации"
-            ],
-            "details": [
-                "🌐 Сегментация сети (п. 15 Приказа №239):",
-                "  - Выделение отдельных VLAN для голосового трафика, сигнализации, управления",
-                "  - Изоляция критичных систем в защищенный сегмент",
-                "  - Микросегментация для ограничения lateral movement",
-                "  - Контроль трафика между сегментами сети",
-                "",
-                "🔥 Межсетевые экраны NGFW:",
-                "  - Глубокий анализ трафика на прикладном уровне (Layer 7)",
-                "  - Идентификация VoIP-протоколов независимо от портов",
-                "  - Блокировка прямого доступа из Интернета к критичным компонентам",
-                "  - SSL-инспекция для анализа зашифрованного трафика",
-                "",
-                "🎯 Системы IDS/IPS:",
-                "  - Анализ VoIP-трафика (SIP, RTP) на аномальную активность",
-                "  - Обнаружение и блокирование сетевых атак целевого уровня",
-                "  - Сигнатурный и поведенческий анализ угроз",
-                "  - Интеграция с SIEM для корреляции событий",
-                "",
-                "🖥️ Защита виртуализации:",
-                "  - Настройка безопасной конфигурации гипервизора KVM",
-                "  - Разграничение прав доступа к панели управления виртуализацией",
-                "  - Изоляция виртуальных машин друг от друга",
-                "  - Мониторинг активности на уровне гипервизора"
-            ]
-        }
+        canvas.configure(yscrollcommand=on_yscroll, xscrollcommand=h_scrollbar.set)
         
-        tech_nsd_card = self.create_expandable_measures_card(right_frame, tech_nsd_data, height=300)
-        tech_nsd_card.pack(fill=tk.X, pady=10)
-        
-        # 3. Меры по обеспечению целостности и доступности
-        tech_integrity_data = {
-            "id": "tech_integrity",
-            "title": "⚡ ЦЕЛОСТНОСТЬ И ДОСТУПНОСТЬ",
-            "color": "#2ecc71",
-            "measures": [
-                "• Защита от DDoS-атак",
-                "• Шифрование критичной информации", 
-                "• Контроль целостности ПО и конфигураций",
-                "• Резервирование критичных компонентов"
-            ],
-            "details": [
-                "🛡️ Защита от DDoS-атак (п. 19 Приказа №239):",
-                "  - Использование специализированных систем DDoS Mitigation",
-                "  - Очистка трафика на периметре сети",
-                "  - Защита от объемных и целевых атак на уровне приложений",
-                "  - Мониторинг аномалий трафика в реальном времени",
-                "",
-                "🔒 Шифрование информации (п. 16 Приказа №239):",
-                "  - TLS для защиты сигнальной информации (SIP over TLS)",
-                "  - SRTP для шифрования голосового трафика",
-                "  - Криптографическая защита управляющих каналов",
-                "  - Использование стойких алгоритмов шифрования",
-                "",
-                "📊 Контроль целостности (п. 18 Приказа №239):",
-                "  - Системы контроля целостности файлов (HIDS)",
-                "  - Мониторинг изменений конфигураций и ПО",
-                "  - Обнаружение несанкционированных модификаций",
-                "  - Аудит изменений в критичных компонентах системы",
-                "",
-                "🔄 Резервирование компонентов:",
-                "  - Резервирование критичных компонентов (SBC, коммутаторы, каналы связи)",
-                "  - Обеспечение отказоустойчивости системы",
-                "  - Автоматическое переключение на резервные компоненты",
-                "  - Мониторинг состояния резервных систем"
-            ]
-        }
+        # Упаковываем элементы
+        h_scrollbar.pack(side="bottom", fill="x")
+        v_scrollbar.pack(side="right", fill="y")
+        canvas.pack(side="left", fill="both", expand=True)
         
-        tech_integrity_card = self.create_expandable_measures_card(right_frame, tech_integrity_data, height=300)
-        tech_integrity_card.pack(fill=tk.X, pady=10)
-        
-        # 4. Меры по регистрации и мониторингу
-        tech_monitoring_data = {
-            "id": "tech_monitoring", 
-            "title": "📊 РЕГИСТРАЦИЯ И МОНИТОРИНГ",
-            "color": "#3498db",
-            "measures": [
-                "• Централизованный сбор логов (SIEM)",
-                "• Корреляция событий безопасности",
-                "• Мониторинг доступности сервисов", 
-                "• Аудит действий пользователей"
-            ],
-            "details": [
-                "📈 Система SIEM (п. 24 Приказа №239):",
-                "  - Централизованный сбор событий безопасности со всех компонентов",
-                "  - Агрегация логов ОС, МЭ, VoIP-компонентов, СХД",
-                "  - Корреляция событий для выявления сложных атак",
-                "  - Автоматическое оповещение о критичных инцидентах",
-                "",
-                "🔗 Корреляция событий:",
-                "  - Настройка правил корреляции в системе SIEM",
-                "  - Выявление сложных многокомпонентных атак",
-                "  - Обнаружение координированных действий злоумышленников",
-                "  - Автоматизация реагирования на инциденты",
-                "",
-                "👁️ Мониторинг доступности:",
-                "  - Организация мониторинга доступности ключевых сервисов",
-                "  - Контроль качества голосовой связи (QoS)",
-                "  - Мониторинг загрузки ресурсов критичных компонентов",
-                "  - Автоматическое обнаружение сбоев и деградации сервиса",
-                "",
-                "📝 Аудит действий:",
-                "  - Подробное логирование всех административных действий",
-                "  - Аудит изменений конфигураций и правил безопасности",
-                "  - Мониторинг действий пользователей и администраторов",
-                "  - Сохранение доказательной базы для расследований"
-            ]
-        }
+        # Привязываем колесо мыши к канвасу
+        def _on_mousewheel(event):
+            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
         
-        tech_monitoring_card = self.create_expandable_measures_card(right_frame, tech_monitoring_data, height=300)
-        tech_monitoring_card.pack(fill=tk.X, pady=10)
+        def _on_shift_mousewheel(event):
+            canvas.xview_scroll(int(-1*(event.delta/120)), "units")
         
-    def create_expandable_measures_card(self, parent, data, height=240):
-        """Создание расширяемой карточки мер защиты с кнопкой раскрытия"""
-        card_container = tk.Frame(parent, bg='#ecf0f1')
+        canvas.bind("<MouseWheel>", _on_mousewheel)
+        scrollable_frame.bind("<MouseWheel>", _on_mousewheel)
         
-        # Основная карточка
-        card = tk.Frame(card_container, bg='#34495e', relief='raised', bd=2, 
-                       height=315, width=900, cursor="arrow")
-        card.pack_propagate(False)
-        card.pack(fill=tk.X)
+        # Привязываем Shift+колесо мыши для горизонтальной прокрутки
+        canvas.bind("<Shift-MouseWheel>", _on_shift_mousewheel)
+        scrollable_frame.bind("<Shift-MouseWheel>", _on_shift_mousewheel)
         
-        # Заголовок карточки
-        header_frame = tk.Frame(card, bg=data["color"], height=60)
-        header_frame.pack_propagate(False)
-        header_frame.pack(fill=tk.X, padx=3, pady=3)
+        return container, scrollable_frame, canvas, scroll_listeners
+
+    @profiled_phase
+    def create_architecture_tab(self, parent):
+        """Вкладка с архитектурой - ИСПРАВЛЕННАЯ ВЕРСИЯ"""
+        self.arch_frame = ttk.Frame(parent, style='Light.TFrame')
+        self.arch_frame.pack(fill=tk.BOTH, expand=True)
         
-        header_content = tk.Frame(header_frame, bg=data["color"])
-        header_content.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
+        # Заголовок
+        arch_title = tk.Label(self.arch_frame,
+                            text="Архитектура VoIP Сети",
+                            font=('Arial', 28, 'bold'),
+                            bg='#ecf0f1',
+                            fg='#2c3e50',
+                            pady=20)
+        arch_title.pack()
         
-        title_label = tk.Label(header_content, text=data["title"], 
-                              font=('Arial', 16, 'bold'), bg=data["color"], fg='white')
-        title_label.pack(side=tk.LEFT)
+        # Основной контейнер для схемы и панели управления
+        main_content = ttk.Frame(self.arch_frame, style='Light.TFrame')
+        main_content.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
         
-        # Содержимое карточки
-        content_frame = tk.Frame(card, bg='#34495e')
-        content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=18)
-        
-        # Основные меры
-        for measure in data["measures"]:
-            measure_label = tk.Label(content_frame, text=measure, 
-                                   font=('Arial', 15), bg='#34495e', fg='#ecf0f1',
-                                   anchor='w')
-            measure_label.pack(fill=tk.X, pady=6)
-    
-        # Кнопка раскрытия в правом нижнем углу
-        expand_btn_frame = tk.Frame(card, bg='#34495e')
-        expand_btn_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=10)
+        # ЛЕВАЯ ПАНЕЛЬ - управление атаками и защитой
+        left_panel = ttk.Frame(main_content, style='Light.TFrame', width=400)
+        left_panel.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 20))
+        left_panel.pack_propagate(False)
         
-        expand_btn = tk.Button(expand_btn_frame,
-                             text="▼",
-                             font=('Arial', 11, 'bold'),
-                             bg=data["color"],
-                             fg='white',
-                             relief='raised',
-                             bd=2,
-                             padx=15,
-                             pady=6,
-                             command=lambda cid=data["id"]: self.toggle_measures_card_expansion(cid))
-        expand_btn.pack(side=tk.RIGHT)
+        # ПРАВАЯ ПАНЕЛЬ - схема (занимает всё оставшееся пространство)
+        right_panel = ttk.Frame(main_content, style='Light.TFrame')
+        right_panel.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
         
-        # Контейнер для подробной информации
-        details_container = tk.Frame(card_container, bg='#2c3e50', relief='sunken', bd=1)
-        
-        # Сохраняем состояние карточки
-        self.expanded_measures_cards[data["id"]] = {
-            "expanded": False,
-            "card": card,
-            "details_container": details_container,
-            "data": data,
-            "button": expand_btn
-        }
+        # === ЛЕВАЯ ПАНЕЛЬ: Управление атаками и защитой ===
         
-        self.add_hover_effect(card, '#34495e', '#2c3e50')
+        # Заголовок панели управления
+        control_title = tk.Label(left_panel,
+                               text="🎯 Управление безопасностью",
+                               font=('Arial', 18, 'bold'),
+                               bg='#ecf0f1',
+                               fg='#2c3e50',
+                               pady=15)
+        control_title.pack()
         
-        return card_container
-    
-    def toggle_measures_card_expansion(self, card_id):
-        """Переключение состояния расширения карточки мер защиты"""
-        card_data = self.expanded_measures_cards[card_id]
+        # Описание
+        desc_label = tk.Label(left_panel,
+                             text="Выберите угрозу для визуализации, затем активируйте защиту",
+                             font=('Arial', 12),
+                             bg='#ecf0f1',
+                             fg='#7f8c8d',
+                             wraplength=350,
+                             justify=tk.CENTER)
+        desc_label.pack(pady=(0, 20))
         
-        if card_data["expanded"]:
-            card_data["details_container"].pack_forget()
-            card_data["button"].config(text="▼")
-            card_data["expanded"] = False
-        else:
-            self.show_measures_details(card_id)
-            card_data["button"].config(text="▲")
-            card_data["expanded"] = True
-    
-    def show_measures_details(self, card_id):
-        """Показ подробной информации карточки мер защиты"""
-        card_data = self.expanded_measures_cards[card_id]
-        details_container = card_data["details_container"]
+        # Фрейм для кнопок угроз и защиты
+        threats_frame = ttk.Frame(left_panel, style='Light.TFrame')
+        threats_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Очищаем предыдущее содержимое
-        for widget in details_container.winfo_children():
-            widget.destroy()
+        # Кнопки угроз - вертикальное расположение с меньшими отступами
+        self.threats_data = self.content.get("attack_buttons")
         
-        # Создаем содержимое подробной информации
-        details_content = tk.Frame(details_container, bg='#2c3e50')
-        details_content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        for threat in self.threats_data:
+            color = threat["color"]
+            btn_frame = ttk.Frame(threats_frame, style='Light.TFrame')
+            btn_frame.pack(fill=tk.X, pady=5, padx=10)  # Уменьшил отступы между кнопками
+            
+            btn = tk.Button(btn_frame,
+                          text=threat["text"],
+                          font=('Arial', 14, 'bold'),  # Немного уменьшил шрифт
+                          bg=color,
+                          fg='white',
+                          relief='raised',
+                          bd=2,
+                          padx=15,
+                          pady=10,  # Уменьшил вертикальные отступы
+                          command=lambda tid=threat["id"]: self.show_threat(tid))
+            btn.pack(fill=tk.X)
+            self.create_tooltip(btn, threat["tooltip"])
+            self.add_hover_effect(btn, color, self.darken_color(color, 20))
         
-        # Добавляем разделитель
-        separator = tk.Frame(details_content, bg=card_data["data"].get("color", "#3498db"), height=2)
-        separator.pack(fill=tk.X, pady=(0, 20))
+        # Отступ перед кнопкой защиты
+        ttk.Frame(threats_frame, style='Light.TFrame', height=20).pack()
         
-        # Заголовок подробной информации
-        details_title = tk.Label(details_content, 
-                               text="📋 Подробная информация о мерах защиты:",
-                               font=('Arial', 16, 'bold'),
-                               bg='#2c3e50', fg=card_data["data"].get("color", "#3498db"),
-                               anchor='w')
-        details_title.pack(fill=tk.X, pady=(0, 15))
-        
-        # Добавляем подробности
-        for detail in card_data["data"]["details"]:
-            if detail.strip() == "":
-                # Пустая строка - добавляем отступ
-                tk.Frame(details_content, bg='#2c3e50', height=10).pack(fill=tk.X)
-            elif detail.startswith("  -"):
-                # Подпункт
-                subpoint_label = tk.Label(details_content, text=detail,
-                                        font=('Arial', 13),
-                                        bg='#2c3e50', fg='#bdc3c7',
-                                        anchor='w', justify=tk.LEFT)
-                subpoint_label.pack(fill=tk.X, padx=(30, 0), pady=2)
-            elif ":" in detail:
-                # Заголовок раздела с эмодзи
-                section_label = tk.Label(details_content, text=detail,
-                                       font=('Arial', 14, 'bold'),
-                                       bg='#2c3e50', fg='#2ecc71',
-                                       anchor='w', justify=tk.LEFT)
-                section_label.pack(fill=tk.X, pady=(10, 5))
-            else:
-                # Обычный текст
-                text_label = tk.Label(details_content, text=detail,
-                                    font=('Arial', 14),
-                                    bg='#2c3e50', fg='#ecf0f1',
-                                    anchor='w', justify=tk.LEFT)
-                text_label.pack(fill=tk.X, pady=2)
+        # Кнопка активации защиты
+        protection_btn_frame = ttk.Frame(threats_frame, style='Light.TFrame')
+        protection_btn_frame.pack(fill=tk.X, pady=15, padx=10)
         
-        # Кнопка закрытия
-        close_frame = tk.Frame(details_content, bg='#2c3e50')
-        close_frame.pack(fill=tk.X, pady=(20, 0))
+        self.protection_btn = tk.Button(protection_btn_frame,
+                                      text="🛡️ АКТИВИРОВАТЬ ЗАЩИТУ",
+                                      font=('Arial', 16, 'bold'),  # Немного уменьшил шрифт
+                                      bg='#2ecc71',
+                                      fg='white',
+                                      relief='raised',
+                                      bd=3,
+                                      padx=20,
+                                      pady=12,  # Уменьшил вертикальные отступы
+                                      command=self.activate_protection,
+                                      state='disabled')
+        self.protection_btn.pack(fill=tk.X)
+        self.add_hover_effect(self.protection_btn, '#2ecc71', '#27ae60')
         
-        close_btn = tk.Button(close_frame, text="✕ Свернуть",
-                            font=('Arial', 12, 'bold'),
-                            bg='#e74c3c', fg='white',
-                            relief='raised', bd=2,
-                            padx=15, pady=8,
-                            command=lambda: self.toggle_measures_card_expansion(card_id))
-        close_btn.pack(side=tk.RIGHT)
+        # Переключение растровой и векторной схемы
+        self.render_mode_btn = tk.Button(threats_frame,
+                                       text="🗺️ Векторная схема",
+                                       font=('Arial', 12, 'bold'),
+                                       bg='#34495e',
+                                       fg='white',
+                                       relief='raised',
+                                       bd=2,
+                                       pady=6,
+                                       command=self.toggle_render_mode)
+        self.render_mode_btn.pack(fill=tk.X, padx=10, pady=(0, 10))
+        self.add_hover_effect(self.render_mode_btn, '#34495e', '#2c3e50')
+        
+        # Режим потока пакетов для DDoS
+        self.flood_btn = tk.Button(threats_frame,
+                                 text="🌊 Поток пакетов DDoS: выкл",
+                                 font=('Arial', 12, 'bold'),
+                                 bg='#34495e',
+                                 fg='white',
+                                 relief='raised',
+                                 bd=2,
+                                 pady=6,
+                                 command=self.toggle_flood_mode)
+        self.flood_btn.pack(fill=tk.X, padx=10, pady=(0, 10))
+        self.create_tooltip(self.flood_btn, "Тысячи пакетов от ботнета к серверу, отбрасываемые на NGFW")
+        self.add_hover_effect(self.flood_btn, '#34495e', '#2c3e50')
+        
+        # Воспроизведение сценария учений
+        self.scenario_btn = tk.Button(threats_frame,
+                                    text="🎬 Сценарий учений",
+                                    font=('Arial', 12, 'bold'),
+                                    bg='#8e44ad',
+                                    fg='white',
+                                    relief='raised',
+                                    bd=2,
+                                    pady=6,
+                                    command=self.toggle_scenario)
+        self.scenario_btn.pack(fill=tk.X, padx=10, pady=(0, 10))
+        self.create_tooltip(self.scenario_btn, "Сценарий из папки scenarios: несколько угроз и защит по времени")
+        self.add_hover_effect(self.scenario_btn, '#8e44ad', '#7d3c98')
         
-        # Отображаем контейнер с подробностями
-        details_container.pack(fill=tk.X, pady=(5, 0))
-
-    def create_technical_tab(self):
-        """Вкладка с техническими средствами - с расширяемыми блоками"""
-        container, tech_frame, canvas = self.create_scrollable_frame(self.notebook)
-        self.notebook.add(container, text="⚙️ Технические средства")
+        # === ПРАВАЯ ПАНЕЛЬ: Схема архитектуры ===
         
-        title = tk.Label(tech_frame, text="Технические средства защиты", 
-                        font=('Arial', 28, 'bold'),
-                        bg='#ecf0f1', fg='#2c3e50')
-        title.pack(pady=20)
+        scheme_frame = ttk.Frame(right_panel, style='Light.TFrame')
+        scheme_frame.pack(fill=tk.BOTH, expand=True)
         
-        self.create_expandable_technical_cards(tech_frame)
+        # Canvas для изображения схемы (без масштабирования)
+        self.canvas = tk.Canvas(scheme_frame,
+                              bg='white',
+                              highlightthickness=2,
+                              highlightbackground='#3498db',
+                              relief='sunken')
         
-    def create_expandable_technical_cards(self, parent):
-        """Создание расширяемых карточек технических средств с использованием pack"""
-        main_container = ttk.Frame(parent, style='Light.TFrame')
-        main_container.pack(fill=tk.BOTH, expand=True, padx=25, pady=15)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.canvas.bind('<Configure>', self.on_canvas_configure)
+        
+        # Масштабирование колесом мыши и перетаскивание схемы
+        self.canvas.bind('<MouseWheel>', self.on_canvas_zoom)
+        self.canvas.bind('<Button-4>', self.on_canvas_zoom)
+        self.canvas.bind('<Button-5>', self.on_canvas_zoom)
+        self.canvas.bind('<ButtonPress-1>', self.on_canvas_drag_start)
+        self.canvas.bind('<B1-Motion>', self.on_canvas_drag)
+        self.canvas.bind('<Double-Button-1>', self.reset_canvas_zoom)
+        self.tile_renderer = TileRenderer(self.canvas, self.image_worker)
+        self.vector_scene = VectorScene(self.canvas, self.content.get("topology"))
+        self.threat_animator = ThreatAnimator(self.canvas,
+                                              ThreatTopology(self.content.get("topology"),
+                                                             self.content.get("threat_map")),
+                                              self.frame_clock, self.finish_threat)
+
+    def on_canvas_configure(self, event=None):
+        """Объединение событий изменения размера канваса"""
+        # Быстрый предпросмотр - не чаще одного раза за цикл событий
+        if self.preview_job is None:
+            self.preview_job = self.root.after_idle(self.render_resize_preview)
+        
+        # Качественный LANCZOS - один раз, когда изменение размера закончилось
+        if self.resize_job is not None:
+            self.root.after_cancel(self.resize_job)
+        self.resize_job = self.root.after(self.resize_settle_delay, self.finish_resize)
+        
+    def render_resize_preview(self):
+        """Быстрый предпросмотр схемы во время изменения размера"""
+        self.preview_job = None
+        self.resize_image_fixed(resample=self.preview_resample)
+        
+    def finish_resize(self):
+        """Финальный качественный проход после завершения изменения размера"""
+        self.resize_job = None
+        self.resize_image_fixed()
         
-        # Создаем два столбца как во вкладке "Меры защиты"
-        left_frame = ttk.Frame(main_container, style='Light.TFrame')
-        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=8)
+    def on_canvas_zoom(self, event):
+        """Масштабирование схемы колесом мыши относительно курсора"""
+        if self.scheme_size() is None or self.view_origin is None:
+            return
+        step = 1 if getattr(event, 'num', None) == 4 or getattr(event, 'delta', 0) > 0 else -1
+        new_factor = min(self.max_scale, max(self.min_scale, self.scale_factor * (1.2 ** step)))
+        if new_factor == self.scale_factor:
+            return
         
-        right_frame = ttk.Frame(main_container, style='Light.TFrame')
-        right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=8)
+        # Точка схемы под курсором остается на месте. Вид считается по scale_factor
+        # и сдвигу, а не по последней отрисовке: события колеса могут прийти
+        # раньше отложенной перерисовки
+        img_width, img_height = self.scheme_size()
+        scale = self.fit_scale * self.scale_factor
+        new_scale = self.fit_scale * new_factor
+        view_x = (self.canvas_width - int(img_width * scale)) // 2 + self.pan_x
+        view_y = (self.canvas_height - int(img_height * scale)) // 2 + self.pan_y
+        image_x = (event.x - view_x) / scale
+        image_y = (event.y - view_y) / scale
+        self.pan_x = event.x - image_x * new_scale - (self.canvas_width - int(img_width * new_scale)) // 2
+        self.pan_y = event.y - image_y * new_scale - (self.canvas_height - int(img_height * new_scale)) // 2
+        self.scale_factor = new_factor
+        self.on_canvas_configure()
+        
+    def on_canvas_drag_start(self, event):
+        """Начало перетаскивания схемы"""
+        self.drag_origin = (event.x, event.y)
+        
+    def on_canvas_drag(self, event):
+        """Перетаскивание увеличенной схемы"""
+        if self.drag_origin is None:
+            return
+        self.pan_x += event.x - self.drag_origin[0]
+        self.pan_y += event.y - self.drag_origin[1]
+        self.drag_origin = (event.x, event.y)
+        self.on_canvas_configure()
         
-        technical_data = [
-            {
-                "id": "tech_mfa",
-                "group": "🔐 МНОГОФАКТОРНАЯ АУТЕНТИФИКАЦИЯ",
-                "main": "Secret Double Octopus, Рутокен ПАК, Cisco Duo",
-                "alt": "VASCO Digipass, YubiKey, Google Authenticator",
-                "details": [
-                    "🎯 Назначение: Управление доступом и аутентификация (п. 14 Приказа №239)",
-                    "  - Контроль доступа ко всем критически важным компонентам инфраструктуры",
-                    "  - Строгая аутентификация для систем управления (SSH, Web-порталы)",
-                    "  - Защита от компрометации учетных записей и хищения учетных данных",
-                    "",
-                    "⚙️ Принцип работы:",
-                    "  - Требование предоставления не менее двух независимых факторов",
-                    "  - Первый фактор: постоянный пароль (знание)",
-                    "  - Второй фактор: одноразовый код, SMS, аппаратный токен (владение)",
-                    "  - Третий фактор: биометрия (отпечаток, радужная оболочка)",
-                    "",
-                    "🛡️ Эффективность:",
-                    "  - Противостояние угрозам компрометации учетных записей",
-                    "  - Защита даже при перехвате или подборе пароля",
-                    "  - Соответствие требованиям надежной аутентификации для КИИ",
-                    "  - Интеграция с корпоративными системами управления доступом"
-                ]
-            },
-            {
-                "id": "tech_ngfw",
-                "group": "🔥 МЕЖСЕТЕВЫЕ ЭКРАНЫ NGFW", 
-                "main": "Palo Alto PA-Series, Fortinet FortiGate",
-                "alt": "Check Point Quantum, Cisco Firepower NGFW",
-                "details": [
-                    "🎯 Назначение: Защита от НСД и контроль трафика (п. 15 Приказа №239)",
-                    "  - Развертывание на границах сетевых сегментов и периметре сети",
-                    "  - Контроль соединений в информационной системе и между системами",
-                    "  - Защита на стыке с внешними сетями (Интернет, ТфОП)",
-                    "",
-                    "⚙️ Функциональность:",
-                    "  - Глубокий анализ трафика на прикладном уровне (Layer 7)",
-                    "  - Идентификация VoIP-протоколов (SIP, RTP, WebRTC) независимо от портов",
-                    "  - Создание детализированных политик безопасности для VoIP-трафика",
-                    "  - SSL-инспекция для анализа зашифрованного трафика",
-                    "  - Проверка на наличие известных уязвимостей",
-                    "",
-                    "🛡️ Эффективность:",
-                    "  - Противодействие несанкционированному доступу к компонентам VoIP",
-                    "  - Блокирование сканирования сети и lateral movement",
-                    "  - Предотвращение эксплуатации уязвимостей в сетевых протоколах",
-                    "  - Контроль доступа из Интернета к критичным компонентам"
-                ]
-            },
-            {
-                "id": "tech_ids_ips",
-                "group": "🎯 СИСТЕМЫ ОБНАРУЖЕНИЯ/ПРЕДОТВРАЩЕНИЯ ВТОРЖЕНИЙ",
-                "main": "Cisco Firepower IPS, Suricata",
-                "alt": "Darktrace, Positive Technologies MaxPatrol",
-                "details": [
-                    "🎯 Назначение: Обнаружение и предотвращение вторжений (п. 19 Приказа №239)",
-                    "  - Обнаружение вторжений в информационную систему и реагирование на них",
-                    "  - Анализ VoIP-трафика и выявление аномальной активности",
-                    "  - Блокирование целевых атак на уровне телефонии",
-                    "",
-                    "⚙️ Функциональность:",
-                    "  - Непрерывный анализ всего сетевого трафика включая VoIP-протоколы",
-                    "  - Комбинация сигнатурного и поведенческого анализа",
-                    "  - Выявление известных атак (SIP-флуд, сканирование уязвимостей)",
-                    "  - Обнаружение аномалий (необычно высокое количество REGISTER/INVITE)",
-                    "  - Автоматическое блокирование подозрительного трафика",
-                    "",
-                    "🛡️ Эффективность:",
-                    "  - Противодействие целевым атакам на VoIP-протоколы",
-                    "  - Защита от DDoS-атак на уровне приложений",
-                    "  - Предотвращение эксплуатации уязвимостей в компонентах телефонии",
-                    "  - Обнаружение попыток перехвата вызовов и несанкционированного использования"
-                ]
-            },
-            {
-                "id": "tech_ddos",
-                "group": "🛡️ ЗАЩИТА ОТ DDoS-АТАК",
-                "main": "Radware DefensePro, Arbor Networks APS", 
-                "alt": "Qrator Labs, Wallarm, Cloudflare",
-                "details": [
-                    "🎯 Назначение: Обеспечение доступности (п. 19 Приказа №239)",
-                    "  - Обеспечение устойчивости информационной системы к отказам в обслуживании",
-                    "  - Защита публичных сервисов (Web-портал, SBC) от объемных атак",
-                    "  - Обеспечение доступности услуг телефонии в условиях атак",
-                    "",
-                    "⚙️ Функциональность:",
-                    "  - Многоуровневый подход к фильтрации трафика",
-                    "  - Бихевиоральный анализ и формирование профиля нормального VoIP-трафика",
-                    "  - Непрерывный мониторинг на предмет аномалий трафика",
-                    "  - Автоматическое перенаправление трафика через скрабер-центры",
-                    "  - Тщательная фильтрация и возврат очищенного трафика",
-                    "",
-                    "🛡️ Эффективность:",
-                    "  - Обеспечение доступности услуг связи при интенсивных атаках",
-                    "  - Защита от исчерпания ресурсов процессора, памяти, пропускной способности",
-                    "  - Противодействие как объемным, так и целевым атакам на приложения",
-                    "  - Соответствие требованиям по обеспечению устойчивости объекта КИИ"
-                ]
-            },
-            {
-                "id": "tech_crypto",
-                "group": "🔒 ШИФРОВАНИЕ ИНФОРМАЦИИ",
-                "main": "TLS/SRTP в ПО (Asterisk, FreeSWITCH)",
-                "alt": "Аппаратные SBC (Ribbon, Oracle ACME Packet)",
-                "details": [
-                    "🎯 Назначение: Криптографическая защита информации (п. 16 Приказа №239)",
-                    "  - Защита информации от уничтожения, блокирования, модификации и копирования",
-                    "  - Обеспечение конфиденциальности и целостности передаваемой информации",
-                    "  - Защита сигнальной информации и голосового трафика",
-                    "",
-                    "⚙️ Реализация:",
-                    "  - SIP over TLS для шифрования сигнальных сообщений",
-                    "  - SRTP (Secure Real-time Transport Protocol) для медиапотоков",
-                    "  - Аутентификация сторон и защита от подмены",
-                    "  - Аппаратные средства криптографической защиты для ответственных сегментов",
-                    "  - Создание защищенных виртуальных каналов между узлами связи",
-                    "",
-                    "🛡️ Эффективность:",
-                    "  - Противодействие перехвату голосового трафика и сигнальной информации",
-                    "  - Защита от прослушивания переговоров и спуфинга",
-                    "  - Предотвращение модификации вызовов и подмены абонентов",
-                    "  - Соответствие требованиям по криптографической защите информации КИИ"
-                ]
-            },
-            {
-                "id": "tech_hids",
-                "group": "📊 КОНТРОЛЬ ЦЕЛОСТНОСТИ",
-                "main": "Wazuh, OSSEC, AIDE", 
-                "alt": "Tripwire, Osquery, Falco",
-                "details": [
-                    "🎯 Назначение: Контроль целостности ПО и конфигураций (п. 18 Приказа №239)",
-                    "  - Контроль целостности программной среды и информации в информационной системе",
-                    "  - Обнаружение несанкционированных изменений в критичных компонентах",
-                    "  - Мониторинг файловых систем серверов VoIP-инфраструктуры",
-                    "",
-                    "⚙️ Функциональность:",
-                    "  - Периодическое вычисление криптографических хэш-сумм (SHA-256, SHA-512)",
-                    "  - Сравнение с эталонными значениями в защищенной базе данных",
-                    "  - Мониторинг исполняемых файлов, конфигураций, системных библиотек",
-                    "  - Немедленное оповещение при обнаружении неавторизованных изменений",
-                    "  - Интеграция с SIEM-системой для централизованного управления",
-                    "",
-                    "🛡️ Эффективность:",
-                    "  - Выявление несанкционированных изменений ПО и конфигураций",
-                    "  - Обнаружение внедрения закладок, руткитов и вредоносного кода",
-                    "  - Контроль действий инсайдеров по модификации параметров системы",
-                    "  - Раннее обнаружение компрометации на стадии изменения файлов"
-                ]
-            },
-            {
-                "id": "tech_siem",
-                "group": "📈 СИСТЕМЫ SIEM",
-                "main": "Splunk Enterprise Security, IBM QRadar",
-                "alt": "Micro Focus ArcSight, MAXPATROL SIEM",
-                "details": [
-                    "🎯 Назначение: Регистрация и мониторинг событий (п. 24 Приказа №239)",
-                    "  - Регистрация событий безопасности в информационной системе",
-                    "  - Обеспечение возможности анализа событий безопасности",
-                    "  - Централизованный сбор и корреляция данных безопасности",
-                    "",
-                    "⚙️ Функциональность:",
-                    "  - Централизованный сбор, нормализация, корреляция и анализ событий",
-                    "  - Агрегация данных с VoIP-компонентов, ОС, МЭ, IPS, HIDS",
-                    "  - Настройка сложных правил корреляции для выявления многозвенных атак",
-                    "  - Автоматическое присвоение приоритетов и уведомление группы реагирования",
-                    "  - Запуск автоматизированных сценариев реагирования на инциденты",
-                    "",
-                    "🛡️ Эффективность:",
-                    "  - Своевременное обнаружение сложных многозвенных атак",
-                    "  - Координация действий по реагированию на инциденты",
-                    "  - Накопление доказательной базы для расследований",
-                    "  - Обеспечение ситуационной осведомленности о состоянии безопасности"
-                ]
-            },
-            {
-                "id": "tech_sbc",
-                "group": "📞 SESSION BORDER CONTROLLER",
-                "main": "AudioCodes Mediant, Ribbon SBC SWe", 
-                "alt": "Cisco CUBE, Oracle ACME Packet",
-                "details": [
-                    "🎯 Назначение: Защита инфраструктуры VoIP на границе сессий",
-                    "  - Ключевой элемент безопасности VoIP-инфраструктуры",
-                    "  - Защита от атак на уровне сигнализации и медиатрафика",
-                    "  - Обеспечение безопасного взаимодействия с внешними сетями",
-                    "",
-                    "⚙️ Функциональность:",
-                    "  - Нормализация и проверка SIP-сообщений",
-                    "  - Защита от флуда, сканирования и атак с подделкой (SPIT)",
-                    "  - Топология hiding - сокрытие внутренней структуры сети",
-                    "  - Принудительное использование SRTP для шифрования медиатрафика",
-                    "  - Аутентификация и авторизация всех SIP-запросов",
-                    "",
-                    "🛡️ Эффективность:",
-                    "  - Защита от целевых атак на VoIP-протоколы",
-                    "  - Предотвращение несанкционированного доступа к услугам связи",
-                    "  - Обеспечение конфиденциальности коммуникаций",
-                    "  - Соответствие требованиям по защите периметра VoIP-инфраструктуры"
-                ]
-            }
-        ]
+    def reset_canvas_zoom(self, event=None):
+        """Возврат к исходному масштабу по двойному щелчку"""
+        self.scale_factor = 1.0
+        self.pan_x = self.pan_y = 0
+        self.on_canvas_configure()
+        
+    def scheme_size(self):
+        """Исходный размер схемы в текущем режиме отрисовки"""
+        if self.render_mode == "vector":
+            return self.vector_scene.size
+        return self.scheme_asset.size if self.scheme_asset else None
+        
+    def toggle_render_mode(self):
+        """Переключение между растровой и векторной схемой"""
+        if self.render_mode == "raster":
+            self.render_mode = "vector"
+            self.tile_renderer.clear()
+            self.canvas.itemconfig("scheme_full", state='hidden')
+            self.displayed_key = self.requested_key = None
+            self.cancel_resample()
+            self.render_mode_btn.config(text="🖼️ Растровая схема")
+        else:
+            self.render_mode = "raster"
+            self.vector_scene.clear()
+            self.render_mode_btn.config(text="🗺️ Векторная схема")
+        self.resize_image_fixed()
         
-        # Распределяем карточки по двум столбцам
-        for i, tech in enumerate(technical_data):
-            if i % 2 == 0:
-                card = self.create_expandable_tech_card(left_frame, tech)
-                card.pack(fill=tk.X, pady=10)
-            else:
-                card = self.create_expandable_tech_card(right_frame, tech)
-                card.pack(fill=tk.X, pady=10)
+    def update_view(self, x, y, scale):
+        """Перенос наложений и векторной схемы при смене масштаба или сдвига"""
+        if self.view_origin is not None and (x, y, scale) != (*self.view_origin, self.last_scale):
+            old_x, old_y = self.view_origin
+            ratio = scale / self.last_scale
+            for tag in ("overlay", "vector"):
+                self.canvas.scale(tag, old_x, old_y, ratio, ratio)
+                self.canvas.move(tag, x - old_x, y - old_y)
+        self.view_origin = (x, y)
+        self.last_scale = scale
+        self.threat_animator.set_view(x, y, scale)
+        
+    def resize_image_fixed(self, event=None, resample=Image.Resampling.LANCZOS):
+        """Отображение схемы: целиком, если помещается, иначе - видимыми тайлами"""
+        if self.scheme_size() is None:
+            return
             
-    def create_expandable_tech_card(self, parent, tech_data):
-        """Создание расширяемой карточки технических средств с кнопкой раскрытия"""
-        card_container = tk.Frame(parent, bg='#ecf0f1')
-        
-        # Основная карточка
-        card = tk.Frame(card_container, bg='#34495e', relief='raised', bd=3, 
-                       height=250, width=900, cursor="arrow")
-        card.pack_propagate(False)
-        card.pack(fill=tk.X)
+        canvas_width = self.canvas.winfo_width()
+        canvas_height = self.canvas.winfo_height()
         
-        # Заголовок карточки
-        group_frame = tk.Frame(card, bg='#3498db', height=60)
-        group_frame.pack_propagate(False)
-        group_frame.pack(fill=tk.X, padx=4, pady=4)
+        if canvas_width <= 1 or canvas_height <= 1:
+            return
+        self.canvas_width, self.canvas_height = canvas_width, canvas_height
+            
+        # Отображаем изображение в максимальном размере с сохранением пропорций
+        img_width, img_height = self.scheme_size()
         
-        group_content = tk.Frame(group_frame, bg='#3498db')
-        group_content.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
+        # Вычисляем коэффициенты масштабирования
+        width_ratio = canvas_width / img_width
+        height_ratio = canvas_height / img_height
+        self.fit_scale = min(width_ratio, height_ratio, 1.0)  # Не увеличиваем больше оригинала
+        scale_ratio = self.fit_scale * self.scale_factor  # Пользовательский масштаб колесом мыши
         
-        group_label = tk.Label(group_content, text=tech_data["group"], 
-                              font=('Arial', 18, 'bold'),
-                              bg='#3498db', fg='white')
-        group_label.pack(side=tk.LEFT)
+        display_width = int(img_width * scale_ratio)
+        display_height = int(img_height * scale_ratio)
         
-        # Содержимое карточки
-        content_frame = tk.Frame(card, bg='#34495e')
-        content_frame.pack(fill=tk.BOTH, expand=True, padx=25, pady=20)
+        # Сдвиг возможен только для схемы, не помещающейся в канвас
+        limit_x = max(0, (display_width - canvas_width) // 2)
+        limit_y = max(0, (display_height - canvas_height) // 2)
+        self.pan_x = int(min(limit_x, max(-limit_x, self.pan_x)))
+        self.pan_y = int(min(limit_y, max(-limit_y, self.pan_y)))
         
-        main_label = tk.Label(content_frame, text=f"🎯 Основное: {tech_data['main']}", 
-                             font=('Arial', 15, 'bold'),
-                             bg='#34495e', fg='#2ecc71', anchor='w')
-        main_label.pack(fill=tk.X, pady=(0, 12))
+        # Центрируем изображение
+        x = (canvas_width - display_width) // 2 + self.pan_x
+        y = (canvas_height - display_height) // 2 + self.pan_y
+        self.update_view(x, y, scale_ratio)
+        
+        if self.render_mode == "vector":
+            # Векторная схема уже перенесена в update_view - ресемплинг не нужен
+            if not self.vector_scene.drawn:
+                self.vector_scene.draw(x, y, scale_ratio)
+                self.canvas.tag_lower("scheme")
+            self.vector_scene.update_fonts(scale_ratio)
+            return
         
-        alt_label = tk.Label(content_frame, text=f"📋 Альтернативы:\n{tech_data['alt']}", 
-                            font=('Arial', 14),
-                            bg='#34495e', fg='#bdc3c7', anchor='w', 
-                            justify=tk.LEFT)
-        alt_label.pack(fill=tk.BOTH, expand=True)
+        if display_width > canvas_width or display_height > canvas_height:
+            # Увеличенная схема: ресемплируются только видимые тайлы
+            self.canvas.itemconfig("scheme_full", state='hidden')
+            self.displayed_key = self.requested_key = None
+            self.cancel_resample()
+            self.tile_renderer.render(self.scheme_asset, (display_width, display_height), x, y,
+                                      canvas_width, canvas_height, resample, self.preview_resample)
+            return
         
-        # Кнопка раскрытия в правом нижнем углу
-        expand_btn_frame = tk.Frame(card, bg='#34495e')
-        expand_btn_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=10)
+        # В исходном размере ресемплинг не нужен ни на одном из этапов
+        if (display_width, display_height) == (img_width, img_height):
+            resample = None
         
-        expand_btn = tk.Button(expand_btn_frame,
-                             text="▼",
-                             font=('Arial', 11, 'bold'),
-                             bg='#3498db',
-                             fg='white',
-                             relief='raised',
-                             bd=2,
-                             padx=15,
-                             pady=6,
-                             command=lambda tid=tech_data["id"]: self.toggle_technical_card_expansion(tid))
-        expand_btn.pack(side=tk.RIGHT)
+        # Та же картинка в том же месте уже на экране или готовится - ничего не делаем
+        displayed_key = (display_width, display_height, x, y, resample)
+        if displayed_key == self.requested_key:
+            return
+        if displayed_key == self.displayed_key:
+            # Возврат к показанной версии - строящаяся больше не нужна
+            self.requested_key = None
+            self.cancel_resample()
+            return
+        self.requested_key = displayed_key
         
-        # Контейнер для подробной информации
-        details_container = tk.Frame(card_container, bg='#2c3e50', relief='sunken', bd=1)
-        
-        # Сохраняем состояние карточки
-        self.expanded_technical_cards[tech_data["id"]] = {
-            "expanded": False,
-            "card_container": card_container,
-            "details_container": details_container,
-            "data": tech_data,
-            "button": expand_btn
-        }
+        # Та же версия уже строится - по готовности она будет показана в новой позиции
+        size = (display_width, display_height)
+        job_key = (size, resample)
+        if self.resample_job is not None and self.resample_job[:2] == job_key:
+            return
+        self.cancel_resample()
         
-        self.add_hover_effect(card, '#34495e', '#2c3e50')
+        # Повторные размеры (например, переключение F11/Escape) берутся из кэша
+        scaled = self.scheme_asset.peek(size, resample)
+        if scaled is not None:
+            self.show_scaled_image(scaled, displayed_key)
+            return
         
-        return card_container
+        # Ресемплинг в фоне; до его завершения на канвасе остается прежний кадр
+        future = self.image_worker.submit(
+            self.scheme_asset.get,
+            lambda result, error: self.on_scaled_image_ready(job_key, result, error),
+            size, resample)
+        self.resample_job = job_key + (future,)
+        
+    def cancel_resample(self):
+        """Отказ от строящейся версии схемы (еще не начатая задача снимается с пула)"""
+        if self.resample_job is not None:
+            self.resample_job[2].cancel()
+            self.resample_job = None
+        
+    def on_scaled_image_ready(self, job_key, scaled, error):
+        """Результат фонового ресемплинга (устаревшие запросы отбрасываются)"""
+        if self.resample_job is None or self.resample_job[:2] != job_key:
+            return
+        self.resample_job = None
+        if error is not None:
+            self.requested_key = None
+            self.show_error_message(f"Ошибка загрузки изображения: {str(error)}")
+            return
+        self.show_scaled_image(scaled, self.requested_key)
+        
+    def show_scaled_image(self, scaled, displayed_key):
+        """Вывод готовой версии схемы на канвас"""
+        if scaled.photo is None:
+            scaled.photo = ImageTk.PhotoImage(scaled.image)
+        self.photo = scaled.photo
+        self.displayed_key = displayed_key
+        self.requested_key = None
+        
+        display_width, display_height, x, y, _ = displayed_key
+        self.tile_renderer.clear()
+        if self.background_item is None:
+            self.background_item = self.canvas.create_image(x, y, image=self.photo, anchor=tk.NW,
+                                                            tags=("scheme", "scheme_full"))
+        else:
+            # Постоянный элемент фона: меняются только картинка и позиция
+            self.canvas.coords(self.background_item, x, y)
+            self.canvas.itemconfig(self.background_item, image=self.photo, state='normal')
+        self.canvas.tag_lower("scheme")
+        
+        # Отметка первой отрисовки схемы (после перерисовки канваса)
+        if "scheme_painted" not in self.profiler.marks:
+            self.root.after_idle(lambda: self.profiler.mark("scheme_painted"))
 
-    def toggle_technical_card_expansion(self, card_id):
-        """Переключение состояния расширения карточки технических средств"""
-        card_data = self.expanded_technical_cards[card_id]
+    def darken_color(self, color, percent):
+        """Затемнение цвета для эффекта hover"""
+        import colorsys
+        # Конвертируем hex в RGB
+        color = color.lstrip('#')
+        rgb = tuple(int(color[i:i+2], 16) for i in (0, 2, 4))
         
-        if card_data["expanded"]:
-            card_data["details_container"].pack_forget()
-            card_data["button"].config(text="▼")
-            card_data["expanded"] = False
-        else:
-            self.show_technical_details(card_id)
-            card_data["button"].config(text="▲")
-            card_data["expanded"] = True
-    
-    def show_technical_details(self, card_id):
-        """Показ подробной информации технического средства"""
-        card_data = self.expanded_technical_cards[card_id]
-        details_container = card_data["details_container"]
+        # Конвертируем RGB в HSL
+        h, l, s = colorsys.rgb_to_hls(rgb[0]/255.0, rgb[1]/255.0, rgb[2]/255.0)
         
-        # Очищаем предыдущее содержимое
-        for widget in details_container.winfo_children():
-            widget.destroy()
+        # Уменьшаем lightness
+        l = max(0, l * (100 - percent) / 100)
         
-        # Создаем содержимое подробной информации
-        details_content = tk.Frame(details_container, bg='#2c3e50')
-        details_content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        # Конвертируем обратно в RGB
+        r, g, b = colorsys.hls_to_rgb(h, l, s)
         
-        # Добавляем разделитель
-        separator = tk.Frame(details_content, bg='#3498db', height=2)
-        separator.pack(fill=tk.X, pady=(0, 20))
+        # Конвертируем в hex
+        return '#{:02x}{:02x}{:02x}'.format(int(r*255), int(g*255), int(b*255))
+
+    def show_threat(self, threat_id):
+        """Визуализация выбранной угрозы"""
+        self.clear_animations()
+        self.current_threat = threat_id
+        self.protection_btn.config(state='normal')
         
-        # Заголовок подробной информации
-        details_title = tk.Label(details_content, 
-                               text="📋 Подробная информация и спецификации:",
-                               font=('Arial', 16, 'bold'),
-                               bg='#2c3e50', fg='#3498db',
-                               anchor='w')
-        details_title.pack(fill=tk.X, pady=(0, 15))
-        
-        # Добавляем подробности
-        details = card_data["data"].get("details", [])
-        for detail in details:
-            if detail.strip() == "":
-                # Пустая строка - добавляем отступ
-                tk.Frame(details_content, bg='#2c3e50', height=10).pack(fill=tk.X)
-            elif detail.startswith("  -"):
-                # Подпункт
-                subpoint_label = tk.Label(details_content, text=detail,
-                                        font=('Arial', 13),
-                                        bg='#2c3e50', fg='#bdc3c7',
-                                        anchor='w', justify=tk.LEFT)
-                subpoint_label.pack(fill=tk.X, padx=(30, 0), pady=2)
-            elif ":" in detail:
-                # Заголовок раздела с эмодзи
-                section_label = tk.Label(details_content, text=detail,
-                                       font=('Arial', 14, 'bold'),
-                                       bg='#2c3e50', fg='#2ecc71',
-                                       anchor='w', justify=tk.LEFT)
-                section_label.pack(fill=tk.X, pady=(10, 5))
-            else:
-                # Обычный текст
-                text_label = tk.Label(details_content, text=detail,
-                                    font=('Arial', 14),
-                                    bg='#2c3e50', fg='#ecf0f1',
-                                    anchor='w', justify=tk.LEFT)
-                text_label.pack(fill=tk.X, pady=2)
+        if threat_id in self.threat_animator.topology.threats:
+            self.threat_animator.animate_threat(threat_id)
+
+    def activate_protection(self):
+        """Активация защиты против текущей угрозы"""
+        if not self.current_threat:
+            return
+            
+        self.protection_active = True
+        self.protection_btn.config(state='disabled')
         
-        # Кнопка закрытия
-        close_frame = tk.Frame(details_content, bg='#2c3e50')
-        close_frame.pack(fill=tk.X, pady=(20, 0))
+        if self.current_threat in self.threat_animator.topology.threats:
+            self.threat_animator.animate_protection(self.current_threat)
+
+    def finish_threat(self, threat_id):
+        """Завершение отраженной угрозы: в сценарии убирается только она"""
+        if self.scenario is not None:
+            self.threat_animator.remove_threat(threat_id)
+        else:
+            self.clear_animations()
+
+    def play_scenario(self, path):
+        """Воспроизведение сценария учений: события по таймлайну, угрозы одновременно"""
+        try:
+            scenario = load_scenario(path, self.threat_animator.topology.threats)
+        except (OSError, ValueError, KeyError) as e:
+            messagebox.showerror("Сценарий учений", f"Не удалось загрузить сценарий:\n{e}")
+            return
         
-        close_btn = tk.Button(close_frame, text="✕ Свернуть",
-                            font=('Arial', 12, 'bold'),
-                            bg='#e74c3c', fg='white',
-                            relief='raised', bd=2,
-                            padx=15, pady=8,
-                            command=lambda: self.toggle_technical_card_expansion(card_id))
-        close_btn.pack(side=tk.RIGHT)
+        self.clear_animations()
+        timeline = self.threat_animator.timeline
+        self.scenario = scenario
+        for event in scenario["events"]:
+            timeline.call_later(event["at"], lambda event=event: self.threat_animator.run_event(event, timeline))
+        
+        last_event = scenario["events"][-1]["at"] if scenario["events"] else 0
+        timeline.call_later(scenario.get("duration", last_event + 4), self.clear_animations)
+        self.scenario_btn.config(text="⏹ Остановить сценарий")
+        
+    def toggle_flood_mode(self):
+        """Переключение визуализации DDoS потоком пакетов"""
+        animator = self.threat_animator
+        animator.flood_mode = not animator.flood_mode
+        self.flood_btn.config(text="🌊 Поток пакетов DDoS: " + ("вкл" if animator.flood_mode else "выкл"))
+        
+    def toggle_scenario(self):
+        """Запуск сценария учений по умолчанию или его остановка"""
+        if self.scenario is not None:
+            self.clear_animations()
+        else:
+            self.play_scenario(os.path.join(SCENARIO_DIR, "drill_basic.json"))
+
+    def clear_animations(self):
+        """Очистка всех слоев наложений (фон схемы не затрагивается)"""
+        self.threat_animator.reset()
+        if self.scenario is not None:
+            self.scenario = None
+            self.scenario_btn.config(text="🎬 Сценарий учений")
+        self.current_threat = None
+        self.protection_active = False
+        self.protection_btn.config(state='disabled')
+
+    def create_tooltip(self, widget, text):
+        """Создание всплывающей подсказки (общее окно подсказок)"""
+        self.tooltips.attach(widget, text)
+
+    def add_hover_effect(self, widget, normal_color, hover_color):
+        """Добавить эффект при наведении (не заменяя другие обработчики, например подсказки)"""
+        def on_enter(e):
+            widget.configure(bg=hover_color)
+            
+        def on_leave(e):
+            widget.configure(bg=normal_color)
+            
+        widget.bind("<Enter>", on_enter, add='+')
+        widget.bind("<Leave>", on_leave, add='+')
+
+    @profiled_phase
+    def load_scheme_image(self):
+        """Загрузка изображения схемы (декодирование - по требованию, в фоне)"""
+        try:
+            self.scheme_asset = self.assets.image("voip_scheme.png")
+        except FileNotFoundError:
+            self.show_error_message("Файл 'voip_scheme.png' не найден в папке с программой")
+            return
+        except Exception as e:
+            self.show_error_message(f"Ошибка загрузки изображения: {str(e)}")
+            return
+        self.root.after_idle(self.initial_resize)
+            
+    def show_error_message(self, message):
+        """Показать сообщение об ошибке"""
+        self.canvas.create_text(300, 150, text="⚠️ " + message, 
+                               font=("Arial", 16, "bold"), fill="#e74c3c")
+        self.canvas.create_text(300, 180, text="Поместите файл 'voip_scheme.png' в папку с программой", 
+                               font=("Arial", 13), fill="#3498db")
         
-        # Отображаем контейнер с подробностями ПОД основной карточкой
-        details_container.pack(fill=tk.X, pady=(5, 0))
+    def initial_resize(self):
+        """Первоначальное масштабирование изображения"""
+        if self.scheme_asset:
+            self.resize_image_fixed()
 
-    def create_requirements_tab(self):
-        """Вкладка с требованиями для КИИ с расширяемыми блоками"""
-        container, req_frame, canvas = self.create_scrollable_frame(self.notebook)
-        self.notebook.add(container, text="📊 Требования для КИИ")
+    @profiled_phase
+    def create_tasks_tab(self, parent):
+        """Вкладка с заданиями - улучшенная версия с адаптивными блоками"""
+        container, tasks_frame, canvas, scroll_listeners = self.create_scrollable_frame(parent)
+        container.pack(fill=tk.BOTH, expand=True)
         
-        title = tk.Label(req_frame, text="Требования для КИИ 3-й категории", 
+        title = tk.Label(tasks_frame, text="Задания кейса", 
                         font=('Arial', 28, 'bold'),
                         bg='#ecf0f1', fg='#2c3e50')
         title.pack(pady=20)
         
-        self.create_expandable_requirements_cards(req_frame)
-        
-    def create_expandable_requirements_cards(self, parent):
-        """Создание расширяемых карточек требований с использованием pack"""
-        main_container = ttk.Frame(parent, style='Light.TFrame')
-        main_container.pack(fill=tk.BOTH, expand=True, padx=25, pady=15)
-        
-        # Создаем два столбца
-        left_frame = ttk.Frame(main_container, style='Light.TFrame')
-        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=8)
-        
-        right_frame = ttk.Frame(main_container, style='Light.TFrame')
-        right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=8)
-        
-        requirements_data = [
-            {
-                "id": "req_app_software",
-                "icon": "🔐",
-                "category": "ПРИКЛАДНОЕ ПО",
-                "color": "#3498db",
-                "requirements": [
-                    "Безопасная разработка и поставка (п. 18 Приказа №239)",
-                    "Учет и управление доступом (RBAC, MFA)",
-                    "Защита информации (TLS, SRTP)",
-                    "Устойчивость к VoIP-атакам"
-                ],
-                "details": [
-                    "📦 Безопасная разработка и поставка (п. 18 Приказа №239):",
-                    "  - Поставка ПО только через защищенные каналы связи",
-                    "  - Проверка целостности и подлинности дистрибутивов",
-                    "  - Требование соблюдения практик Secure SDLC от вендоров",
-                    "  - Соответствие Приказу ФСТЭК №41 от 14.03.2022",
-                    "  - Предоставление документации по безопасной настройке",
-                    "",
-                    "🔑 Учет и управление доступом (п. 14 Приказа №239):",
-                    "  - Поддержка разграничения прав доступа на основе RBAC",
-                    "  - Стойкая аутентификация с интеграцией МФА",
-                    "  - Протоколирование всех критичных действий",
-                    "  - Контроль сессий и времени доступа",
-                    "  - Блокировка при превышении попыток входа",
-                    "",
-                    "🛡️ Защита информации:",
-                    "  - Поддержка TLS для SIP-сигнализации (SIP over TLS)",
-                    "  - Использование SRTP для шифрования медиатрафика",
-                    "  - Соответствие Приказу ФСТЭК №21 от 10.02.2022",
-                    "  - Защищенное хранение паролей и ключей шифрования",
-                    "  - Реализация Perfect Forward Secrecy",
-                    "",
-                    "⚡ Устойчивость к атакам:",
-                    "  - Устойчивость к типовым VoIP-атакам (SIP-флуд, спуфинг)",
-                    "  - Тестирование на проникновение (Penetration Testing)",
-                    "  - Защита от сканирования и reconnaissance-атак",
-                    "  - Обработка некорректных и malformed-пакетов"
-                ]
-            },
-            {
-                "id": "req_system_software",
-                "icon": "💻", 
-                "category": "СИСТЕМНОЕ ПО (LINUX)",
-                "color": "#2ecc71",
-                "requirements": [
-                    "Защищенная настройка (hardening)",
-                    "Минимизация функциональности",
-                    "Регулярное обновление ПО",
-                    "Контроль целостности (HIDS)"
-                ],
-                "details": [
-                    "🔒 Защищенная настройка (hardening):",
-                    "  - Использование актуальных поддерживаемых дистрибутивов",
-                    "  - Реализация защищенной настройки по руководствам ФСТЭК",
-                    "  - Настройка SELinux/AppArmor в режиме Enforcing",
-                    "  - Применение кастомных политик для VoIP-ПО",
-                    "  - Бездисковые (stateless) системы с RO корневой ФС",
-                    "",
-                    "🎯 Минимизация функциональности (п. 17 Приказа №239):",
-                    "  - Отключение неиспользуемых сетевых служб и портов",
-                    "  - Удаление ненужного ПО и демонов",
-                    "  - Ограничение прав процессов и пользователей",
-                    "  - Настройка firewall на уровне ОС",
-                    "  - Конфигурация минимально необходимых прав доступа",
-                    "",
-                    "🔄 Регулярное обновление (п. 18 Приказа №239):",
-                    "  - Регулярное обновление для устранения известных уязвимостей",
-                    "  - Автоматическое применение security-патчей",
-                    "  - Тестирование обновлений в тестовой среде",
-                    "  - Мониторинг уязвимостей CVE для используемого ПО",
-                    "  - План отката при проблемах с обновлениями",
-                    "",
-                    "📊 Контроль целостности:",
-                    "  - Установка и настройка HIDS (Wazuh, OSSEC, AIDE)",
-                    "  - Мониторинг критичных файлов конфигураций",
-                    "  - Контроль исполняемых файлов и системных библиотек",
-                    "  - Обнаружение несанкционированных изменений в реальном времени"
-                ]
-            },
-            {
-                "id": "req_virtualization",
-                "icon": "🖥️",
-                "category": "СИСТЕМА ВИРТУАЛИЗАЦИИ (KVM)", 
-                "color": "#e67e22",
-                "requirements": [
-                    "Изоляция виртуальных машин",
-                    "Разграничение прав доступа",
-                    "Защита образов ВМ",
-                    "Сетевые меры безопасности"
-                ],
-                "details": [
-                    "🔒 Изоляция виртуальных машин:",
-                    "  - Обеспечение изоляции ВМ друг от друга и от хостовой системы",
-                    "  - Использование 'Укрепленного гипервизора' на минимальном дистрибутиве",
-                    "  - Защита от VM escape-атак и меж-VM атак",
-                    "  - Настройка лимитов ресурсов для каждой ВМ",
-                    "  - Автоматическое анти-аффинити для критичных сервисов",
-                    "",
-                    "👤 Разграничение прав доступа:",
-                    "  - Разграничение прав доступа администраторов к панели управления",
-                    "  - RBAC для управления виртуальной инфраструктурой",
-                    "  - Аудит всех действий с гипервизором и ВМ",
-                    "  - Многофакторная аутентификация для доступа к управлению",
-                    "  - Принцип минимальных привилегий для администраторов",
-                    "",
-                    "💾 Защита образов ВМ:",
-                    "  - Защита образов виртуальных машин от несанкционированного доступа",
-                    "  - Шифрование конфигураций ВМ и снапшотов",
-                    "  - Контроль целостности образов ВМ",
-                    "  - Защита от копирования и несанкционированного распространения",
-                    "  - Регулярное обновление базовых образов (golden images)",
-                    "",
-                    "🌐 Сетевые меры безопасности:",
-                    "  - Использование выделенных изолированных сетей для управления",
-                    "  - Строгая изоляция на уровне vSwitch с VLAN и MAC-фильтрацией",
-                    "  - Сегментация виртуальной сети по функциональному назначению",
-                    "  - Контроль меж-VM трафика и предотвращение lateral movement"
-                ]
-            },
-            {
-                "id": "req_server_hardware",
-                "icon": "🔩",
-                "category": "СЕРВЕРНОЕ ОБОРУДОВАНИЕ",
-                "color": "#9b59b6",
-                "requirements": [
-                    "Аппаратное доверие (PFR, Secure Boot)",
-                    "Аппаратное шифрование (SED)",
-                    "Удаленное управление (iDRAC, iLO)",
-                    "Мониторинг состояния"
-                ],
-                "details": [
-                    "🛡️ Аппаратное доверие:",
-                    "  - Поддержка аппаратного доверия по цепочке загрузки",
-                    "  - Intel PFR (Platform Firmware Resilience) или AMD Secure Boot",
-                    "  - TPM 2.0 для проверки целостности при загрузке",
-                    "  - UEFI Secure Boot с подписанными образами",
-                    "  - Защита от атак на прошивку UEFI/BIOS",
-                    "",
-                    "🔐 Аппаратное шифрование:",
-                    "  - Self-Encrypting Drives (SED) с автоматическим шифрованием",
-                    "  - Управление ключами через HSM или специализированные системы",
-                    "  - Crypto-erase при изъятии дисков из системы",
-                    "  - Прозрачное шифрование 'на лету' без нагрузки на CPU",
-                    "  - Поддержка стандартов шифрования FIPS 140-2/3",
-                    "",
-                    "🎛️ Удаленное управление:",
-                    "  - Поддержка безопасного удаленного управления (iDRAC, iLO)",
-                    "  - Обязательное использование шифрования для управления",
-                    "  - Строгая аутентификация для доступа к системам управления",
-                    "  - Аудит всех действий удаленного управления",
-                    "  - Изоляция интерфейсов управления в отдельной сети",
-                    "",
-                    "📈 Мониторинг состояния:",
-                    "  - Аппаратный мониторинг состояния компонентов",
-                    "  - Контроль температуры, состояния дисков, памяти, вентиляторов",
-                    "  - Предупреждения о предотказном состоянии компонентов",
-                    "  - Интеграция с системами мониторинга инфраструктуры",
-                    "  - Прогнозирование отказов и планирование замены оборудования"
-                ]
-            },
-            {
-                "id": "req_network_equipment",
-                "icon": "📡",
-                "category": "СЕТЕВОЕ ОБОРУДОВАНИЕ", 
-                "color": "#e74c3c",
-                "requirements": [
-                    "Обновление микропрограмм",
-                    "Безопасные протоколы управления",
-                    "Защита консоли управления",
-                    "Поддержка стандартов"
-                ],
-                "details": [
-                    "🔄 Обновление микропрограмм:",
-                    "  - Возможность обновления микропрограммного обеспечения",
-                    "  - Регулярное применение обновлений безопасности",
-                    "  - Тестирование обновлений в тестовой среде",
-                    "  - План отката при проблемах с обновлениями",
-                    "  - Мониторинг уязвимостей для сетевого оборудования",
-                    "",
-                    "🔐 Безопасные протоколы управления:",
-                    "  - Поддержка безопасных протоколов управления (SSH, SNMPv3)",
-                    "  - Полный отказ от небезопасных протоколов (Telnet, FTP, SNMPv1/v2c)",
-                    "  - Использование TLS для веб-интерфейсов управления",
-                    "  - Аутентификация на основе сертификатов для административного доступа",
-                    "  - Шифрование всего трафика управления",
-                    "",
-                    "🚪 Защита консоли управления:",
-                    "  - Наличие средств защиты от несанкционированного доступа к консоли",
-                    "  - Аутентификация для доступа к физическим интерфейсам",
-                    "  - Блокировка при превышении попыток входа",
-                    "  - Аудит всех действий через консоль управления",
-                    "  - Физическая защита сетевого оборудования",
-                    "",
-                    "📋 Поддержка стандартов:",
-                    "  - Для медиашлюзов - поддержка SRTP и TLS",
-                    "  - Поддержка современных стандартов шифрования",
-                    "  - Соответствие отраслевым стандартам связи",
-                    "  - Сертификация оборудования для использования в КИИ",
-                    "  - Поддержка функций безопасности (MACsec, 802.1X)"
-                ]
-            },
-            {
-                "id": "req_general",
-                "icon": "🎯",
-                "category": "ОБЩИЕ ТРЕБОВАНИЯ",
-                "color": "#f1c40f",
-                "requirements": [
-                    "Жизненный цикл и сопровождение",
-                    "Документирование и регламентация", 
-                    "Резервирование и отказоустойчивость",
-                    "Соответствие нормативным актам"
-                ],
-                "details": [
-                    "📅 Жизненный цикл и сопровождение:",
-                    "  - Все компоненты должны находиться на активной стадии жизненного цикла",
-                    "  - Регулярное получение обновлений безопасности от производителя",
-                    "  - Техническая поддержка для всех компонентов инфраструктуры",
-                    "  - Запрет использования неподдерживаемого ПО и оборудования",
-                    "  - План миграции при окончании поддержки компонентов",
-                    "",
-                    "📋 Документирование и регламентация (п. 6, 10 Приказа №239):",
-                    "  - Разработка регламентов по безопасной настройке всех компонентов",
-                    "  - Инструкции по администрированию и обновлению",
-                    "  - Документация по архитектуре и конфигурациям безопасности",
-                    "  - Процедуры реагирования на инциденты для каждого компонента",
-                    "  - Регулярный пересмотр и актуализация документации",
-                    "",
-                    "🔄 Резервирование и отказоустойчивость (п. 19 Приказа №239):",
-                    "  - Резервирование всех критичных компонентов (серверы, каналы, SBC)",
-                    "  - Обеспечение требуемой доступности услуги связи",
-                    "  - Автоматическое переключение на резервные компоненты",
-                    "  - Географическое распределение критичной инфраструктуры",
-                    "  - Регулярное тестирование отказоустойчивости системы",
-                    "",
-                    "⚖️ Соответствие нормативным актам:",
-                    "  - Полное соответствие требованиям ФСТЭК России №239",
-                    "  - Соответствие смежным НПА (№187-ФЗ, №152-ФЗ, №126-ФЗ)",
-                    "  - Сертификация средств защиты информации при необходимости",
-                    "  - Регулярные аудиты и проверки соответствия",
-                    "  - Документирование выполнения всех требований регуляторов"
-                ]
-            }
-        ]
+        cards_container = ttk.Frame(tasks_frame, style='Light.TFrame')
+        cards_container.pack(fill=tk.BOTH, expand=True, padx=25, pady=15)
         
-        # Распределяем карточки по двум столбцам
-        for i, requirement in enumerate(requirements_data):
-            if i % 2 == 0:
-                card = self.create_expandable_requirement_card(left_frame, requirement)
-                card.pack(fill=tk.X, pady=10)
-            else:
-                card = self.create_expandable_requirement_card(right_frame, requirement)
-                card.pack(fill=tk.X, pady=10)
-    
-    def create_expandable_requirement_card(self, parent, requirement_data):
-        """Создание расширяемой карточки требований с кнопкой раскрытия"""
-        card_container = tk.Frame(parent, bg='#ecf0f1')
+        tasks_data = self.content.get("tasks")
         
-        # Основная карточка
-        card = tk.Frame(card_container, bg='#34495e', relief='raised', bd=2, 
-                       height=320, width=900, cursor="arrow")
+        for i, task in enumerate(tasks_data):
+            row = i // 2
+            col = i % 2
+            
+            task_card = self.create_task_card(cards_container, task["number"], task["title"], task["description"])
+            task_card.grid(row=row, column=col, padx=20, pady=20, sticky='nsew')
+            
+            cards_container.grid_rowconfigure(row, weight=1)
+            cards_container.grid_columnconfigure(col, weight=1)
+            
+    def create_task_card(self, parent, number, title, description):
+        """Создание адаптивной карточки задания"""
+        card = tk.Frame(parent, bg='#34495e', relief='raised', bd=3, width=880, height=200)
         card.pack_propagate(False)
-        card.pack(fill=tk.X)
-        
-        # Заголовок карточки
-        header_frame = tk.Frame(card, bg=requirement_data["color"], height=70)
-        header_frame.pack_propagate(False)
-        header_frame.pack(fill=tk.X, padx=3, pady=3)
-        
-        header_content = tk.Frame(header_frame, bg=requirement_data["color"])
-        header_content.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
         
-        icon_frame = tk.Frame(header_content, bg=requirement_data["color"])
-        icon_frame.pack(side=tk.LEFT)
-        
-        icon_label = tk.Label(icon_frame, text=requirement_data["icon"], 
-                             font=('Arial', 22), bg=requirement_data["color"], fg='white')
-        icon_label.pack(side=tk.LEFT)
+        num_frame = tk.Frame(card, bg='#3498db', width=80, height=80)
+        num_frame.pack_propagate(False)
+        num_frame.pack(side=tk.LEFT, padx=25, pady=25)
         
-        title_label = tk.Label(icon_frame, text=requirement_data["category"], 
-                              font=('Arial', 18, 'bold'), bg=requirement_data["color"], fg='white')
-        title_label.pack(side=tk.LEFT, padx=12)
+        num_label = tk.Label(num_frame, text=number, font=('Arial', 28, 'bold'),
+                            bg='#3498db', fg='white')
+        num_label.pack(expand=True)
         
-        # Содержимое карточки
-        content_frame = tk.Frame(card, bg='#34495e')
-        content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=18)
+        text_frame = tk.Frame(card, bg='#34495e')
+        text_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=20, pady=25)
         
-        for i, requirement in enumerate(requirement_data["requirements"]):
-            req_frame = tk.Frame(content_frame, bg='#34495e')
-            req_frame.pack(fill=tk.X, pady=6)
-            
-            number_label = tk.Label(req_frame, text=f"{i+1}.", font=('Arial', 14, 'bold'),
-                                  bg='#34495e', fg=requirement_data["color"])
-            number_label.pack(side=tk.LEFT)
-            
-            req_text = tk.Label(req_frame, text=requirement, 
-                              font=('Arial', 14), bg='#34495e', fg='#ecf0f1',
-                              anchor='w', justify=tk.LEFT)
-            req_text.pack(side=tk.LEFT, padx=10, fill=tk.X, expand=True)
+        title_label = tk.Label(text_frame, text=title, font=('Arial', 18, 'bold'),
+                              bg='#34495e', fg='#3498db', anchor='w')
+        title_label.pack(fill=tk.X, pady=(0, 15))
         
-        # Кнопка раскрытия в правом нижнем углу
-        expand_btn_frame = tk.Frame(card, bg='#34495e')
-        expand_btn_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=10)
+        desc_label = tk.Label(text_frame, text=description, font=('Arial', 15),
+                             bg='#34495e', fg='#ecf0f1', anchor='w', justify=tk.LEFT)
+        desc_label.pack(fill=tk.BOTH, expand=True)
         
-        expand_btn = tk.Button(expand_btn_frame,
-                             text="▼",
-                             font=('Arial', 11, 'bold'),
-                             bg=requirement_data["color"],
-                             fg='white',
-                             relief='raised',
-                             bd=2,
-                             padx=15,
-                             pady=6,
-                             command=lambda rid=requirement_data["id"]: self.toggle_requirements_card_expansion(rid))
-        expand_btn.pack(side=tk.RIGHT)
+        self.add_hover_effect(card, '#34495e', '#2c3e50')
         
-        # Контейнер для подробной информации
-        details_container = tk.Frame(card_container, bg='#2c3e50', relief='sunken', bd=1)
-        
-        # Сохраняем состояние карточки
-        self.expanded_requirements_cards[requirement_data["id"]] = {
-            "expanded": False,
-            "card_container": card_container,
-            "details_container": details_container,
-            "data": requirement_data,
-            "button": expand_btn
-        }
+        return card
+
+    def create_card_columns(self, parent):
+        """Два столбца для карточек вкладки"""
+        main_container = ttk.Frame(parent, style='Light.TFrame')
+        main_container.pack(fill=tk.BOTH, expand=True, padx=25, pady=15)
         
-        self.add_hover_effect(card, '#34495e', '#2c3e50')
+        left_frame = ttk.Frame(main_container, style='Light.TFrame')
+        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=8)
         
-        return card_container
+        right_frame = ttk.Frame(main_container, style='Light.TFrame')
+        right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=8)
+        return left_frame, right_frame
 
-    def toggle_requirements_card_expansion(self, card_id):
-        """Переключение состояния расширения карточки требований"""
-        card_data = self.expanded_requirements_cards[card_id]
+    def create_card_list(self, parent, canvas, scroll_listeners, kind, items):
+        """Карточки в два столбца; длинные списки - виртуализированные"""
+        if len(items) >= self.virtual_threshold:
+            card_list = VirtualCardList(parent, canvas, scroll_listeners, self.cards, kind, items)
+            card_list.frame.pack(padx=25, pady=15)
+            return card_list
+        return self.cards.build_all(kind, self.create_card_columns(parent), items)
+
+    @profiled_phase
+    def create_threats_tab(self, parent):
+        """Вкладка с угрозами - с расширяемыми блоками"""
+        container, threats_frame, canvas, scroll_listeners = self.create_scrollable_frame(parent)
+        container.pack(fill=tk.BOTH, expand=True)
         
-        if card_data["expanded"]:
-            card_data["details_container"].pack_forget()
-            card_data["button"].config(text="▼")
-            card_data["expanded"] = False
-        else:
-            self.show_requirements_details(card_id)
-            card_data["button"].config(text="▲")
-            card_data["expanded"] = True
-    
-    def show_requirements_details(self, card_id):
-        """Показ подробной информации требований"""
-        card_data = self.expanded_requirements_cards[card_id]
-        details_container = card_data["details_container"]
+        title = tk.Label(threats_frame, text="Анализ угроз безопасности", 
+                        font=('Arial', 28, 'bold'),
+                        bg='#ecf0f1', fg='#2c3e50')
+        title.pack(pady=20)
         
-        # Очищаем предыдущее содержимое
-        for widget in details_container.winfo_children():
-            widget.destroy()
+        # ПОЛНЫЙ СПИСОК УГРОЗ согласно разделу 2 пояснительной записки
+        self.create_card_list(threats_frame, canvas, scroll_listeners, "threats", self.content.get("threats"))
+
+    @profiled_phase
+    def create_measures_tab(self, parent):
+        """Вкладка с мерами защиты с расширяемыми блоками"""
+        container, measures_frame, canvas, scroll_listeners = self.create_scrollable_frame(parent)
+        container.pack(fill=tk.BOTH, expand=True)
         
-        # Создаем содержимое подробной информации
-        details_content = tk.Frame(details_container, bg='#2c3e50')
-        details_content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        title = tk.Label(measures_frame, text="Система мер защиты", 
+                        font=('Arial', 28, 'bold'),
+                        bg='#ecf0f1', fg='#2c3e50')
+        title.pack(pady=20)
         
-        # Добавляем разделитель
-        separator = tk.Frame(details_content, bg=card_data["data"].get("color", "#3498db"), height=2)
-        separator.pack(fill=tk.X, pady=(0, 20))
+        # Организационные (раздел 3.1) и технические (раздел 3.2) меры пояснительной записки
+        columns = self.create_card_columns(measures_frame)
+        for column_frame, group in zip(columns, self.content.get("measures")):
+            group_title = tk.Label(column_frame, text=group["title"], 
+                                  font=('Arial', 20, 'bold'),
+                                  bg='#ecf0f1', fg='#2c3e50')
+            group_title.pack(pady=(0, 20))
+            self.cards.build_all("measures", (column_frame,), group["cards"])
+
+    @profiled_phase
+    def create_technical_tab(self, parent):
+        """Вкладка с техническими средствами - с расширяемыми блоками"""
+        container, tech_frame, canvas, scroll_listeners = self.create_scrollable_frame(parent)
+        container.pack(fill=tk.BOTH, expand=True)
         
-        # Заголовок подробной информации
-        details_title = tk.Label(details_content, 
-                               text="📋 Подробная информация и спецификации:",
-                               font=('Arial', 16, 'bold'),
-                               bg='#2c3e50', fg=card_data["data"].get("color", "#3498db"),
-                               anchor='w')
-        details_title.pack(fill=tk.X, pady=(0, 15))
-        
-        # Добавляем подробности
-        details = card_data["data"].get("details", [])
-        for detail in details:
-            if detail.strip() == "":
-                # Пустая строка - добавляем отступ
-                tk.Frame(details_content, bg='#2c3e50', height=10).pack(fill=tk.X)
-            elif detail.startswith("  -"):
-                # Подпункт
-                subpoint_label = tk.Label(details_content, text=detail,
-                                        font=('Arial', 13),
-                                        bg='#2c3e50', fg='#bdc3c7',
-                                        anchor='w', justify=tk.LEFT)
-                subpoint_label.pack(fill=tk.X, padx=(30, 0), pady=2)
-            elif ":" in detail:
-                # Заголовок раздела с эмодзи
-                section_label = tk.Label(details_content, text=detail,
-                                       font=('Arial', 14, 'bold'),
-                                       bg='#2c3e50', fg='#2ecc71',
-                                       anchor='w', justify=tk.LEFT)
-                section_label.pack(fill=tk.X, pady=(10, 5))
-            else:
-                # Обычный текст
-                text_label = tk.Label(details_content, text=detail,
-                                    font=('Arial', 14),
-                                    bg='#2c3e50', fg='#ecf0f1',
-                                    anchor='w', justify=tk.LEFT)
-                text_label.pack(fill=tk.X, pady=2)
+        title = tk.Label(tech_frame, text="Технические средства защиты", 
+                        font=('Arial', 28, 'bold'),
+                        bg='#ecf0f1', fg='#2c3e50')
+        title.pack(pady=20)
         
-        # Кнопка закрытия
-        close_frame = tk.Frame(details_content, bg='#2c3e50')
-        close_frame.pack(fill=tk.X, pady=(20, 0))
+        self.create_card_list(tech_frame, canvas, scroll_listeners, "technical", self.content.get("technical"))
+
+    @profiled_phase
+    def create_requirements_tab(self, parent):
+        """Вкладка с требованиями для КИИ с расширяемыми блоками"""
+        container, req_frame, canvas, scroll_listeners = self.create_scrollable_frame(parent)
+        container.pack(fill=tk.BOTH, expand=True)
         
-        close_btn = tk.Button(close_frame, text="✕ Свернуть",
-                            font=('Arial', 12, 'bold'),
-                            bg='#e74c3c', fg='white',
-                            relief='raised', bd=2,
-                            padx=15, pady=8,
-                            command=lambda: self.toggle_requirements_card_expansion(card_id))
-        close_btn.pack(side=tk.RIGHT)
+        title = tk.Label(req_frame, text="Требования для КИИ 3-й категории", 
+                        font=('Arial', 28, 'bold'),
+                        bg='#ecf0f1', fg='#2c3e50')
+        title.pack(pady=20)
         
-        # Отображаем контейнер с подробностями ПОД основной карточкой
-        details_container.pack(fill=tk.X, pady=(5, 0))
+        self.create_card_list(req_frame, canvas, scroll_listeners, "requirements", self.content.get("requirements"))
 
-    def create_regulations_tab(self):
+    @profiled_phase
+    def create_regulations_tab(self, parent):
         """Вкладка с нормативно-правовыми актами"""
-        container, reg_frame, canvas = self.create_scrollable_frame(self.notebook)
-        self.notebook.add(container, text="📚 НПА КИИ")
+        container, reg_frame, canvas, scroll_listeners = self.create_scrollable_frame(parent)
+        container.pack(fill=tk.BOTH, expand=True)
         
         title = tk.Label(reg_frame, text="Нормативно-Правовые Акты для КИИ", 
                         font=('Arial', 24, 'bold'),
@@ -2396,107 +3116,7 @@ class VoIPSecurityGuide:
         cards_container = ttk.Frame(parent, style='Light.TFrame')
         cards_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
-        regulations_data = [
-            {
-                "icon": "⚖️",
-                "title": "Федеральный закон от 26.07.2017 № 187-ФЗ",
-                "type": "🔑 Ключевой НПА",
-                "type_color": "#e74c3c",
-                "adopted_by": "Госдума, Совет Федерации",
-                "date": "26.07.2017",
-                "content": "Определяет основные понятия (КИИ, значимый объект, инцидент), субъектов КИИ, принципы обеспечения безопасности, полномочия госорганов (ФСТЭК, ФСБ). Устанавливает обязанность по обеспечению безопасности и категорированию объектов."
-            },
-            {
-                "icon": "📋",
-                "title": "Указ Президента РФ от 16.08.2004 № 1085",
-                "type": "🔑 Ключевой НПА", 
-                "type_color": "#e74c3c",
-                "adopted_by": "Президент РФ",
-                "date": "16.08.2004",
-                "content": "Наделяет ФСТЭК России полномочиями по разработке и принятию нормативных актов в области безопасности КИИ, а также по контролю и надзору."
-            },
-            {
-                "icon": "🛡️",
-                "title": "Приказ ФСТЭК России от 25.12.2017 № 239",
-                "type": "🔑 Ключевой НПА",
-                "type_color": "#e74c3c",
-                "adopted_by": "ФСТЭК России",
-                "date": "25.12.2017", 
-                "content": "Устанавливает конкретные детальные требования по 6-ти мерам безопасности: 1. Организация защиты; 2. Инцидентный менеджмент; 3. Управление доступом; 4. Защита среды; 5. Защита ТС/СВТ; 6. Защита ПАК."
-            },
-            {
-                "icon": "🔍",
-                "title": "Приказ ФСТЭК России от 21.12.2017 № 235",
-                "type": "📖 Сопутствующий НПА",
-                "type_color": "#3498db",
-                "adopted_by": "ФСТЭК России",
-                "date": "21.12.2017",
-                "content": "Регламентирует процедуру проведения проверок ФСТЭК соблюдения требований безопасности. Знание этого документа важно для подготовки к аудиту."
-            },
-            {
-                "icon": "📊",
-                "title": "Приказ ФСТЭК России от 25.12.2017 № 240", 
-                "type": "📖 Сопутствующий НПА",
-                "type_color": "#3498db",
-                "adopted_by": "ФСТЭК России",
-                "date": "25.12.2017",
-                "content": "Детально описывает методику присвоения категории значимому объекту КИИ (в нашем случае - 3-я категория). Объясняет, по каким критериям производится оценка."
-            },
-            {
-                "icon": "🔄",
-                "title": "Приказ ФСТЭК России от 08.11.2021 № 239",
-                "type": "📖 Сопутствующий НПА",
-                "type_color": "#3498db",
-                "adopted_by": "ФСТЭК России", 
-                "date": "08.11.2021",
-                "content": "Более современный и детализированный документ, развивающий требования Приказа №239. Содержит 68 конкретных мероприятий по защите. Крайне важен для проектирования современной СЗИ."
-            },
-            {
-                "icon": "💾",
-                "title": "Приказ ФСТЭК России от 11.02.2013 № 17",
-                "type": "📖 Сопутствующий НПА",
-                "type_color": "#3498db",
-                "adopted_by": "ФСТЭК России",
-                "date": "11.02.2013",
-                "content": "Хотя напрямую не про КИИ, его требования к средствам защиты информации (СЗИ) часто используются на практике. Регламентирует использование межсетевых экранов, СОВ, антивирусов."
-            },
-            {
-                "icon": "👤",
-                "title": "Федеральный закон от 27.07.2006 № 152-ФЗ",
-                "type": "📖 Сопутствующий НПА",
-                "type_color": "#3498db", 
-                "adopted_by": "Госдума РФ",
-                "date": "27.07.2006",
-                "content": "Поскольку в VoIP-системе обрабатываются данные абонентов (номера, история звонков), необходимо соблюдать требования по защите персональных данных. Требует их шифрования, регламентирования обработки и т.д."
-            },
-            {
-                "icon": "📝",
-                "title": "Приказ ФСТЭК России от 18.02.2013 № 21",
-                "type": "📖 Сопутствующий НПА",
-                "type_color": "#3498db",
-                "adopted_by": "ФСТЭК России",
-                "date": "18.02.2013",
-                "content": "Устанавливает конкретные меры для выполнения Закона №152-ФЗ. Требует, среди прочего, автоматической регистрации событий в системе (что пересекается с требованиями по аудиту для КИИ)."
-            },
-            {
-                "icon": "📡",
-                "title": "Федеральный закон от 07.07.2003 № 126-ФЗ",
-                "type": "🏭 Отраслевой НПА", 
-                "type_color": "#2ecc71",
-                "adopted_by": "Госдума РФ",
-                "date": "07.07.2003",
-                "content": "Определяет общие принципы работы сетей связи на территории РФ. Устанавливает обязанность операторов связи обеспечивать устойчивость и безопасность сетей связи."
-            },
-            {
-                "icon": "📋",
-                "title": "Постановление Правительства РФ от 16.03.2021 № 396",
-                "type": "🏭 Отраслевой НПА",
-                "type_color": "#2ecc71",
-                "adopted_by": "Правительство РФ",
-                "date": "16.03.2021",
-                "content": "Может требовать проведения обязательной сертификации некоторых технических средств связи, используемых в инфраструктуре."
-            }
-        ]
+        regulations_data = self.content.get("regulations")
         
         for i, regulation in enumerate(regulations_data):
             row = i // 2
@@ -2587,6 +3207,7 @@ class VoIPSecurityGuide:
         
         return card
         
+    @profiled_phase
     def create_footer(self):
         """Создание футера с подсказками управления"""
         footer_frame = ttk.Frame(self.main_frame, style='Dark.TFrame')
@@ -2600,16 +3221,69 @@ class VoIPSecurityGuide:
         footer_label.pack(pady=10)
         
         # Подсказки управления
-        controls_text = "💡 Управление: F11 - переключение полноэкранного режима • ESC - выход из полноэкранного режима • Колесо мыши - прокрутка вкладок • Shift+колесо - горизонтальная прокрутка"
+        controls_text = "💡 Управление: F11 - переключение полноэкранного режима • ESC - выход из полноэкранного режима • Колесо мыши - прокрутка вкладок • Shift+колесо - горизонтальная прокрутка • Колесо над схемой - масштаб, перетаскивание - сдвиг, двойной щелчок - сброс • F9 - HUD производительности • F12 - отчет о запуске"
         controls_label = tk.Label(footer_frame, text=controls_text,
                                 font=('Arial', 12),
                                 bg='#2c3e50', fg='#95a5a6')
         controls_label.pack(pady=6)
 
-def main():
+def parse_args(argv=None):
+    """Разбор аргументов командной строки"""
+    parser = argparse.ArgumentParser(description="Справочник по безопасности VoIP")
+    parser.add_argument("--startup-report", nargs="?", const="-", metavar="PATH",
+                        help="записать JSON-отчет о фазах запуска в файл (или в stdout)")
+    parser.add_argument("--no-prefetch", action="store_true",
+                        help="не строить вкладки в фоне, только при открытии")
+    parser.add_argument("--exit-after-startup", action="store_true",
+                        help="закрыть окно после запуска и первой отрисовки схемы")
+    parser.add_argument("--scenario", metavar="PATH",
+                        help="воспроизвести сценарий учений после запуска")
+    parser.add_argument("--detail-cache", type=int, metavar="N",
+                        help="хранить не более N построенных панелей подробностей (по умолчанию без лимита)")
+    parser.add_argument("--virtual-cards", type=int, default=VIRTUAL_LIST_THRESHOLD, metavar="N",
+                        help="виртуализировать списки от N карточек (по умолчанию "
+                             f"{VIRTUAL_LIST_THRESHOLD}, 0 - всегда)")
+    return parser.parse_args(argv)
+
+
+def write_startup_report(app, path):
+    """Запись JSON-отчета профилировщика"""
+    report = app.profiler.report()
+    report["memory"] = app.assets.memory_usage()
+    report["caches"] = app.cache_stats()
+    report["interface"] = app.interface_stats()
+    report = json.dumps(report, ensure_ascii=False, indent=2)
+    if path == "-":
+        print(report)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(report)
+
+
+def exit_when_painted(app, timeout_ms=10000, interval_ms=50):
+    """Закрытие окна, как только схема отрисована (или по таймауту)"""
+    if "scheme_painted" in app.profiler.marks or timeout_ms <= 0:
+        app.root.destroy()
+        return
+    app.root.after(interval_ms, lambda: exit_when_painted(app, timeout_ms - interval_ms, interval_ms))
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    profiler = StartupProfiler()
     root = tk.Tk()
-    app = VoIPSecurityGuide(root)
+    profiler.root = root
+    app = VoIPSecurityGuide(root, prefetch_tabs=not args.no_prefetch, profiler=profiler,
+                            detail_cache_limit=args.detail_cache, virtual_threshold=args.virtual_cards)
+    if args.startup_report:
+        app.startup_callbacks.append(lambda a: write_startup_report(a, args.startup_report))
+    if args.scenario:
+        app.startup_callbacks.append(lambda a: a.play_scenario(args.scenario))
+    if args.exit_after_startup:
+        app.startup_callbacks.append(exit_when_painted)
     root.mainloop()
+    app.image_worker.shutdown()
+    return app
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
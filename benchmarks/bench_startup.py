@@ -0,0 +1,242 @@
+"""Бенчмарк холодного запуска справочника: от запуска интерпретатора до первого кадра.
+
+Каждый прогон запускает main() в новом интерпретаторе под виртуальным
+X-дисплеем (Xvfb) и измеряет от момента запуска процесса в родителе:
+  * время старта интерпретатора до первой строки бенчмарка (interpreter_start);
+  * время импорта tkinter, PIL и colorsys, а также самого модуля;
+  * время до первого простоя mainloop (first_idle);
+  * время до первой отрисовки схемы архитектуры (scheme_painted);
+  * время до построения всех вкладок (startup_complete).
+
+Результаты сравниваются с сохраненной базовой линией (baseline.json),
+регрессии выше порога приводят к коду возврата 1.
+
+Использование:
+    python benchmarks/bench_startup.py                  # прогоны + сравнение
+    python benchmarks/bench_startup.py --save-baseline  # обновить базовую линию
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+MODULE_NAME = "VOIP_case2_krypto_cats"
+
+# Метрики в порядке вывода
+METRICS = [
+    "interpreter_start_ms",
+    "import_colorsys_ms",
+    "import_tkinter_ms",
+    "import_pil_ms",
+    "import_module_ms",
+    "first_idle_ms",
+    "scheme_painted_ms",
+    "startup_complete_ms",
+]
+
+
+def run_child(output_path, launched, app_args):
+    """Роль дочернего процесса: замеры внутри свежего интерпретатора.
+
+    launched - time.time() родителя непосредственно перед запуском процесса;
+    perf_counter сравним только внутри процесса, поэтому старт интерпретатора
+    считается по общим часам, а дальнейшие отметки - по perf_counter.
+    """
+    t0 = time.perf_counter()
+    started = (time.time() - launched) * 1000
+    result = {"interpreter_start_ms": started}
+
+    def timed_import(key, *modules):
+        start = time.perf_counter()
+        for name in modules:
+            __import__(name)
+        result[key] = (time.perf_counter() - start) * 1000
+
+    timed_import("import_colorsys_ms", "colorsys")
+    timed_import("import_tkinter_ms", "tkinter")
+    timed_import("import_pil_ms", "PIL.Image", "PIL.ImageTk")
+
+    sys.path.insert(0, REPO_DIR)
+    timed_import("import_module_ms", MODULE_NAME)
+    module = sys.modules[MODULE_NAME]
+
+    app = module.main(["--exit-after-startup"] + app_args)
+
+    # Отметки профилировщика отсчитываются от его создания - приводим к запуску процесса
+    offset = (app.profiler.origin - t0) * 1000 + started
+    for mark in ("first_idle", "scheme_painted", "startup_complete"):
+        value = app.profiler.marks.get(mark)
+        result[mark + "_ms"] = None if value is None else value + offset
+    result["phases"] = app.profiler.phases
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False)
+
+
+class VirtualDisplay:
+    """Запуск Xvfb на свободном номере дисплея"""
+
+    def __init__(self, size="1920x1080x24"):
+        self.size = size
+        self.process = None
+        self.display = None
+
+    def __enter__(self):
+        xvfb = shutil.which("Xvfb")
+        if xvfb is None:
+            raise RuntimeError("Xvfb не найден: установите пакет xvfb или укажите --display")
+        for number in range(99, 140):
+            if os.path.exists(f"/tmp/.X11-unix/X{number}") or os.path.exists(f"/tmp/.X{number}-lock"):
+                continue
+            self.process = subprocess.Popen(
+                [xvfb, f":{number}", "-screen", "0", self.size, "-nolisten", "tcp"],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            socket_path = f"/tmp/.X11-unix/X{number}"
+            for _ in range(100):
+                if os.path.exists(socket_path):
+                    self.display = f":{number}"
+                    return self
+                if self.process.poll() is not None:
+                    break
+                time.sleep(0.05)
+            self.__exit__(None, None, None)
+        raise RuntimeError("Не удалось запустить Xvfb")
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            self.process.wait()
+        self.process = None
+
+
+def run_once(display, app_args):
+    """Один прогон в новом интерпретаторе"""
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = os.path.join(tmp, "result.json")
+        env = dict(os.environ, DISPLAY=display)
+        cmd = [sys.executable, os.path.abspath(__file__), "--child", output_path,
+               "--launched", repr(time.time()), "--"] + app_args
+        subprocess.run(cmd, cwd=REPO_DIR, env=env, check=True, timeout=120)
+        with open(output_path, encoding="utf-8") as f:
+            return json.load(f)
+
+
+def summarize(runs):
+    """Медиана и минимум по каждой метрике"""
+    summary = {}
+    for metric in METRICS:
+        values = [run[metric] for run in runs if run.get(metric) is not None]
+        if values:
+            summary[metric] = {
+                "median": round(statistics.median(values), 2),
+                "min": round(min(values), 2),
+            }
+    return summary
+
+
+def compare(summary, baseline, threshold):
+    """Печать таблицы и поиск регрессий относительно базовой линии"""
+    regressions = []
+    print(f"{'Метрика':<24}{'медиана':>12}{'минимум':>12}{'база':>12}{'изм.':>10}")
+    for metric in METRICS:
+        current = summary.get(metric)
+        if current is None:
+            print(f"{metric:<24}{'-':>12}")
+            continue
+        base = baseline.get(metric, {}).get("median") if baseline else None
+        delta_text = ""
+        if base:
+            delta = (current["median"] - base) / base
+            delta_text = f"{delta:+.1%}"
+            if delta > threshold:
+                regressions.append(metric)
+        base_text = f"{base:.1f}" if base else "-"
+        print(f"{metric:<24}{current['median']:>12.1f}{current['min']:>12.1f}{base_text:>12}{delta_text:>10}")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк холодного запуска справочника VoIP")
+    parser.add_argument("--runs", type=int, default=5, help="количество прогонов (по умолчанию 5)")
+    parser.add_argument("--display", help="использовать существующий X-дисплей вместо Xvfb")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="путь к файлу базовой линии")
+    parser.add_argument("--save-baseline", action="store_true", help="сохранить результаты как базовую линию")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="допустимое ухудшение медианы (доля, по умолчанию 0.15)")
+    parser.add_argument("--json", metavar="PATH", help="записать сводку и все прогоны в JSON")
+    parser.add_argument("--child", metavar="OUTPUT", help=argparse.SUPPRESS)
+    parser.add_argument("--launched", type=float, help=argparse.SUPPRESS)
+    parser.add_argument("app_args", nargs="*", help="аргументы для main() после --")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.child:
+        run_child(args.child, args.launched, args.app_args)
+        return 0
+
+    runs = []
+    failure = None
+    try:
+        if args.display:
+            for _ in range(args.runs):
+                runs.append(run_once(args.display, args.app_args))
+        else:
+            with VirtualDisplay() as display:
+                for _ in range(args.runs):
+                    runs.append(run_once(display.display, args.app_args))
+    except RuntimeError as e:
+        print(f"Ошибка: {e}", file=sys.stderr)
+        return 2
+    except subprocess.CalledProcessError as e:
+        failure = f"прогон {len(runs) + 1} из {args.runs} завершился с кодом {e.returncode}"
+    except subprocess.TimeoutExpired as e:
+        failure = f"прогон {len(runs) + 1} из {args.runs} не завершился за {e.timeout:.0f} с"
+
+    if failure:
+        print(f"Ошибка: {failure}", file=sys.stderr)
+        if not runs:
+            return 2
+        # Сводка по завершенным прогонам все равно печатается и сохраняется
+        print(f"Успешных прогонов: {len(runs)}")
+
+    summary = summarize(runs)
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f).get("summary")
+
+    regressions = compare(summary, baseline, args.threshold)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"summary": summary, "runs": runs, "failure": failure},
+                      f, ensure_ascii=False, indent=2)
+
+    if failure:
+        return 2
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "runs": args.runs, "summary": summary},
+                      f, ensure_ascii=False, indent=2)
+        print(f"Базовая линия сохранена: {args.baseline}")
+        return 0
+
+    if regressions:
+        print("Регрессии: " + ", ".join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""Хранилище содержимого справочника VoIP.
+
+Тексты вкладок хранятся в версионированных JSON-файлах каталога content/
+(по одному файлу на раздел). Шаг сборки компилирует их в компактный
+бинарный кэш content/content.cache, который открывается через mmap:
+при запросе раздела десериализуется только его срез файла.
+
+Формат кэша:
+    заголовок  <6sHI  - сигнатура, версия формата, длина индекса
+    индекс     JSON   - версии, отпечатки исходников, смещения разделов
+    данные     marshal-блоки разделов подряд
+
+Сборка кэша:
+    python content_store.py build
+"""
+import json
+import marshal
+import mmap
+import os
+import struct
+import sys
+
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content")
+CACHE_NAME = "content.cache"
+
+# Поддерживаемая версия схемы файлов содержимого
+CONTENT_VERSION = 1
+
+CACHE_MAGIC = b"VOIPCC"
+CACHE_FORMAT = 1
+HEADER = struct.Struct("<6sHI")
+
+
+def source_stamp(path):
+    """Отпечаток исходного файла: размер и время изменения (без чтения)"""
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def load_source(path):
+    """Чтение и проверка версии одного файла содержимого"""
+    with open(path, encoding="utf-8") as f:
+        document = json.load(f)
+    if document.get("version") != CONTENT_VERSION:
+        raise ValueError(f"{os.path.basename(path)}: неподдерживаемая версия содержимого "
+                         f"{document.get('version')!r}, ожидается {CONTENT_VERSION}")
+    return document["items"]
+
+
+def list_sources(content_dir):
+    """Файлы содержимого: имя раздела -> путь"""
+    sources = {}
+    for name in sorted(os.listdir(content_dir)):
+        if name.endswith(".json"):
+            sources[name[:-len(".json")]] = os.path.join(content_dir, name)
+    return sources
+
+
+def build_cache(content_dir=CONTENT_DIR, cache_path=None):
+    """Компиляция всех файлов содержимого в бинарный кэш"""
+    cache_path = cache_path or os.path.join(content_dir, CACHE_NAME)
+    sources = list_sources(content_dir)
+
+    blobs = []
+    sections = {}
+    offset = 0
+    for section, path in sources.items():
+        blob = marshal.dumps(load_source(path))
+        sections[section] = [offset, len(blob)]
+        blobs.append(blob)
+        offset += len(blob)
+
+    index = json.dumps({
+        "content_version": CONTENT_VERSION,
+        "python": list(sys.version_info[:2]),
+        "marshal": marshal.version,
+        "sources": {section: source_stamp(path) for section, path in sources.items()},
+        "sections": sections
+    }).encode("utf-8")
+
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(CACHE_MAGIC, CACHE_FORMAT, len(index)))
+        f.write(index)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, cache_path)
+    return cache_path
+
+
+class ContentStore:
+    """Доступ к разделам содержимого через mmap-кэш с откатом на JSON"""
+
+    def __init__(self, content_dir=CONTENT_DIR):
+        self.content_dir = content_dir
+        self.cache_path = os.path.join(content_dir, CACHE_NAME)
+        self.sections = {}
+        self.index = None
+        self.data_offset = 0
+        self.mapped = None
+        self.open_cache()
+
+    def open_cache(self):
+        """Открытие кэша, если он есть и соответствует исходникам"""
+        try:
+            with open(self.cache_path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return
+
+        index = None
+        try:
+            magic, cache_format, index_length = HEADER.unpack_from(mapped, 0)
+            if magic == CACHE_MAGIC and cache_format == CACHE_FORMAT:
+                index = json.loads(mapped[HEADER.size:HEADER.size + index_length])
+        except (struct.error, ValueError):
+            index = None
+        if index is None or not self.cache_is_fresh(index):
+            mapped.close()
+            return
+
+        self.mapped = mapped
+        self.index = index
+        self.data_offset = HEADER.size + index_length
+
+    def cache_is_fresh(self, index):
+        """Кэш собран этой версией Python и из тех же файлов содержимого"""
+        if (index.get("content_version") != CONTENT_VERSION
+                or index.get("python") != list(sys.version_info[:2])
+                or index.get("marshal") != marshal.version):
+            return False
+        try:
+            sources = list_sources(self.content_dir)
+            if set(sources) != set(index["sources"]):
+                return False
+            return all(source_stamp(path) == index["sources"][section]
+                       for section, path in sources.items())
+        except OSError:
+            return False
+
+    @property
+    def cached(self):
+        return self.mapped is not None
+
+    def get(self, section):
+        """Раздел содержимого (десериализуется один раз при первом запросе)"""
+        if section not in self.sections:
+            if self.mapped is not None:
+                offset, length = self.index["sections"][section]
+                start = self.data_offset + offset
+                self.sections[section] = marshal.loads(self.mapped[start:start + length])
+            else:
+                self.sections[section] = load_source(os.path.join(self.content_dir, section + ".json"))
+        return self.sections[section]
+
+    def close(self):
+        if self.mapped is not None:
+            self.mapped.close()
+            self.mapped = None
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] != ["build"]:
+        print("Использование: python content_store.py build [КАТАЛОГ]")
+        return 2
+    content_dir = argv[1] if len(argv) > 1 else CONTENT_DIR
+    cache_path = build_cache(content_dir)
+    print(f"Кэш содержимого собран: {cache_path} ({os.path.getsize(cache_path)} байт)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
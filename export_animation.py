@@ -0,0 +1,331 @@
+"""Экспорт анимаций угроз и защит без дисплея.
+
+Тот же таймлайн ThreatAnimator, что и в окне справочника, воспроизводится
+на OffscreenCanvas и рисуется средствами PIL поверх схемы voip_scheme.png
+(вписанной в канвас так же, как в приложении). Каждый кадр независимо
+строится перемоткой таймлайна на свое время, поэтому кадры рендерятся
+параллельно в нескольких процессах.
+
+Использование:
+    python export_animation.py --threat ddos ddos.gif
+    python export_animation.py --threat spoofing --protect-at 3 spoofing.png   # APNG
+    python export_animation.py --scenario scenarios/drill_basic.json frames/   # кадры PNG
+"""
+import argparse
+import math
+import multiprocessing
+import os
+import sys
+
+from PIL import Image, ImageDraw, ImageFont
+
+from content_store import ContentStore
+from VOIP_case2_krypto_cats import AssetManager, ThreatAnimator, ThreatTopology, load_scenario
+
+
+class OffscreenCanvas:
+    """Минимальная замена tk.Canvas для наложений: элементы рисуются в PIL"""
+
+    def __init__(self):
+        self.items = {}
+        self.next_id = 1
+
+    def create(self, kind, coords, tags=(), **options):
+        item = self.next_id
+        self.next_id += 1
+        if isinstance(tags, str):
+            tags = (tags,)
+        self.items[item] = {"kind": kind, "coords": [float(c) for c in coords],
+                            "options": options, "tags": set(tags)}
+        return item
+
+    def create_line(self, *coords, **options):
+        return self.create("line", coords, **options)
+
+    def create_oval(self, *coords, **options):
+        return self.create("oval", coords, **options)
+
+    def create_rectangle(self, *coords, **options):
+        return self.create("rectangle", coords, **options)
+
+    def create_text(self, *coords, **options):
+        return self.create("text", coords, **options)
+
+    def find(self, tag_or_id):
+        """Элементы по идентификатору или тегу (как в tk.Canvas)"""
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self.items else []
+        if tag_or_id == "all":
+            return list(self.items)
+        return [item for item, data in self.items.items() if tag_or_id in data["tags"]]
+
+    def itemconfig(self, tag_or_id, **options):
+        for item in self.find(tag_or_id):
+            self.items[item]["options"].update(options)
+
+    itemconfigure = itemconfig
+
+    def itemcget(self, item, option):
+        return self.items[item]["options"].get(option, "")
+
+    def coords(self, item, *coords):
+        if coords:
+            self.items[item]["coords"] = [float(c) for c in coords]
+        return list(self.items[item]["coords"]) if item in self.items else []
+
+    def delete(self, *tags):
+        for tag in tags:
+            for item in self.find(tag):
+                del self.items[item]
+
+    def move(self, tag_or_id, dx, dy):
+        for item in self.find(tag_or_id):
+            coords = self.items[item]["coords"]
+            coords[0::2] = [x + dx for x in coords[0::2]]
+            coords[1::2] = [y + dy for y in coords[1::2]]
+
+    def scale(self, tag_or_id, x0, y0, sx, sy):
+        for item in self.find(tag_or_id):
+            coords = self.items[item]["coords"]
+            coords[0::2] = [x0 + (x - x0) * sx for x in coords[0::2]]
+            coords[1::2] = [y0 + (y - y0) * sy for y in coords[1::2]]
+
+    def render(self, background):
+        """Кадр: все элементы в порядке создания поверх фона"""
+        frame = background.copy()
+        draw = ImageDraw.Draw(frame)
+        for data in self.items.values():
+            if data["options"].get("state") == "hidden":
+                continue
+            DRAWERS[data["kind"]](draw, data["coords"], data["options"])
+        return frame
+
+
+FONT_FILES = {False: "DejaVuSans.ttf", True: "DejaVuSans-Bold.ttf"}
+_fonts = {}
+
+
+def load_font(font):
+    """Шрифт PIL по описанию шрифта Tk ('Arial', 12, 'bold')"""
+    size = font[1] if font and len(font) > 1 else 10
+    bold = bool(font) and "bold" in font[2:]
+    key = (size, bold)
+    if key not in _fonts:
+        try:
+            # Размер шрифта Tk задан в пунктах, на экране 96 dpi это size * 4/3 пикселей
+            _fonts[key] = ImageFont.truetype(FONT_FILES[bold], round(size * 4 / 3))
+        except OSError:
+            _fonts[key] = ImageFont.load_default(round(size * 4 / 3))
+    return _fonts[key]
+
+
+def dashed(points, pattern, offset=0):
+    """Отрезки штриховой линии (pattern - длины штрихов и пропусков в пикселях)"""
+    period = sum(pattern)
+    phase = -offset % period
+    for (x0, y0), (x1, y1) in zip(points, points[1:]):
+        length = math.hypot(x1 - x0, y1 - y0)
+        position = -phase
+        index = 0
+        while position < length:
+            end = position + pattern[index % len(pattern)]
+            if index % 2 == 0 and end > 0:
+                a, b = max(position, 0) / length, min(end, length) / length
+                yield (x0 + (x1 - x0) * a, y0 + (y1 - y0) * a), (x0 + (x1 - x0) * b, y0 + (y1 - y0) * b)
+            position = end
+            index += 1
+        phase = (phase + length) % period
+
+
+def draw_outline(draw, points, options):
+    width = int(options.get("width", 1))
+    color = options.get("outline") or options.get("fill")
+    dash = options.get("dash")
+    if dash:
+        for start, end in dashed(points, dash, int(options.get("dashoffset", 0))):
+            draw.line([start, end], fill=color, width=width)
+    else:
+        draw.line(points, fill=color, width=width)
+
+
+def draw_line(draw, coords, options):
+    points = list(zip(coords[0::2], coords[1::2]))
+    draw_outline(draw, points, {**options, "outline": options.get("fill", "black")})
+    if options.get("arrow") == "last":
+        # Наконечник как у Tk: arrowshape = (до шейки, до крыльев, ширина крыла)
+        neck, tail, wing = options.get("arrowshape", (8, 10, 3))
+        (x0, y0), (x1, y1) = points[-2], points[-1]
+        length = math.hypot(x1 - x0, y1 - y0) or 1
+        ux, uy = (x1 - x0) / length, (y1 - y0) / length
+        wing += int(options.get("width", 1)) / 2
+        draw.polygon([(x1, y1),
+                      (x1 - ux * tail - uy * wing, y1 - uy * tail + ux * wing),
+                      (x1 - ux * neck, y1 - uy * neck),
+                      (x1 - ux * tail + uy * wing, y1 - uy * tail - ux * wing)],
+                     fill=options.get("fill", "black"))
+
+
+def draw_oval(draw, coords, options):
+    draw.ellipse(coords, fill=options.get("fill") or None, outline=options.get("outline") or None,
+                 width=int(options.get("width", 1)))
+
+
+def draw_rectangle(draw, coords, options):
+    if options.get("dash"):
+        x0, y0, x1, y1 = coords
+        if options.get("fill"):
+            draw.rectangle(coords, fill=options["fill"])
+        draw_outline(draw, [(x0, y0), (x1, y0), (x1, y1), (x0, y1), (x0, y0)], options)
+    else:
+        draw.rectangle(coords, fill=options.get("fill") or None, outline=options.get("outline") or None,
+                       width=int(options.get("width", 1)))
+
+
+_glyphs = {}
+
+
+def has_glyph(font, char):
+    """Есть ли символ в шрифте: отсутствующий рисуется так же, как символ вне Unicode"""
+    key = (id(font), char)
+    if key not in _glyphs:
+        if ord(char) < 0x2000 or char.isspace():
+            _glyphs[key] = True
+        else:
+            mask, missing = font.getmask(char), font.getmask("\U0010FFFD")
+            _glyphs[key] = mask.size != missing.size or bytes(mask) != bytes(missing)
+    return _glyphs[key]
+
+
+def renderable(text, font):
+    """Текст без символов, которых нет в шрифте (эмодзи в DejaVu рисуются пустыми квадратами)"""
+    lines = ("".join(char for char in line if has_glyph(font, char)).strip() for line in text.split("\n"))
+    return "\n".join(lines)
+
+
+def draw_text(draw, coords, options):
+    font = load_font(options.get("font"))
+    draw.multiline_text(coords[:2], renderable(options.get("text", ""), font),
+                        fill=options.get("fill", "black"), font=font, anchor="mm", align="center")
+
+
+DRAWERS = {"line": draw_line, "oval": draw_oval, "rectangle": draw_rectangle, "text": draw_text}
+
+
+def load_topology():
+    content = ContentStore()
+    return ThreatTopology(content.get("topology"), content.get("threat_map"))
+
+
+def compose_background(size):
+    """Схема, вписанная в канвас заданного размера, как в окне приложения.
+
+    Возвращает фон и вид схемы (x, y, масштаб) для размещения наложений.
+    """
+    canvas_width, canvas_height = size
+    asset = AssetManager().image("voip_scheme.png")
+    img_width, img_height = asset.size
+    scale = min(canvas_width / img_width, canvas_height / img_height, 1.0)
+    display_size = (int(img_width * scale), int(img_height * scale))
+    scheme = asset.get(display_size, Image.Resampling.LANCZOS).image
+
+    x = (canvas_width - display_size[0]) // 2
+    y = (canvas_height - display_size[1]) // 2
+    background = Image.new("RGB", size, "white")
+    background.paste(scheme.convert("RGB"), (x, y))
+    return background, (x, y, scale)
+
+
+_background = None
+_view = None
+_topology = None
+
+
+def init_worker(size):
+    global _background, _view, _topology
+    _background, _view = compose_background(size)
+    _topology = load_topology()
+
+
+def render_frame(job):
+    """Кадр на момент time: новый таймлайн, перемотанный на это время"""
+    events, time, flood_mode = job
+    canvas = OffscreenCanvas()
+    animator = ThreatAnimator(canvas, _topology)
+    animator.set_view(*_view)
+    animator.flood_mode = flood_mode
+    timeline = animator.timeline
+    for event in events:
+        timeline.call_later(event["at"], lambda event=event: animator.run_event(event, timeline))
+    timeline.seek(time)
+    return canvas.render(_background)
+
+
+def save_frames(frames, output, fps):
+    """GIF, APNG (.png/.apng) или каталог с пронумерованными кадрами"""
+    duration = round(1000 / fps)
+    extension = os.path.splitext(output)[1].lower()
+    if extension == ".gif":
+        frames[0].save(output, save_all=True, append_images=frames[1:], duration=duration, loop=0)
+    elif extension in (".png", ".apng"):
+        frames[0].save(output, format="PNG", save_all=True, append_images=frames[1:],
+                       duration=duration, loop=0)
+    else:
+        os.makedirs(output, exist_ok=True)
+        for index, frame in enumerate(frames):
+            frame.save(os.path.join(output, f"frame_{index:04d}.png"))
+
+
+def parse_size(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Экспорт анимаций справочника VoIP в GIF/APNG/кадры PNG")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--threat", choices=sorted(load_topology().threats), help="угроза (как кнопка в окне)")
+    source.add_argument("--scenario", metavar="PATH", help="сценарий учений")
+    parser.add_argument("output", help="файл .gif, .png/.apng или каталог для кадров PNG")
+    parser.add_argument("--protect-at", type=float, default=2.5,
+                        help="момент активации защиты для --threat, с (по умолчанию 2.5)")
+    parser.add_argument("--duration", type=float, help="длительность, с (по умолчанию - до конца анимации)")
+    parser.add_argument("--fps", type=float, default=15, help="кадров в секунду (по умолчанию 15)")
+    parser.add_argument("--size", type=parse_size, default=(1200, 600),
+                        help="размер канваса ШxВ (по умолчанию 1200x600)")
+    parser.add_argument("--packet-flood", action="store_true", help="DDoS в режиме потока пакетов")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="число процессов рендеринга")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.scenario:
+        try:
+            events = load_scenario(args.scenario, load_topology().threats)["events"]
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Ошибка: не удалось загрузить сценарий: {e}", file=sys.stderr)
+            return 2
+    else:
+        events = [{"at": 0, "action": "threat", "threat": args.threat},
+                  {"at": args.protect_at, "action": "protect", "threat": args.threat}]
+
+    # По умолчанию - до автоматической очистки после последнего события
+    duration = args.duration or (max((event["at"] for event in events), default=0) + 3.5)
+    frame_count = max(1, int(duration * args.fps))
+    jobs = [(events, index / args.fps, args.packet_flood) for index in range(frame_count)]
+
+    if args.workers and args.workers > 1:
+        with multiprocessing.Pool(args.workers, initializer=init_worker, initargs=(args.size,)) as pool:
+            frames = pool.map(render_frame, jobs, chunksize=max(1, frame_count // (args.workers * 4)))
+    else:
+        init_worker(args.size)
+        frames = [render_frame(job) for job in jobs]
+
+    save_frames(frames, args.output, args.fps)
+    print(f"Экспортировано кадров: {frame_count} -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+"""Перемотка таймлайна: шаги и наложения не размножаются"""
+from export_animation import OffscreenCanvas, load_topology
+from VOIP_case2_krypto_cats import ThreatAnimator, Timeline
+
+
+def test_nested_step_fires_once_per_replay():
+    timeline = Timeline()
+    fired = []
+    timeline.call_later(1.0, lambda: timeline.call_later(1.0, lambda: fired.append(timeline.now)))
+
+    for position, expected in ((3.0, 1), (0.0, 1), (3.0, 2), (0.5, 2), (3.0, 3)):
+        timeline.seek(position)
+        assert len(fired) == expected
+    assert fired == [2.0, 2.0, 2.0]
+    assert len(timeline.roots) == 1
+
+
+def test_rewind_rebuilds_overlays():
+    canvas = OffscreenCanvas()
+    animator = ThreatAnimator(canvas, load_topology())
+    animator.set_view(0, 0, 1.0)
+    timeline = animator.timeline
+    timeline.call_later(0.0, lambda: animator.run_event({"action": "threat", "threat": "ddos"}, timeline))
+    timeline.call_later(1.5, lambda: animator.run_event({"action": "protect", "threat": "ddos"}, timeline))
+
+    timeline.seek(2.0)
+    items = len(canvas.items)
+    overlays = len(animator.registry)
+    for position in (0.0, 2.0, 0.5, 2.0):
+        timeline.seek(position)
+    assert len(canvas.items) == items
+    assert len(animator.registry) == overlays